@@ -0,0 +1,102 @@
+"""Measure per-request middleware cost on GET /health.
+
+Usage (from backend/):
+    python benchmarks/middleware_overhead.py [--requests 5000]
+
+Requests are driven straight through the ASGI interface (no sockets or HTTP client) so the
+numbers isolate the application: "bare" is the router with no middleware, "full stack" is
+`create_app()`, and "+BaseHTTPMiddleware" wraps the bare app in one no-op
+`BaseHTTPMiddleware` for comparison with what SlowAPIMiddleware used to cost.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fastapi import FastAPI  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from api.routes import register_routes  # noqa: E402
+from app.main import create_app  # noqa: E402
+
+_SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/health",
+    "raw_path": b"/health",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"localhost"), (b"accept-encoding", b"gzip")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("localhost", 8000),
+}
+
+
+def _receiver():
+    """Deliver an empty body once, then block like a server whose client stays connected."""
+    delivered = False
+
+    async def receive():
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    return receive
+
+
+async def _send(message) -> None:
+    if message["type"] == "http.response.start" and message["status"] != 200:
+        raise RuntimeError(f"unexpected status {message['status']}")
+
+
+async def _drive(app, requests: int) -> float:
+    for _ in range(200):  # warm-up
+        await app(dict(_SCOPE), _receiver(), _send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(_SCOPE), _receiver(), _send)
+    return time.perf_counter() - started
+
+
+def _bare() -> FastAPI:
+    application = FastAPI()
+    register_routes(application)
+    return application
+
+
+async def _passthrough(request, call_next):
+    return await call_next(request)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)  # the access log would dominate the measurement
+
+    with_base_http = _bare()
+    with_base_http.add_middleware(BaseHTTPMiddleware, dispatch=_passthrough)
+    apps = {"bare": _bare(), "full stack": create_app(), "+BaseHTTPMiddleware": with_base_http}
+
+    baseline = None
+    print(f"{'app':<20} {'req/s':>9} {'µs/req':>8} {'overhead µs':>12}")
+    for name, app in apps.items():
+        elapsed = asyncio.run(_drive(app, args.requests))
+        per_request = elapsed / args.requests * 1e6
+        baseline = per_request if baseline is None else baseline
+        print(f"{name:<20} {args.requests / elapsed:>9.0f} {per_request:>8.1f} {per_request - baseline:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
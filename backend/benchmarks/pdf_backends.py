@@ -0,0 +1,70 @@
+"""Compare throughput and text fidelity of the installed PDF backends.
+
+Usage (from backend/):
+    python benchmarks/pdf_backends.py [cv.pdf ...] [--repeat 5]
+
+Defaults to the PDFs under tests/fixtures/documents. When `<name>.txt` sits next to a PDF it
+is the reference text; otherwise the pypdf output is. Fidelity is the word-sequence
+similarity (difflib ratio) with the reference.
+"""
+from __future__ import annotations
+
+import argparse
+import difflib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from services.pdf_backends import available_backends, select_backend  # noqa: E402
+
+_DEFAULT_CORPUS = sorted((Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "documents").glob("*.pdf"))
+
+
+def _fidelity(text: str, reference: str) -> float:
+    return difflib.SequenceMatcher(a=reference.split(), b=text.split(), autojunk=False).ratio()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", type=Path, default=_DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-pages", type=int, default=20)
+    args = parser.parse_args()
+
+    documents = [(path, path.read_bytes()) for path in args.pdfs]
+    references = {}
+    for path, data in documents:
+        sidecar = path.with_suffix(".txt")
+        references[path] = (
+            sidecar.read_text(encoding="utf-8")
+            if sidecar.exists()
+            else select_backend("pypdf").extract(io.BytesIO(data), max_pages=args.max_pages).text
+        )
+
+    print(f"{len(documents)} document(s); backends installed: {', '.join(available_backends())}")
+    print(f"{'backend':<10} {'pages/s':>9} {'ms/doc':>9} {'fidelity':>9}")
+    for name in available_backends():
+        backend = select_backend(name)
+        pages = 0
+        elapsed = 0.0
+        fidelity = []
+        for path, data in documents:
+            best = float("inf")
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                result = backend.extract(io.BytesIO(data), max_pages=args.max_pages)
+                best = min(best, time.perf_counter() - started)
+            pages += result.pages
+            elapsed += best
+            fidelity.append(_fidelity(result.text, references[path]))
+        print(
+            f"{name:<10} {pages / elapsed:>9.1f} {elapsed / len(documents) * 1000:>9.2f}"
+            f" {sum(fidelity) / len(fidelity):>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
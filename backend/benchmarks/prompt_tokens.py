@@ -0,0 +1,83 @@
+"""Report extraction prompt tokens before/after content minimization.
+
+Usage (from backend/):
+    python benchmarks/prompt_tokens.py [page.html ...]
+
+Defaults to the recorded scraper fixtures. "before" reproduces the original prompt (full
+`asdict(job)` including raw HTML, a 2 000-char shortened HTML snippet and the
+PydanticOutputParser format instructions); "after" is the current `ExtractionAgent` prompt.
+Token counts use the same chars/4 estimate for both.
+"""
+from __future__ import annotations
+
+import sys
+from dataclasses import asdict, replace
+from pathlib import Path
+from textwrap import shorten
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from langchain_core.output_parsers import PydanticOutputParser  # noqa: E402
+from langchain_core.prompts import ChatPromptTemplate  # noqa: E402
+from langchain_core.runnables import RunnableLambda  # noqa: E402
+
+from agents import ExtractionAgent  # noqa: E402
+from agents.extraction_agent import _StructuredJobPayload  # noqa: E402
+from services.content_minimizer import estimate_tokens, minimize_html  # noqa: E402
+from services.scraper import ScrapedJob  # noqa: E402
+
+_DEFAULT_PAGES = sorted((Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "scraper").glob("*.html"))
+
+
+_LEGACY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "You are an expert technical recruiter. Transform scraped job postings into a structured, "
+            "clean summary with consistent casing and deduplicated skills. Only use the provided "
+            "content; never invent employers or titles. Return JSON that matches the provided format instructions.",
+        ),
+        (
+            "human",
+            "Job data: {job_data}\n\nHTML snippet:\n{job_html_preview}\n\n"
+            "You must respond with JSON using the following schema instructions:\n{format_instructions}\n"
+            "Generate up to {highlight_count} concise highlights describing the opportunity.",
+        ),
+    ]
+)
+
+
+def _legacy_tokens(job: ScrapedJob) -> int:
+    legacy_job = asdict(replace(job, html_ref=None))
+    legacy_job["raw_html"] = job.html()
+    prompt = _LEGACY_PROMPT.format(
+        job_data=legacy_job,
+        job_html_preview=shorten(job.html(), width=2000, placeholder=" …"),
+        format_instructions=PydanticOutputParser(pydantic_object=_StructuredJobPayload).get_format_instructions(),
+        highlight_count=3,
+    )
+    return estimate_tokens(prompt)
+
+
+def main(paths: list[Path]) -> None:
+    agent = ExtractionAgent(llm=RunnableLambda(lambda _: "{}"))
+    print(f"{'page':40} {'before':>8} {'after':>8} {'saved':>7}")
+    for path in paths:
+        html = path.read_text(encoding="utf-8")
+        description = minimize_html(html, limit=20000)
+        job = ScrapedJob(
+            url="https://example.com/jobs/1",
+            board="generic",
+            title=path.stem,
+            company="Example",
+            description=description,
+            skills=[],
+            raw_html=html,
+        )
+        before = _legacy_tokens(job)
+        after = agent.prompt_tokens(job)
+        print(f"{path.name:40} {before:8d} {after:8d} {1 - after / before:7.1%}")
+
+
+if __name__ == "__main__":
+    main([Path(arg) for arg in sys.argv[1:]] or _DEFAULT_PAGES)
@@ -0,0 +1,64 @@
+"""Time `rank_jobs` over synthetic job corpora of increasing size.
+
+Usage (from backend/):
+    python benchmarks/ranking.py [--jobs 100 300 1000] [--repeat 5]
+
+Jobs are drawn from the bundled skill taxonomy plus filler prose, so vocabulary size and
+skill overlap resemble real saved-vacancy lists. Reports the best wall time per corpus size.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.ranking import RankableJob, rank_jobs  # noqa: E402
+from core.skills import SkillMatcher  # noqa: E402
+
+_FILLER = (
+    "design operate scale reliable customer platform team ownership roadmap mentor review deliver "
+    "stakeholders quality performance production incidents documentation collaborate remote growth"
+).split()
+
+
+def _corpus(size: int, skills: list[str], rng: random.Random) -> list[RankableJob]:
+    jobs = []
+    for index in range(size):
+        job_skills = rng.sample(skills, 6)
+        words = rng.choices(_FILLER, k=250) + job_skills
+        rng.shuffle(words)
+        jobs.append(RankableJob(title=f"Engineer {index}", description=" ".join(words), skills=job_skills))
+    return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    matcher = SkillMatcher.from_file()
+    skills = sorted({matcher.canonical(name) for name in ("Python", "Go", "AWS", "Docker", "Kafka", "React", "SQL",
+                     "Terraform", "Kubernetes", "TypeScript", "Java", "Airflow", "Figma", "PostgreSQL")})
+    rng = random.Random(7)
+    cv_text = "Engineer working with " + ", ".join(rng.sample(skills, 5)) + ". " + " ".join(rng.choices(_FILLER, k=300))
+
+    print(f"{'jobs':>6} {'best ms':>9}")
+    for size in args.jobs:
+        jobs = _corpus(size, skills, rng)
+        best = min(_timed(cv_text, jobs) for _ in range(args.repeat))
+        print(f"{size:>6} {best * 1000:>9.2f}")
+
+
+def _timed(cv_text: str, jobs: list[RankableJob]) -> float:
+    started = time.perf_counter()
+    rank_jobs(cv_text, jobs)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Micro-benchmark of /generate-materials response serialization and compression.
+
+Usage (from backend/):
+    python benchmarks/serialization.py [--kb 30] [--repeat 2000]
+
+"legacy" is what FastAPI did before: validate the returned model against `response_model`,
+run it through `jsonable_encoder` and `json.dumps`. "dump_json" is pydantic-core's own JSON
+encoder; "model_response" is the path the routes now take (one dump, rendered by orjson).
+The compression table shows wire sizes of the payload with gzip and, when installed, brotli.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from api.responses import model_response  # noqa: E402
+from api.routes.generation import GeneratedAssetsResponse  # noqa: E402
+
+try:
+    import brotli  # type: ignore
+except Exception:  # pragma: no cover - optional
+    brotli = None
+
+
+def _payload(kilobytes: int) -> GeneratedAssetsResponse:
+    lines = [
+        f"- Project {index}: shipped {index * 7 % 13 + 2} services in **Python**, p95 down {index * 11 % 60}%."
+        for index in range(kilobytes * 1024 // 4 // 70)
+    ]
+    quarter = "## Experience\n" + "\n".join(lines)
+    return GeneratedAssetsResponse(
+        jobId="job-123",
+        cv=quarter,
+        coverLetter=quarter,
+        networking=quarter,
+        insights=quarter,
+        matchScore=87,
+        generatedAt=datetime.now(timezone.utc),
+    )
+
+
+def _time(label: str, repeat: int, render) -> None:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = render()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{label:<16} {elapsed * 1e6:>9.1f} µs  {len(body):>7} bytes")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kb", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    model = _payload(args.kb)
+    field = create_response_field(name="response", type_=GeneratedAssetsResponse)
+    loop = asyncio.new_event_loop()
+
+    def legacy() -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=model, is_coroutine=True)
+        )
+        return JSONResponse(content).body
+
+    print(f"{'path':<16} {'per call':>12}  {'size':>13}")
+    _time("legacy", args.repeat, legacy)
+    _time("dump_json", args.repeat, lambda: model.model_dump_json(by_alias=True).encode())
+    _time("model_response", args.repeat, lambda: model_response(model).body)
+
+    body = model_response(model).body
+    print(f"\nidentity {len(body):>7} bytes")
+    print(f"gzip -6  {len(gzip.compress(body, 6)):>7} bytes")
+    if brotli is not None:
+        print(f"br q4    {len(brotli.compress(body, quality=4)):>7} bytes")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 
 from .extraction_agent import ExtractionAgent, ExtractionAgentError, ExtractionAgentResult
 from .generation_agent import GeneratedBundle, GenerationAgent
+from .model_router import ModelRouter, ProviderCircuits, RoutingPolicy
+from .providers import HttpChatModel, ModelSpec, build_chat_model
 
 __all__ = [
     "ExtractionAgent",
@@ -9,4 +11,10 @@ __all__ = [
     "ExtractionAgentResult",
     "GeneratedBundle",
     "GenerationAgent",
+    "HttpChatModel",
+    "ModelRouter",
+    "ModelSpec",
+    "ProviderCircuits",
+    "RoutingPolicy",
+    "build_chat_model",
 ]
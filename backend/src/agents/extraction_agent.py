@@ -1,27 +1,42 @@
 """LLM-powered extraction agent that normalizes scraped job content."""
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from textwrap import shorten
-from typing import Iterable
+import asyncio
+import json
+from dataclasses import dataclass, fields, replace
+from typing import Any, Iterable, Literal
 
 import structlog
-from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableSerializable
 from pydantic import BaseModel, Field
+from pydantic import ValidationError as SchemaValidationError
 
+from core.confidence import score_scraped_job
+from core.config import get_settings
+from core.json_repair import JsonRepairError, repair_json
+from core.llm_usage import usage_config
+from core.metrics import metrics
+from core.resilience import CircuitOpenError
+from core.skills import canonicalize_skills
 from core.validators import JobValidator, ValidationError
-from services.scraper import ScrapedJob
-
-try:  # pragma: no cover - optional dependency wiring
-    from langchain_google_genai import ChatGoogleGenerativeAI  # type: ignore
-except Exception:  # pragma: no cover - module might be unavailable in tests
-    ChatGoogleGenerativeAI = None  # type: ignore[misc]
+from services.content_minimizer import estimate_tokens, minimize_html, novel_text
+from services.scraper import PREVIEW_CHARS, ScrapedJob
 
+from .model_router import ModelRouter
+from .providers import ProviderUnavailableError, build_chat_model
 
 LOGGER = structlog.get_logger(__name__)
 
+# Markup and derived ScrapedJob fields that are never serialized into the prompt.
+_PROMPT_EXCLUDED_FIELDS = frozenset({"raw_html", "preview", "html_ref"})
+
+# Schema.org postings shorter than this are still sent through the LLM for clean-up.
+_STRUCTURED_MIN_WORDS = 40
+
+LLMMode = Literal["auto", "always", "never"]
+
 
 @dataclass(slots=True)
 class ExtractionAgentResult:
@@ -29,16 +44,45 @@ class ExtractionAgentResult:
 
     job: ScrapedJob
     highlights: list[str]
+    llm_used: bool = True
+    confidence: float | None = None
+    degraded: bool = False  # LLM normalization was wanted but its provider was unavailable
 
 
 class _StructuredJobPayload(BaseModel):
-    title: str = Field(..., description="Canonical job title")
-    company: str = Field(..., description="Canonical employer name")
-    description: str = Field(..., description="Concise but detailed responsibilities and requirements")
+    # Empty values fall back to the scraped fields in `_merge_payload`, so a repaired,
+    # truncated response missing trailing fields is still usable.
+    title: str = Field("", description="Canonical job title")
+    company: str = Field("", description="Canonical employer name")
+    description: str = Field("", description="Concise but detailed responsibilities and requirements")
     skills: list[str] = Field(default_factory=list, description="Sorted, deduplicated skills")
     highlights: list[str] = Field(default_factory=list, description="Key bullet points extracted from the posting")
 
 
+_JSON_TYPES = {"string": "string", "array": "array", "integer": "integer", "number": "number", "boolean": "boolean"}
+
+
+def _response_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Translate a flat Pydantic model into the schema subset Gemini's JSON mode accepts."""
+    properties: dict[str, Any] = {}
+    for name, spec in model.model_json_schema()["properties"].items():
+        prop: dict[str, Any] = {"type": _JSON_TYPES[spec["type"]], "description": spec.get("description", "")}
+        if spec["type"] == "array":
+            prop["items"] = {"type": _JSON_TYPES[spec["items"]["type"]]}
+        properties[name] = prop
+    return {"type": "object", "properties": properties, "required": ["title", "company", "description"]}
+
+
+def _schema_hint(model: type[BaseModel]) -> str:
+    """One-line JSON shape used in the prompt instead of verbose format instructions."""
+    shapes = {"string": "string", "array": "[string]"}
+    members = ", ".join(
+        f'"{name}": {shapes.get(spec["type"], spec["type"])}'
+        for name, spec in model.model_json_schema()["properties"].items()
+    )
+    return "{" + members + "}"
+
+
 class ExtractionAgentError(RuntimeError):
     """Raised when the extraction agent cannot produce a structured job."""
 
@@ -51,32 +95,105 @@ class ExtractionAgent:
         *,
         llm: RunnableSerializable | None = None,
         validator: JobValidator | None = None,
-        model: str = "gemini-2.5-flash",
+        router: ModelRouter | None = None,
         temperature: float = 0.2,
         highlight_count: int = 3,
+        structured_fast_path: bool = True,
+        confidence_threshold: float = 0.85,
     ) -> None:
         self._validator = validator or JobValidator()
         self._highlight_count = highlight_count
-        self._parser = PydanticOutputParser(pydantic_object=_StructuredJobPayload)
+        self._structured_fast_path = structured_fast_path
+        self._confidence_threshold = confidence_threshold
+        self._schema_hint = _schema_hint(_StructuredJobPayload)
         self._prompt = self._build_prompt()
-        self._llm = llm or self._build_default_llm(model=model, temperature=temperature)
-        self._chain = self._prompt | self._llm | self._parser
+        self.router: ModelRouter | None = None
+        if llm is None:
+            self.router = router or ModelRouter.from_settings(
+                get_settings(),
+                chains=["extraction"],
+                factory=lambda model: self._build_default_llm(model=model, temperature=temperature),
+            )
+            llm = self.router.runnable("extraction")
+        self._chain = self._prompt | llm | StrOutputParser()
+
+    async def run(self, scraped_job: ScrapedJob, *, llm_mode: LLMMode = "auto") -> ExtractionAgentResult:
+        """Normalize a scraped job and return merged results.
 
-    async def run(self, scraped_job: ScrapedJob) -> ExtractionAgentResult:
-        """Normalize a scraped job using the LLM and return merged results."""
+        In `auto` mode the LLM only runs when the validated scrape is neither trusted
+        structured data nor above the confidence threshold; `always`/`never` override that.
+        """
 
         LOGGER.debug("extraction_agent.run.start", board=scraped_job.board, url=scraped_job.url)
         validated = self._validated(scraped_job)
-        prompt_input = self._prompt_input(validated)
+        confidence = score_scraped_job(validated).score
+        skip_reason = self._skip_reason(validated, confidence, llm_mode)
+        if skip_reason:
+            metrics.increment("extraction.llm_skipped")
+            metrics.increment(f"extraction.llm_skipped.{skip_reason}")
+            LOGGER.debug(
+                "extraction_agent.run.llm_skipped",
+                board=validated.board,
+                url=validated.url,
+                reason=skip_reason,
+                confidence=confidence,
+            )
+            return ExtractionAgentResult(job=validated, highlights=[], llm_used=False, confidence=confidence)
+
+        if self.router is not None and not self.router.available("extraction"):
+            return self._degraded(validated, confidence)
+
+        metrics.increment("extraction.llm_invoked")
+        # Only the LLM path needs the page's main text; the full parse stays off the event loop.
+        page_excerpt = await asyncio.to_thread(self._page_excerpt, validated)
+        prompt_input = self._prompt_input(validated, page_excerpt)
         try:
-            structured: _StructuredJobPayload = await self._chain.ainvoke(prompt_input)
+            raw_output: str = await self._chain.ainvoke(prompt_input, config=usage_config("extraction"))
+        except CircuitOpenError:
+            return self._degraded(validated, confidence)
         except Exception as exc:  # pragma: no cover - langchain surfaces various runtime errors
             raise ExtractionAgentError("LLM extraction failed") from exc
+        structured = self._parse_payload(raw_output)
 
         merged_job = self._merge_payload(validated, structured)
         final_job = self._validated(merged_job)
         LOGGER.debug("extraction_agent.run.success", board=final_job.board, url=final_job.url)
-        return ExtractionAgentResult(job=final_job, highlights=structured.highlights)
+        return ExtractionAgentResult(job=final_job, highlights=structured.highlights, confidence=confidence)
+
+    @staticmethod
+    def _degraded(job: ScrapedJob, confidence: float) -> ExtractionAgentResult:
+        """Serve the validated scrape as-is while the LLM provider's circuit is open."""
+        metrics.increment("extraction.llm_skipped")
+        metrics.increment("extraction.llm_skipped.llm_unavailable")
+        LOGGER.warning("extraction_agent.run.degraded", board=job.board, url=job.url)
+        return ExtractionAgentResult(job=job, highlights=[], llm_used=False, confidence=confidence, degraded=True)
+
+    def _skip_reason(self, job: ScrapedJob, confidence: float, llm_mode: LLMMode) -> str | None:
+        if llm_mode == "always":
+            return None
+        if llm_mode == "never":
+            return "override"
+        if self._structured_fast_path and self._is_trusted_structured(job):
+            return "structured"
+        if confidence >= self._confidence_threshold:
+            return "confidence"
+        return None
+
+    @staticmethod
+    def _parse_payload(raw_output: str) -> _StructuredJobPayload:
+        """Validate the model's JSON, repairing fences/truncation locally instead of re-asking the LLM."""
+        try:
+            data = json.loads(raw_output)
+        except ValueError:
+            try:
+                data = repair_json(raw_output)
+            except JsonRepairError as exc:
+                raise ExtractionAgentError("LLM returned malformed JSON") from exc
+            metrics.increment("extraction.json_repaired")
+        try:
+            return _StructuredJobPayload.model_validate(data)
+        except SchemaValidationError as exc:
+            raise ExtractionAgentError("LLM output does not match the job schema") from exc
 
     def _validated(self, job: ScrapedJob) -> ScrapedJob:
         try:
@@ -86,25 +203,30 @@ class ExtractionAgent:
             error_details = "\n".join(f"  - {issue.field}: {issue.message}" for issue in exc.issues)
             raise ExtractionAgentError(f"Validation failed for scraped job:\n{error_details}") from exc
 
+    @staticmethod
+    def _is_trusted_structured(job: ScrapedJob) -> bool:
+        """Schema.org `JobPosting` data that already validates needs no LLM normalization."""
+        return job.source == "json_ld" and len(job.description.split()) >= _STRUCTURED_MIN_WORDS
+
     def _merge_payload(self, original: ScrapedJob, structured: _StructuredJobPayload) -> ScrapedJob:
         skills = structured.skills or original.skills
         deduped_skills = self._dedupe(skills)
-        return ScrapedJob(
-            url=original.url,
-            board=original.board,
+        return replace(
+            original,
             title=structured.title or original.title,
             company=structured.company or original.company,
             description=structured.description or original.description,
             skills=deduped_skills,
-            raw_html=original.raw_html,
         )
 
-    def _prompt_input(self, job: ScrapedJob) -> dict[str, object]:
-        job_dict = asdict(job)
+    def _prompt_input(self, job: ScrapedJob, page_excerpt: str) -> dict[str, object]:
+        job_dict = {
+            item.name: getattr(job, item.name) for item in fields(job) if item.name not in _PROMPT_EXCLUDED_FIELDS
+        }
         return {
             "job_data": job_dict,
-            "job_html_preview": self._html_preview(job.raw_html),
-            "format_instructions": self._parser.get_format_instructions(),
+            "page_excerpt": page_excerpt,
+            "schema_hint": self._schema_hint,
             "highlight_count": self._highlight_count,
         }
 
@@ -115,49 +237,47 @@ class ExtractionAgent:
                     "system",
                     "You are an expert technical recruiter. Transform scraped job postings into a structured, "
                     "clean summary with consistent casing and deduplicated skills. Only use the provided "
-                    "content; never invent employers or titles. Return JSON that matches the provided format instructions.",
+                    "content; never invent employers or titles. Respond with a single JSON object only.",
                 ),
                 (
                     "human",
-                    "Job data: {job_data}\n\nHTML snippet:\n{job_html_preview}\n\n"
-                    "You must respond with JSON using the following schema instructions:\n{format_instructions}\n"
+                    "Job data: {job_data}\n\nAdditional page text:\n{page_excerpt}\n\n"
+                    "JSON shape: {schema_hint}\n"
                     "Generate up to {highlight_count} concise highlights describing the opportunity.",
                 ),
             ]
         )
 
     def _build_default_llm(self, *, model: str, temperature: float) -> RunnableSerializable:
-        if ChatGoogleGenerativeAI is None:
-            raise ExtractionAgentError(
-                "ChatGoogleGenerativeAI is unavailable. Provide an LLM instance when instantiating ExtractionAgent."
+        try:
+            return build_chat_model(
+                model,
+                settings=get_settings(),
+                temperature=temperature,
+                json_schema=_response_schema(_StructuredJobPayload),
+                gemini_options={"convert_system_message_to_human": True},
             )
-        from core.config import get_settings
-        settings = get_settings()
-        return ChatGoogleGenerativeAI(
-            model=model, 
-            temperature=temperature, 
-            convert_system_message_to_human=True,
-            google_api_key=settings.google_api_key
-        )
+        except ProviderUnavailableError as exc:
+            raise ExtractionAgentError(f"{exc} Provide an LLM instance when instantiating ExtractionAgent.") from exc
+
+    def prompt_tokens(self, job: ScrapedJob) -> int:
+        """Estimate the input tokens the extraction prompt costs for `job`."""
+        return estimate_tokens(self._prompt.format(**self._prompt_input(job, self._page_excerpt(job))))
 
     @staticmethod
-    def _html_preview(html: str, limit: int = 2000) -> str:
-        return shorten(html, width=limit, placeholder=" …") if html else ""
+    def _page_excerpt(job: ScrapedJob) -> str:
+        """Main readable page text, omitted when it only repeats the parsed description.
+
+        Parses the whole page, so callers on the event loop run it in a worker thread.
+        Falls back to the scraper's bounded preview when the page was not retained.
+        """
+        html = job.html()
+        excerpt = minimize_html(html, limit=PREVIEW_CHARS) if html else job.preview
+        return novel_text(excerpt, job.description)
 
     @staticmethod
     def _dedupe(values: Iterable[str]) -> list[str]:
-        seen: set[str] = set()
-        unique: list[str] = []
-        for value in values:
-            normalized = value.strip()
-            if not normalized:
-                continue
-            key = normalized.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            unique.append(normalized)
-        return unique
+        return canonicalize_skills(values)
 
 
 __all__ = ["ExtractionAgent", "ExtractionAgentError", "ExtractionAgentResult"]
@@ -3,15 +3,20 @@ from __future__ import annotations
 
 import asyncio
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
 import structlog
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableSerializable
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
+from core.config import get_settings
+from core.llm_usage import usage_config
+from core.logging import lazy
+from core.metrics import metrics
+from core.resilience import CircuitOpenError
 from core.scoring import calculate_heuristic_score
 from prompts import (
     COVER_LETTER_PROMPT,
@@ -20,17 +25,31 @@ from prompts import (
     NETWORKING_PROMPT,
 )
 
-try:
-    from langchain_google_genai import ChatGoogleGenerativeAI
-except ImportError:
-    ChatGoogleGenerativeAI = None  # type: ignore
+from .model_router import ModelRouter
+from .providers import build_chat_model
 
 LOGGER = structlog.get_logger(__name__)
 
+# Chain name -> prompt, in the order results are unpacked in `generate_all`.
+_CHAIN_PROMPTS = {
+    "cv": CV_GENERATION_PROMPT,
+    "cover_letter": COVER_LETTER_PROMPT,
+    "networking": NETWORKING_PROMPT,
+    "insights": INSIGHTS_PROMPT,
+}
+
+
+def _preview(text: str | None, size: int = 50) -> str:
+    return text[:size] if text else "empty"
+
 
 @dataclass(slots=True)
 class GeneratedBundle:
-    """Container for all generated assets."""
+    """Container for all generated assets.
+
+    Chains whose LLM provider is unavailable (circuit open) are listed in `unavailable`
+    and their text is left empty.
+    """
 
     cv: str
     cover_letter: str
@@ -38,6 +57,7 @@ class GeneratedBundle:
     insights: str
     match_score: int
     generated_at: datetime
+    unavailable: list[str] = field(default_factory=list)
 
 
 class GenerationAgent:
@@ -47,11 +67,25 @@ class GenerationAgent:
         self,
         *,
         llm: RunnableSerializable | None = None,
-        model: str = "gemini-2.5-flash",
+        router: ModelRouter | None = None,
         temperature: float = 0.4,
     ) -> None:
-        self._llm = llm or self._build_default_llm(model=model, temperature=temperature)
+        """Run every chain on `llm` when given; otherwise let `router` pick each chain's model.
+
+        The default router follows the `llm_model_<chain>` settings.
+        """
+        self.router: ModelRouter | None = None
+        if llm is None:
+            self.router = router or ModelRouter.from_settings(
+                get_settings(),
+                chains=_CHAIN_PROMPTS,
+                factory=lambda model: self._build_default_llm(model=model, temperature=temperature),
+            )
         self._str_parser = StrOutputParser()
+        self._chains = {
+            name: prompt | (llm if self.router is None else self.router.runnable(name)) | self._str_parser
+            for name, prompt in _CHAIN_PROMPTS.items()
+        }
 
     async def generate_all(
         self, 
@@ -80,30 +114,25 @@ class GenerationAgent:
             "variance_level": variance,
         }
 
-        # Define runnables
-        cv_chain = CV_GENERATION_PROMPT | self._llm | self._str_parser
-        cl_chain = COVER_LETTER_PROMPT | self._llm | self._str_parser
-        net_chain = NETWORKING_PROMPT | self._llm | self._str_parser
-        insights_chain = INSIGHTS_PROMPT | self._llm | self._str_parser
-
         # Execute in parallel
         # We use return_exceptions=False to fail fast if one fails, or handle individually?
         # For now, let's fail if any fails.
         results = await asyncio.gather(
-            self._run_with_retry(cv_chain, inputs),
-            self._run_with_retry(cl_chain, inputs),
-            self._run_with_retry(net_chain, inputs),
-            self._run_with_retry(insights_chain, inputs),
+            *(self._run_chain(name, chain, inputs) for name, chain in self._chains.items())
         )
+        unavailable = [name for name, result in zip(self._chains, results, strict=True) if result is None]
+        if unavailable:
+            metrics.increment("generation.degraded")
+            LOGGER.warning("generation_agent.degraded", unavailable=unavailable)
 
-        cv_result, cl_result, net_result, insights_text = results
+        cv_result, cl_result, net_result, insights_text = (result or "" for result in results)
         
         # Debug logging to ensure correct assignment
-        LOGGER.debug("generation_agent.results", 
-                    cv_start=cv_result[:50] if cv_result else "empty",
-                    cl_start=cl_result[:50] if cl_result else "empty",
-                    net_start=net_result[:50] if net_result else "empty",
-                    insights_start=insights_text[:50] if insights_text else "empty")
+        LOGGER.debug("generation_agent.results",
+                    cv_start=lazy(_preview, cv_result),
+                    cl_start=lazy(_preview, cl_result),
+                    net_start=lazy(_preview, net_result),
+                    insights_start=lazy(_preview, insights_text))
 
         # Extract score from insights text
         llm_score = self._extract_score_from_insights(insights_text)
@@ -124,11 +153,25 @@ class GenerationAgent:
             insights=insights_text,  # Now storing formatted text instead of JSON
             match_score=llm_score,
             generated_at=datetime.now(timezone.utc),
+            unavailable=unavailable,
         )
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def _run_with_retry(self, chain: RunnableSerializable, inputs: dict[str, Any]) -> Any:
-        return await chain.ainvoke(inputs)
+    async def _run_chain(self, name: str, chain: RunnableSerializable, inputs: dict[str, Any]) -> str | None:
+        """Run one chain, or return `None` straight away when its provider's circuit is open."""
+        try:
+            return await self._run_with_retry(name, chain, inputs)
+        except CircuitOpenError:
+            return None
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        # tenacity catches BaseException: without excluding cancellation, a cancelled
+        # generation (client gone) would keep retrying its chains.
+        retry=retry_if_not_exception_type((CircuitOpenError, asyncio.CancelledError)),
+    )
+    async def _run_with_retry(self, name: str, chain: RunnableSerializable, inputs: dict[str, Any]) -> Any:
+        return await chain.ainvoke(inputs, config=usage_config(name))
 
     def _extract_score_from_insights(self, insights_text: str) -> int:
         """Extract compatibility score from formatted insights text."""
@@ -173,14 +216,4 @@ class GenerationAgent:
         return "en"
     
     def _build_default_llm(self, *, model: str, temperature: float) -> RunnableSerializable:
-        if ChatGoogleGenerativeAI is None:
-            raise RuntimeError(
-                "ChatGoogleGenerativeAI is unavailable. Install langchain-google-genai."
-            )
-        from core.config import get_settings
-        settings = get_settings()
-        return ChatGoogleGenerativeAI(
-            model=model, 
-            temperature=temperature,
-            google_api_key=settings.google_api_key
-        )
+        return build_chat_model(model, settings=get_settings(), temperature=temperature)
@@ -0,0 +1,297 @@
+"""Per-chain model selection with fallback away from slow, failing or unreachable models."""
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping
+
+import structlog
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+
+from core.config import Settings, get_settings
+from core.metrics import metrics
+from core.resilience import CircuitBreaker, CircuitOpenError, Clock, OutcomeWindow
+
+from .providers import ModelSpec
+
+__all__ = ["ModelRouter", "ProviderCircuits", "RoutingPolicy", "llm_calls_in_flight", "shared_provider_circuits"]
+
+LOGGER = structlog.get_logger(__name__)
+
+ModelFactory = Callable[[str], Runnable]
+
+# Model calls started through any router and not yet finished (the LLM backlog).
+_in_flight = 0
+
+
+def llm_calls_in_flight() -> int:
+    return _in_flight
+
+
+@dataclass(slots=True, frozen=True)
+class RoutingPolicy:
+    """When a model counts as degraded and for how long traffic avoids it."""
+
+    p95_threshold_seconds: float = 30.0
+    error_rate_threshold: float = 0.5
+    window: int = 20
+    min_samples: int = 5
+    cooldown_seconds: float = 60.0
+
+
+class ProviderCircuits:
+    """One circuit breaker per LLM provider, so every chain on a failing provider fails fast.
+
+    A half-open breaker admits a single probe. Calls arriving meanwhile wait for the
+    probe's outcome (`wait_for_probe`) rather than failing, so a recovered provider
+    serves all of them instead of only the probe.
+    """
+
+    def __init__(self, *, failure_threshold: int = 3, cooldown: float = 30.0, clock: Clock = time.monotonic) -> None:
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._probes: dict[str, asyncio.Event] = {}
+
+    def get(self, provider: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = self._breakers[provider] = CircuitBreaker(
+                name=f"llm:{provider}",
+                failure_threshold=self._failure_threshold,
+                cooldown=self._cooldown,
+                clock=self._clock,
+            )
+        return breaker
+
+    async def wait_for_probe(self, breaker: CircuitBreaker) -> bool:
+        """Wait until no probe of `breaker` is in flight; return whether there was one."""
+        probe = self._probes.get(breaker.name)
+        if probe is None:
+            return False
+        await probe.wait()
+        return True
+
+    def admit(self, breaker: CircuitBreaker) -> bool:
+        """Let a call through `breaker` (or raise `CircuitOpenError`); return whether it is the probe.
+
+        The probe's caller must call `settle` once the outcome is recorded.
+        """
+        breaker.check()
+        if breaker.probing and breaker.name not in self._probes:
+            self._probes[breaker.name] = asyncio.Event()
+            return True
+        return False
+
+    def settle(self, breaker: CircuitBreaker) -> None:
+        probe = self._probes.pop(breaker.name, None)
+        if probe is not None:
+            probe.set()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {provider: breaker.snapshot() for provider, breaker in self._breakers.items()}
+
+
+@lru_cache(maxsize=1)
+def shared_provider_circuits() -> ProviderCircuits:
+    """The process-wide breakers shared by the extraction and generation agents."""
+    settings = get_settings()
+    circuits = ProviderCircuits(
+        failure_threshold=settings.llm_circuit_failure_threshold,
+        cooldown=settings.llm_circuit_cooldown_seconds,
+    )
+    metrics.register_collector("llm_circuits", circuits.snapshot)
+    return circuits
+
+
+class ModelRouter:
+    """Maps each chain to its configured model and reroutes around degraded ones.
+
+    Every call's latency and outcome is recorded per model. Once a model has at least
+    `min_samples` recent calls and their p95 latency or error rate exceeds the policy,
+    chains using it switch to its fallback for `cooldown_seconds`; afterwards the primary
+    gets traffic again and is judged on fresh samples. Primary models are built up front
+    (so misconfiguration fails at start-up), fallbacks on first use.
+
+    Calls also pass through their provider's circuit breaker: failures and timeouts (past
+    `call_timeout` seconds) count against it, and while it is open the provider is skipped.
+    When no candidate for a chain is reachable the call fails at once with
+    `CircuitOpenError`, and `available` lets callers degrade before even trying.
+    """
+
+    def __init__(
+        self,
+        *,
+        chain_models: Mapping[str, str],
+        factory: ModelFactory,
+        fallbacks: Mapping[str, str] | None = None,
+        policy: RoutingPolicy | None = None,
+        circuits: ProviderCircuits | None = None,
+        provider_of: Callable[[str], str] = lambda model: ModelSpec.parse(model).provider,
+        call_timeout: float | None = None,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self._chain_models = dict(chain_models)
+        self._fallbacks = dict(fallbacks or {})
+        self._factory = factory
+        self._policy = policy or RoutingPolicy()
+        self._circuits = circuits or ProviderCircuits(clock=clock)
+        self._provider_of = provider_of
+        self._call_timeout = call_timeout
+        self._clock = clock
+        self._models: dict[str, Runnable] = {}
+        self._windows: dict[str, OutcomeWindow] = {}
+        self._degraded_until: dict[str, float] = {}
+        for model in dict.fromkeys(self._chain_models.values()):
+            self._model(model)
+
+    @classmethod
+    def from_settings(cls, settings: Settings, *, chains: Iterable[str], factory: ModelFactory) -> ModelRouter:
+        """Route `chains` to their `llm_model_<chain>` settings with the configured fallbacks."""
+        return cls(
+            chain_models={chain: getattr(settings, f"llm_model_{chain}") for chain in chains},
+            factory=factory,
+            fallbacks=settings.llm_fallback_models,
+            policy=RoutingPolicy(
+                p95_threshold_seconds=settings.llm_fallback_p95_seconds,
+                error_rate_threshold=settings.llm_fallback_error_rate,
+                window=settings.llm_health_window,
+                min_samples=settings.llm_health_min_samples,
+                cooldown_seconds=settings.llm_fallback_cooldown_seconds,
+            ),
+            circuits=shared_provider_circuits(),
+            provider_of=lambda model: ModelSpec.parse(model, default_provider=settings.llm_provider).provider,
+            call_timeout=settings.llm_call_timeout_seconds,
+        )
+
+    @property
+    def chains(self) -> tuple[str, ...]:
+        return tuple(self._chain_models)
+
+    def available(self, chain: str) -> bool:
+        """Whether some model for `chain` is reachable (its provider's circuit is not open)."""
+        return self._route(chain) is not None
+
+    def select(self, chain: str) -> str:
+        """Return the model the next call of `chain` should use, or raise `CircuitOpenError`."""
+        model = self._route(chain)
+        if model is None:
+            primary = self._chain_models[chain]
+            breaker = self._circuit(primary)
+            metrics.increment(f"llm.router.rejected.{chain}")
+            raise CircuitOpenError(breaker.name, breaker.retry_after())
+        if model != self._chain_models[chain]:
+            metrics.increment(f"llm.router.fallback.{chain}")
+        return model
+
+    def record(self, model: str, latency: float, *, ok: bool) -> None:
+        window = self._windows.setdefault(model, OutcomeWindow(self._policy.window))
+        window.record(latency, ok=ok)
+        if len(window) < self._policy.min_samples or model in self._degraded_until:
+            return
+        p95, error_rate = window.percentile(0.95), window.error_rate()
+        if p95 > self._policy.p95_threshold_seconds or error_rate > self._policy.error_rate_threshold:
+            self._degraded_until[model] = self._clock() + self._policy.cooldown_seconds
+            window.clear()
+            metrics.increment(f"llm.router.degraded.{model}")
+            LOGGER.warning("llm_router.degraded", model=model, p95_seconds=round(p95, 3), error_rate=error_rate)
+
+    def runnable(self, chain: str) -> Runnable:
+        """A runnable standing in for the model of `chain` that routes and measures each call."""
+
+        async def invoke(value: Any, config: RunnableConfig) -> Any:
+            global _in_flight
+            model = self.select(chain)
+            while await self._circuits.wait_for_probe(self._circuit(model)):
+                model = self.select(chain)  # the probe's outcome may have rerouted the chain
+            breaker = self._circuit(model)
+            probe = self._circuits.admit(breaker)  # a half-open provider admits a single probe
+            started = self._clock()
+            _in_flight += 1
+            try:
+                result = await asyncio.wait_for(self._model(model).ainvoke(value, config=config), self._call_timeout)
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception:
+                breaker.record_failure()
+                self.record(model, self._clock() - started, ok=False)
+                raise
+            else:
+                breaker.record_success()
+                self.record(model, self._clock() - started, ok=True)
+            finally:
+                _in_flight -= 1
+                if probe:
+                    self._circuits.settle(breaker)
+            return result
+
+        return RunnableLambda(invoke, name=f"route:{chain}")
+
+    async def warm_up(self, prompt: str = "Reply with OK.") -> dict[str, bool]:
+        """Call each configured model once so connections and sessions exist before real traffic.
+
+        Outcomes count against the provider's circuit, so an unreachable provider shows up as
+        such, but not toward the latency window: a first call is slower than steady state.
+        """
+        models = list(dict.fromkeys(self._chain_models.values()))
+        outcomes = await asyncio.gather(*(self._warm_up_model(model, prompt) for model in models))
+        return dict(zip(models, outcomes, strict=True))
+
+    def snapshot(self) -> dict[str, Any]:
+        now = self._clock()
+        return {
+            "chains": {chain: self._route(chain) for chain in self._chain_models},
+            "degraded": {model: round(until - now, 3) for model, until in self._degraded_until.items() if until > now},
+            "models": {
+                model: {
+                    "samples": len(window),
+                    "p95_seconds": round(window.percentile(0.95), 3),
+                    "error_rate": window.error_rate(),
+                }
+                for model, window in self._windows.items()
+            },
+        }
+
+    async def _warm_up_model(self, model: str, prompt: str) -> bool:
+        breaker = self._circuit(model)
+        started = self._clock()
+        try:
+            await asyncio.wait_for(self._model(model).ainvoke(prompt), self._call_timeout)
+        except Exception as exc:
+            breaker.record_failure()
+            LOGGER.warning("llm_router.warm_up_failed", model=model, error=str(exc))
+            return False
+        breaker.record_success()
+        LOGGER.info("llm_router.warmed_up", model=model, duration_ms=round((self._clock() - started) * 1000, 1))
+        return True
+
+    def _route(self, chain: str) -> str | None:
+        primary = self._chain_models[chain]
+        fallback = self._fallbacks.get(primary)
+        candidates = [primary] if fallback is None else [primary, fallback]
+        reachable = [model for model in candidates if self._circuit(model).state != CircuitBreaker.OPEN]
+        healthy = [model for model in reachable if not self._is_degraded(model)]
+        return (healthy or reachable or [None])[0]
+
+    def _circuit(self, model: str) -> CircuitBreaker:
+        return self._circuits.get(self._provider_of(model))
+
+    def _is_degraded(self, model: str) -> bool:
+        until = self._degraded_until.get(model)
+        if until is None:
+            return False
+        if self._clock() < until:
+            return True
+        del self._degraded_until[model]
+        LOGGER.info("llm_router.recovered", model=model)
+        return False
+
+    def _model(self, name: str) -> Runnable:
+        model = self._models.get(name)
+        if model is None:
+            model = self._models[name] = self._factory(name)
+        return model
@@ -0,0 +1,300 @@
+"""Chat model providers: Gemini, or a self-hosted OpenAI-compatible / Ollama endpoint."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Literal, Mapping
+
+import httpx
+import structlog
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ChatMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable
+
+from core.config import Settings
+
+try:  # pragma: no cover - optional dependency wiring
+    from langchain_google_genai import ChatGoogleGenerativeAI  # type: ignore
+except Exception:  # pragma: no cover - module might be unavailable in tests
+    ChatGoogleGenerativeAI = None  # type: ignore[misc]
+
+# Private helpers of the pinned langchain-google-genai release used by `_GeminiChatModel`;
+# without them Gemini still works, only without token counts.
+try:  # pragma: no cover - depends on the installed langchain-google-genai release
+    from langchain_google_genai.chat_models import (  # type: ignore
+        _achat_with_retry,
+        _chat_with_retry,
+        _response_to_result,
+    )
+except Exception:  # pragma: no cover - renamed or removed upstream
+    _response_to_result = None
+
+__all__ = [
+    "PROVIDERS",
+    "HttpChatModel",
+    "ModelSpec",
+    "ProviderUnavailableError",
+    "aclose_http_clients",
+    "build_chat_model",
+]
+
+LOGGER = structlog.get_logger(__name__)
+
+PROVIDERS = ("gemini", "openai", "ollama")
+
+_ROLES = {"human": "user", "ai": "assistant", "system": "system"}
+
+
+class ProviderUnavailableError(RuntimeError):
+    """Raised when a configured provider cannot be built (missing library or settings)."""
+
+
+@dataclass(slots=True, frozen=True)
+class ModelSpec:
+    """A provider and the model name it serves."""
+
+    provider: str
+    model: str
+
+    @classmethod
+    def parse(cls, value: str, *, default_provider: str = "gemini") -> ModelSpec:
+        """Read `provider:model` ("ollama:qwen2.5:7b"); names without a known prefix use the default."""
+        prefix, separator, rest = value.partition(":")
+        if separator and prefix in PROVIDERS:
+            return cls(provider=prefix, model=rest)
+        return cls(provider=default_provider, model=value)
+
+
+class _ClientPool:
+    """One pooled client per endpoint (and, for async clients, per event loop).
+
+    Async clients hold connections bound to the loop that opened them, so they are never
+    shared across loops; a loop's clients are dropped with it.
+    """
+
+    def __init__(self) -> None:
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_clients: dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str, *, timeout: float, max_connections: int) -> httpx.AsyncClient:
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(base_url)
+        if client is None or client.is_closed:
+            client = clients[base_url] = httpx.AsyncClient(
+                base_url=base_url,
+                timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            )
+        return client
+
+    def get_sync(self, base_url: str, *, timeout: float, max_connections: int) -> httpx.Client:
+        with self._lock:
+            client = self._sync_clients.get(base_url)
+            if client is None or client.is_closed:
+                client = self._sync_clients[base_url] = httpx.Client(
+                    base_url=base_url,
+                    timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+                    limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+                )
+            return client
+
+    async def aclose(self) -> None:
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+
+_pool = _ClientPool()
+
+
+async def aclose_http_clients() -> None:
+    """Close the pooled endpoint connections opened on the running loop."""
+    await _pool.aclose()
+
+
+class HttpChatModel(BaseChatModel):
+    """Chat model served by an OpenAI-compatible (`/chat/completions`) or Ollama (`/api/chat`) API.
+
+    Requests reuse pooled keep-alive connections to `base_url`. With `json_schema`, the
+    endpoint is asked for JSON output (a JSON object for OpenAI-compatible servers, the
+    schema itself for Ollama). Token counts are reported as `usage_metadata`.
+    """
+
+    api: Literal["openai", "ollama"]
+    model: str
+    base_url: str
+    temperature: float = 0.2
+    api_key: str | None = None
+    json_schema: dict[str, Any] | None = None
+    timeout: float = 60.0
+    max_connections: int = 16
+
+    @property
+    def _llm_type(self) -> str:
+        return f"{self.api}-http"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {"api": self.api, "model": self.model, "base_url": self.base_url}
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        path, payload, headers = self._request(messages, stop)
+        client = _pool.get_sync(self.base_url, timeout=self.timeout, max_connections=self.max_connections)
+        response = client.post(path, json=payload, headers=headers)
+        response.raise_for_status()
+        return self._result(response.json())
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        path, payload, headers = self._request(messages, stop)
+        client = _pool.get(self.base_url, timeout=self.timeout, max_connections=self.max_connections)
+        response = await client.post(path, json=payload, headers=headers)
+        response.raise_for_status()
+        return self._result(response.json())
+
+    def _request(self, messages: list[BaseMessage], stop: list[str] | None) -> tuple[str, dict[str, Any], dict[str, str]]:
+        payload: dict[str, Any] = {"model": self.model, "messages": [_message_payload(message) for message in messages]}
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        if self.api == "ollama":
+            payload["stream"] = False
+            payload["options"] = {"temperature": self.temperature, **({"stop": stop} if stop else {})}
+            if self.json_schema is not None:
+                payload["format"] = self.json_schema
+            return "/api/chat", payload, headers
+        payload["temperature"] = self.temperature
+        if stop:
+            payload["stop"] = stop
+        if self.json_schema is not None:
+            payload["response_format"] = {"type": "json_object"}
+        return "/chat/completions", payload, headers
+
+    def _result(self, data: dict[str, Any]) -> ChatResult:
+        if self.api == "ollama":
+            content = (data.get("message") or {}).get("content", "")
+            input_tokens, output_tokens = data.get("prompt_eval_count", 0), data.get("eval_count", 0)
+        else:
+            content = data["choices"][0]["message"].get("content") or ""
+            usage = data.get("usage") or {}
+            input_tokens, output_tokens = usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)], llm_output={"model_name": self.model})
+
+
+_GeminiChatModel: Any = ChatGoogleGenerativeAI
+
+if ChatGoogleGenerativeAI is not None and _response_to_result is None:  # pragma: no cover - upstream drift
+    LOGGER.warning(
+        "providers.gemini_usage_unavailable",
+        reason="langchain-google-genai no longer exposes the helpers the token-count override uses",
+    )
+elif ChatGoogleGenerativeAI is not None:
+
+    class _GeminiChatModel(ChatGoogleGenerativeAI):  # type: ignore[misc, valid-type]
+        """`ChatGoogleGenerativeAI` that reports Gemini's token counts as `usage_metadata`.
+
+        langchain-google-genai 1.0.x drops the response's `usage_metadata`, so usage
+        accounting would read zero tokens for every Gemini call. `_generate` and
+        `_agenerate` are the integration's own, with the counts copied onto the message.
+        """
+
+        def _generate(
+            self,
+            messages: list[BaseMessage],
+            stop: list[str] | None = None,
+            run_manager: CallbackManagerForLLMRun | None = None,
+            **kwargs: Any,
+        ) -> ChatResult:
+            params, chat, message = self._prepare_chat(messages, stop=stop, **kwargs)
+            response = _chat_with_retry(content=message, **params, generation_method=chat.send_message)
+            return _gemini_result(response)
+
+        async def _agenerate(
+            self,
+            messages: list[BaseMessage],
+            stop: list[str] | None = None,
+            run_manager: AsyncCallbackManagerForLLMRun | None = None,
+            **kwargs: Any,
+        ) -> ChatResult:
+            params, chat, message = self._prepare_chat(messages, stop=stop, **kwargs)
+            response = await _achat_with_retry(content=message, **params, generation_method=chat.send_message_async)
+            return _gemini_result(response)
+
+
+def _gemini_result(response: Any) -> ChatResult:
+    result: ChatResult = _response_to_result(response)
+    usage = getattr(response, "usage_metadata", None)
+    if usage and result.generations:
+        # One count per response, on the first candidate, so nothing is counted twice.
+        result.generations[0].message.usage_metadata = {
+            "input_tokens": usage.prompt_token_count,
+            "output_tokens": usage.candidates_token_count,
+            "total_tokens": usage.total_token_count,
+        }
+    return result
+
+
+def _message_payload(message: BaseMessage) -> dict[str, str]:
+    role = message.role if isinstance(message, ChatMessage) else _ROLES.get(message.type, "user")
+    return {"role": role, "content": message.content if isinstance(message.content, str) else str(message.content)}
+
+
+def build_chat_model(
+    spec: str,
+    *,
+    settings: Settings,
+    temperature: float,
+    json_schema: dict[str, Any] | None = None,
+    gemini_options: Mapping[str, Any] | None = None,
+) -> Runnable:
+    """Build the chat model named by `spec` (see `ModelSpec.parse`) for the configured provider."""
+    parsed = ModelSpec.parse(spec, default_provider=settings.llm_provider)
+    if parsed.provider in {"openai", "ollama"}:
+        return HttpChatModel(
+            api=parsed.provider,
+            model=parsed.model,
+            base_url=settings.openai_base_url if parsed.provider == "openai" else settings.ollama_base_url,
+            api_key=settings.openai_api_key if parsed.provider == "openai" else None,
+            temperature=temperature,
+            json_schema=json_schema,
+            timeout=settings.local_llm_timeout_seconds,
+            max_connections=settings.local_llm_max_connections,
+        )
+    if parsed.provider != "gemini":
+        raise ProviderUnavailableError(f"Unknown LLM provider '{parsed.provider}'; expected one of {PROVIDERS}")
+    if ChatGoogleGenerativeAI is None:
+        raise ProviderUnavailableError("ChatGoogleGenerativeAI is unavailable. Install langchain-google-genai.")
+    llm = _GeminiChatModel(
+        model=parsed.model,
+        temperature=temperature,
+        google_api_key=settings.google_api_key,
+        **dict(gemini_options or {}),
+    )
+    if json_schema is None:
+        return llm
+    # Native JSON mode: the model is constrained to the schema server-side.
+    return llm.bind(generation_config={"response_mime_type": "application/json", "response_schema": json_schema})
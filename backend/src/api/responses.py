@@ -0,0 +1,20 @@
+"""Response helpers shared by the API routes."""
+from __future__ import annotations
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+__all__ = ["model_response"]
+
+
+def model_response(model: BaseModel, *, status_code: int = 200, exclude_none: bool = False) -> ORJSONResponse:
+    """Render an already validated model with orjson.
+
+    Returning a `Response` makes FastAPI skip re-validating the value against the route's
+    `response_model` and running `jsonable_encoder`, so the model is validated once (when
+    built) and dumped once, using field aliases like the declared response schema.
+    """
+    return ORJSONResponse(
+        model.model_dump(mode="json", by_alias=True, exclude_none=exclude_none),
+        status_code=status_code,
+    )
@@ -3,13 +3,15 @@ from __future__ import annotations
 
 from fastapi import APIRouter, FastAPI
 
-from . import extraction, generation, health, cv_extraction
+from . import extraction, generation, health, cv_extraction, metrics, ranking
 
 router = APIRouter()
 router.include_router(health.router, tags=["health"])
 router.include_router(extraction.router)
 router.include_router(generation.router)
 router.include_router(cv_extraction.router)
+router.include_router(ranking.router)
+router.include_router(metrics.router)
 
 
 def register_routes(app: FastAPI) -> None:
@@ -1,8 +1,14 @@
 """Endpoint for extracting text from CV documents."""
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from pydantic import BaseModel
+from functools import lru_cache
 
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, Request
+from pydantic import BaseModel, ConfigDict, Field
+
+from core.config import get_settings
+from services.cv_store import CvStore
 from services.document_processor import DocumentProcessor
+from services.pdf_backends import PdfOptions
+from services.text_cache import ExtractedTextCache
 
 router = APIRouter()
 
@@ -10,26 +16,83 @@ router = APIRouter()
 class TextExtractionResponse(BaseModel):
     """Response containing extracted text."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     text: str
     filename: str
+    cv_id: str | None = Field(
+        None,
+        alias="cvId",
+        description="Reference to the stored text, usable as profile.cvId in generation requests",
+    )
+
+
+@lru_cache(maxsize=1)
+def _cv_store_singleton() -> CvStore:
+    settings = get_settings()
+    return CvStore(max_entries=settings.cv_store_max_entries, ttl_seconds=settings.cv_store_ttl_seconds)
+
+
+def get_cv_store() -> CvStore:
+    """Dependency provider for the shared CvStore."""
+    return _cv_store_singleton()
+
+
+@lru_cache(maxsize=1)
+def _text_cache_singleton() -> ExtractedTextCache:
+    settings = get_settings()
+    return ExtractedTextCache(
+        directory=settings.cv_text_cache_dir or None,
+        memory_entries=settings.cv_text_cache_memory_entries,
+        disk_entries=settings.cv_text_cache_disk_entries,
+    )
+
+
+def get_text_cache() -> ExtractedTextCache:
+    """Dependency provider for the extracted-text cache."""
+    return _text_cache_singleton()
+
+
+@lru_cache(maxsize=1)
+def _pdf_options() -> PdfOptions:
+    settings = get_settings()
+    return PdfOptions(
+        backend=settings.pdf_backend,
+        max_pages=settings.pdf_max_pages,
+        page_time_budget=settings.pdf_page_time_budget_seconds,
+    )
 
 
 @router.post(
     "/extract-cv-text",
     response_model=TextExtractionResponse,
+    response_model_exclude_none=True,
     summary="Extract text from an uploaded CV file",
     tags=["extraction"],
 )
-async def extract_cv_text(file: UploadFile = File(...)) -> TextExtractionResponse:
+async def extract_cv_text(
+    request: Request,
+    file: UploadFile = File(...),
+    store: bool = Query(False, description="Keep the text server-side and return a cvId"),
+    cv_store: CvStore = Depends(get_cv_store),
+    text_cache: ExtractedTextCache = Depends(get_text_cache),
+) -> TextExtractionResponse:
     """
     Upload a CV file (PDF, DOCX, TXT) and get the extracted text.
     """
     if not file:
         raise HTTPException(status_code=400, detail="No file uploaded")
 
-    text = DocumentProcessor.extract_text(file)
-    
+    text = await DocumentProcessor.extract_text_async(
+        file,
+        cache=text_cache,
+        pdf_options=_pdf_options(),
+        executor=request.app.state.cpu_pool,
+    )
+    cv_id = cv_store.put(text, filename=file.filename) if store else None
+
     return TextExtractionResponse(
         text=text,
-        filename=file.filename or "unknown"
+        filename=file.filename or "unknown",
+        cvId=cv_id,
     )
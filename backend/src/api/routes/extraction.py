@@ -3,17 +3,21 @@
 from datetime import datetime, timezone
 from functools import lru_cache
 import hashlib
-from typing import Iterable
+from typing import Iterable, Literal
 
 from fastapi import APIRouter, Body, Depends, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field
 
 from agents import ExtractionAgent, ExtractionAgentError
+from api.disconnect import ClientDisconnected, cancel_on_disconnect, client_closed_response
+from api.responses import model_response
 from core.config import get_settings
-from core.rate_limit import limiter
+from core.metrics import metrics
 from core.validators import ValidationError as JobValidationError
+from services.host_scheduler import HostPolicy, HostScheduler
 from services.scraper import (
+    HostUnavailableError,
     ParseError,
     ScraperError,
     ScrapedJob,
@@ -27,7 +31,14 @@ router = APIRouter()
 class ExtractJobDetailsRequest(BaseModel):
     """Inbound payload containing the job posting URL."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     url: AnyHttpUrl = Field(..., description="Job posting URL to scrape and normalize")
+    llm_mode: Literal["auto", "always", "never"] = Field(
+        "auto",
+        alias="llmMode",
+        description="LLM normalization: 'auto' skips it for high-confidence scrapes; 'always'/'never' force it",
+    )
 
 
 class JobResponse(BaseModel):
@@ -59,12 +70,30 @@ class ErrorResponse(BaseModel):
 
 @lru_cache(maxsize=1)
 def _scraper_singleton() -> WebScraperService:
-    return WebScraperService()
+    settings = get_settings()
+    scheduler = HostScheduler(
+        policy=HostPolicy(
+            rate_per_second=settings.scraper_rate_per_second,
+            burst=settings.scraper_burst,
+            max_connections=settings.scraper_max_connections_per_host,
+            failure_threshold=settings.scraper_failure_threshold,
+            cooldown_seconds=settings.scraper_cooldown_seconds,
+        )
+    )
+    metrics.register_collector("scraper_hosts", scheduler.snapshot)
+    return WebScraperService(
+        scheduler=scheduler,
+        stale_cache_size=settings.scraper_stale_cache_size,
+        retain_html=settings.scraper_retain_html,
+    )
 
 
 @lru_cache(maxsize=1)
 def _extraction_agent_singleton() -> ExtractionAgent:
-    return ExtractionAgent()
+    agent = ExtractionAgent(confidence_threshold=get_settings().extraction_confidence_threshold)
+    if agent.router is not None:
+        metrics.register_collector("llm_router_extraction", agent.router.snapshot)
+    return agent
 
 
 def get_scraper_service() -> WebScraperService:
@@ -79,13 +108,20 @@ def get_extraction_agent() -> ExtractionAgent:
     return _extraction_agent_singleton()
 
 
-def _error_response(status_code: int, *, error: str, message: str, details: Iterable[str] | None = None) -> JSONResponse:
+def _error_response(
+    status_code: int,
+    *,
+    error: str,
+    message: str,
+    details: Iterable[str] | None = None,
+    headers: dict[str, str] | None = None,
+) -> JSONResponse:
     payload = ErrorResponse(
         error=error,
         message=message,
         details=list(details) if details else None,
     ).model_dump(exclude_none=True)
-    return JSONResponse(status_code=status_code, content=payload)
+    return JSONResponse(status_code=status_code, content=payload, headers=headers)
 
 
 def _job_identifier(url: str) -> str:
@@ -123,9 +159,9 @@ def _validation_details(exc: BaseException | None) -> list[str] | None:
         },
         429: {"description": "Rate limit exceeded"},
         500: {"model": ErrorResponse, "description": "Unexpected error while scraping or processing the job."},
+        503: {"model": ErrorResponse, "description": "The job board is temporarily unavailable (circuit open)."},
     },
 )
-@limiter.limit(get_settings().rate_limit_extraction)
 async def extract_job_details(
     request: Request,
     payload: ExtractJobDetailsRequest = Body(...),
@@ -142,6 +178,13 @@ async def extract_job_details(
             error="unsupported_url",
             message=str(exc),
         )
+    except HostUnavailableError as exc:
+        return _error_response(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            error="host_unavailable",
+            message=str(exc),
+            headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+        )
     except ParseError as exc:
         return _error_response(
             status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -155,8 +198,12 @@ async def extract_job_details(
             message=str(exc),
         )
 
+    # The scrape above always completes (it refreshes the scraper's stale cache); the LLM
+    # normalization only serves this client and is cancelled if it disconnects.
     try:
-        agent_result = await agent.run(scraped)
+        agent_result = await cancel_on_disconnect(request, agent.run(scraped, llm_mode=payload.llm_mode))
+    except ClientDisconnected:
+        return client_closed_response()
     except ExtractionAgentError as exc:
         return _error_response(
             status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -165,4 +212,7 @@ async def extract_job_details(
             details=_validation_details(exc.__cause__),
         )
 
-    return _job_response(agent_result.job)
+    response = model_response(_job_response(agent_result.job))
+    if agent_result.degraded:
+        response.headers["X-Degraded"] = "llm_unavailable"
+    return response
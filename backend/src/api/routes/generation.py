@@ -2,14 +2,19 @@
 
 from datetime import datetime
 from functools import lru_cache
+from typing import Literal
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from agents import GeneratedBundle, GenerationAgent
-from core.config import get_settings
-from core.rate_limit import limiter
+from api.disconnect import ClientDisconnected, cancel_on_disconnect, client_closed_response
+from api.responses import model_response
+from core.metrics import metrics
+from services.cv_store import CvStore
+
+from .cv_extraction import get_cv_store
 
 router = APIRouter()
 
@@ -27,12 +32,25 @@ class JobInput(BaseModel):
 class ProfileInput(BaseModel):
     """Candidate profile information."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     name: str | None = None
-    cv_text: str = Field(..., alias="cvText", description="Raw text content of the CV")
+    cv_text: str | None = Field(None, alias="cvText", description="Raw text content of the CV")
+    cv_id: str | None = Field(
+        None,
+        alias="cvId",
+        description="ID returned by /extract-cv-text?store=true, used instead of cvText",
+    )
     language: str = Field(default="auto", description="Output language (auto, pt, en, es, fr, de)")
     tone: str = Field(default="professional", description="Tone of voice (professional, friendly, formal, enthusiastic)")
     variance: int = Field(default=3, ge=1, le=5, description="Adaptation variance level (1=strict, 5=creative)")
 
+    @model_validator(mode="after")
+    def _require_cv(self) -> "ProfileInput":
+        if not self.cv_text and not self.cv_id:
+            raise ValueError("Either cvText or cvId must be provided")
+        return self
+
 
 class GenerateRequest(BaseModel):
     """Request payload for material generation."""
@@ -51,6 +69,12 @@ class GeneratedAssetsResponse(BaseModel):
     insights: str
     match_score: int = Field(..., alias="matchScore")
     generated_at: datetime = Field(..., alias="generatedAt")
+    degraded: bool = Field(False, description="True when some artifacts could not be generated")
+    artifact_status: dict[str, Literal["ok", "unavailable"]] = Field(
+        default_factory=dict,
+        alias="artifactStatus",
+        description="Per-artifact status; 'unavailable' while the LLM provider is down (text is empty)",
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -61,9 +85,16 @@ class ErrorResponse(BaseModel):
     details: list[str] | None = None
 
 
+# Generation chain -> artifact name in the response.
+_ARTIFACT_FIELDS = {"cv": "cv", "cover_letter": "coverLetter", "networking": "networking", "insights": "insights"}
+
+
 @lru_cache(maxsize=1)
 def _generation_agent_singleton() -> GenerationAgent:
-    return GenerationAgent()
+    agent = GenerationAgent()
+    if agent.router is not None:
+        metrics.register_collector("llm_router_generation", agent.router.snapshot)
+    return agent
 
 
 def get_generation_agent() -> GenerationAgent:
@@ -78,41 +109,68 @@ def get_generation_agent() -> GenerationAgent:
     tags=["generation"],
     responses={
         400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse, "description": "Unknown or expired cvId"},
         422: {"model": ErrorResponse},
         429: {"description": "Rate limit exceeded"},
         500: {"model": ErrorResponse},
     },
 )
-@limiter.limit(get_settings().rate_limit_generation)
 async def generate_materials(
     request: Request,
     payload: GenerateRequest = Body(...),
     agent: GenerationAgent = Depends(get_generation_agent),
+    cv_store: CvStore = Depends(get_cv_store),
 ) -> GeneratedAssetsResponse:
     """Generate CV, cover letter, and insights based on job and profile."""
-    
+
+    cv_text = payload.profile.cv_text
+    if not cv_text:
+        stored = cv_store.get(payload.profile.cv_id or "")
+        if stored is None:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content=ErrorResponse(
+                    error="cv_not_found",
+                    message="The referenced CV is unknown or has expired; upload it again.",
+                ).model_dump(exclude_none=True),
+            )
+        cv_text = stored.text
+
     try:
         # Convert Pydantic model to dict for the agent
         job_data = payload.job.model_dump()
         
-        result: GeneratedBundle = await agent.generate_all(
-            job_data=job_data,
-            cv_text=payload.profile.cv_text,
-            language=payload.profile.language,
-            tone=payload.profile.tone,
-            variance=payload.profile.variance,
+        # Nothing else reads the result, so a closed tab cancels all four chains.
+        result: GeneratedBundle = await cancel_on_disconnect(
+            request,
+            agent.generate_all(
+                job_data=job_data,
+                cv_text=cv_text,
+                language=payload.profile.language,
+                tone=payload.profile.tone,
+                variance=payload.profile.variance,
+            ),
         )
         
-        return GeneratedAssetsResponse(
-            jobId=payload.job.id,
-            cv=result.cv,
-            coverLetter=result.cover_letter,
-            networking=result.networking,
-            insights=result.insights,
-            matchScore=result.match_score,
-            generatedAt=result.generated_at,
+        return model_response(
+            GeneratedAssetsResponse(
+                jobId=payload.job.id,
+                cv=result.cv,
+                coverLetter=result.cover_letter,
+                networking=result.networking,
+                insights=result.insights,
+                matchScore=result.match_score,
+                generatedAt=result.generated_at,
+                degraded=bool(result.unavailable),
+                artifactStatus={
+                    field_name: "unavailable" if chain in result.unavailable else "ok"
+                    for chain, field_name in _ARTIFACT_FIELDS.items()
+                },
+            )
         )
-        
+
+    except ClientDisconnected:
+        return client_closed_response()
     except Exception as exc:
         # In a real app, we'd handle specific agent errors (e.g. context length exceeded)
         return JSONResponse(
@@ -1,7 +1,8 @@
-"""Health check endpoint."""
+"""Liveness and readiness endpoints."""
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse
 
 router = APIRouter()
 
@@ -10,3 +11,15 @@ router = APIRouter()
 def health_check() -> dict[str, str]:
     """Return basic service availability info."""
     return {"status": "ok"}
+
+
+@router.get(
+    "/ready",
+    summary="Readiness check",
+    tags=["health"],
+    responses={503: {"description": "Still starting up, or a dependency is unreachable"}},
+)
+def readiness_check(request: Request) -> ORJSONResponse:
+    """Report whether start-up and warm-up are done and dependencies are reachable."""
+    ready, report = request.app.state.readiness.report()
+    return ORJSONResponse(report, status_code=200 if ready else 503)
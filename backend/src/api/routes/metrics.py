@@ -0,0 +1,16 @@
+"""Operational metrics endpoint."""
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from core.metrics import metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", summary="In-process service metrics", tags=["health"])
+def read_metrics() -> dict[str, Any]:
+    """Return counters and per-component state (e.g. scraper host circuits)."""
+    return metrics.snapshot()
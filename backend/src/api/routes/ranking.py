@@ -0,0 +1,98 @@
+"""Endpoint for ranking many jobs against one CV without LLM calls."""
+
+import time
+
+from fastapi import APIRouter, Body, Request
+from pydantic import BaseModel, ConfigDict, Field
+from starlette.concurrency import run_in_threadpool
+
+from api.responses import model_response
+from core.ranking import RankableJob, rank_jobs
+
+router = APIRouter()
+
+MAX_RANKED_JOBS = 500
+
+
+class RankJobInput(BaseModel):
+    """A saved job to rank; only the text fields are used."""
+
+    id: str | None = None
+    title: str
+    company: str = ""
+    description: str = ""
+    skills: list[str] = Field(default_factory=list)
+
+
+class RankJobsRequest(BaseModel):
+    """One CV and the jobs to rank against it."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    cv_text: str = Field(..., alias="cvText", min_length=1, description="Raw text content of the CV")
+    jobs: list[RankJobInput] = Field(..., min_length=1, max_length=MAX_RANKED_JOBS)
+    limit: int | None = Field(None, ge=1, description="Return only the best `limit` jobs")
+
+
+class JobRankingResponse(BaseModel):
+    """Fit of one job with the CV."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    index: int = Field(..., description="Position of the job in the request")
+    job_id: str | None = Field(None, alias="jobId")
+    title: str
+    company: str
+    score: int = Field(..., description="Combined fit score (0-100)")
+    text_score: float = Field(..., alias="textScore", description="Share of the job's BM25 term weight the CV covers")
+    skill_score: float | None = Field(None, alias="skillScore", description="Share of the job's skills found in the CV")
+    matched_skills: list[str] = Field(default_factory=list, alias="matchedSkills")
+    missing_skills: list[str] = Field(default_factory=list, alias="missingSkills")
+
+
+class RankJobsResponse(BaseModel):
+    """Jobs ordered from best to worst fit."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    rankings: list[JobRankingResponse]
+    elapsed_ms: float = Field(..., alias="elapsedMs")
+
+
+@router.post(
+    "/rank-jobs",
+    response_model=RankJobsResponse,
+    summary="Rank saved jobs by fit with a CV",
+    tags=["ranking"],
+    responses={429: {"description": "Rate limit exceeded"}},
+)
+async def rank_jobs_endpoint(request: Request, payload: RankJobsRequest = Body(...)) -> RankJobsResponse:
+    """Score every job with BM25 text coverage plus skill overlap; no LLM is involved."""
+    jobs = [
+        RankableJob(title=job.title, description=job.description, skills=job.skills, company=job.company)
+        for job in payload.jobs
+    ]
+    started = time.perf_counter()
+    rankings = await run_in_threadpool(rank_jobs, payload.cv_text, jobs)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if payload.limit is not None:
+        rankings = rankings[: payload.limit]
+
+    response = RankJobsResponse(
+        rankings=[
+            JobRankingResponse(
+                index=ranking.index,
+                jobId=payload.jobs[ranking.index].id,
+                title=payload.jobs[ranking.index].title,
+                company=payload.jobs[ranking.index].company,
+                score=ranking.score,
+                textScore=ranking.text_score,
+                skillScore=ranking.skill_score,
+                matchedSkills=ranking.matched_skills,
+                missingSkills=ranking.missing_skills,
+            )
+            for ranking in rankings
+        ],
+        elapsedMs=round(elapsed_ms, 3),
+    )
+    return model_response(response)
@@ -0,0 +1,144 @@
+"""Production entry point: `python -m app.launcher`, with `src` on PYTHONPATH.
+
+Everything comes from `Settings`, so one container image behaves the same everywhere. A
+container runs `server_workers` server processes, each with its own event loop and
+`document_parse_workers` parsing processes: plan CPU and memory for
+`server_workers * (1 + document_parse_workers)` processes. Stored CVs are per process,
+so with several workers a `cvId` only resolves on the worker that issued it.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import math
+import os
+import signal
+import sys
+import time
+from types import FrameType
+from typing import Any
+
+import structlog
+import uvicorn
+from fastapi import FastAPI
+from uvicorn.importer import import_from_string
+from uvicorn.main import STARTUP_FAILURE
+from uvicorn.supervisors import Multiprocess
+
+from app.lifecycle import drain
+from core.config import Settings, get_settings
+
+__all__ = ["DrainingServer", "main", "server_options"]
+
+LOGGER = structlog.get_logger(__name__)
+
+APP = "app.main:app"
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))  # honours CPU pinning, unlike os.cpu_count()
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def server_options(settings: Settings) -> dict[str, Any]:
+    """uvicorn options for `settings`: fastest installed loop and HTTP parser, workers and limits."""
+    return {
+        "host": settings.server_host,
+        "port": settings.api_port,
+        "workers": settings.server_workers or _available_cpus(),
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+        "backlog": settings.server_backlog,
+        "timeout_keep_alive": settings.server_keep_alive_seconds,
+        "limit_concurrency": settings.server_limit_concurrency or None,
+        # Bounds uvicorn's wait for open connections; DrainingServer shortens it by the
+        # time its own drain took.
+        "timeout_graceful_shutdown": math.ceil(settings.shutdown_drain_seconds),
+        "proxy_headers": True,
+        "forwarded_allow_ips": settings.server_forwarded_allow_ips,
+        "lifespan": "on",
+        "access_log": False,  # RequestContextMiddleware already logs every request
+        "log_config": None,  # keep the structlog set-up from app.main
+        "log_level": settings.log_level.lower(),
+    }
+
+
+class DrainingServer(uvicorn.Server):
+    """uvicorn server that drains the application before its own shutdown starts.
+
+    uvicorn closes its listeners as soon as it sees SIGTERM or SIGINT, so a load balancer
+    watching `/ready` would only ever see refused connections. This server first runs
+    `app.lifecycle.drain` while still listening: `/ready` answers 503, new work gets 503
+    `shutting_down` and admitted requests finish. Then uvicorn shuts down as usual. A
+    second SIGINT skips the drain; a third forces the exit, as in plain uvicorn.
+    """
+
+    def __init__(self, config: uvicorn.Config) -> None:
+        super().__init__(config)
+        self._draining: asyncio.Task[None] | None = None
+
+    def handle_exit(self, sig: int, frame: FrameType | None) -> None:
+        if self._draining is None and self.started:
+            self._draining = asyncio.get_running_loop().create_task(self._drain_then_exit(sig, frame))
+        elif self._draining is None or sig == signal.SIGINT:
+            if self._draining is not None:
+                self._draining.cancel()
+            super().handle_exit(sig, frame)
+
+    async def _drain_then_exit(self, sig: int, frame: FrameType | None) -> None:
+        started = time.monotonic()
+        try:
+            await drain(self._application())
+        except Exception as exc:
+            LOGGER.error("shutdown.drain_failed", error=str(exc))
+        finally:
+            budget = self.config.timeout_graceful_shutdown
+            if budget is not None:
+                self.config.timeout_graceful_shutdown = max(1, math.ceil(budget - (time.monotonic() - started)))
+            if not self.should_exit:
+                super().handle_exit(sig, frame)
+
+    def _application(self) -> FastAPI:
+        app = self.config.app
+        return import_from_string(app) if isinstance(app, str) else app
+
+
+def main() -> None:
+    settings = get_settings()
+    options = server_options(settings)
+    # Preload: importing the app here makes configuration and import errors fail before any
+    # worker starts. A single worker serves this instance; more workers each import their own.
+    from app.main import app
+
+    LOGGER.info(
+        "launcher.start",
+        workers=options["workers"],
+        loop=options["loop"],
+        http=options["http"],
+        document_parse_workers=settings.document_parse_workers,
+    )
+    if options["workers"] > 1:
+        # CvStore is per-process memory: a cvId issued by one worker is unknown to the others.
+        LOGGER.warning(
+            "launcher.cv_store_not_shared",
+            workers=options["workers"],
+            detail="cvId lookups answer 404 cv_not_found on workers other than the one that issued them",
+        )
+    config = uvicorn.Config(app if options["workers"] == 1 else APP, **options)
+    server = DrainingServer(config)
+    if config.workers > 1:
+        Multiprocess(config, target=server.run, sockets=[config.bind_socket()]).run()
+    else:
+        server.run()
+        if not server.started:
+            sys.exit(STARTUP_FAILURE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Application lifecycle: eager start-up, LLM warm-up, readiness and draining shutdown."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable
+
+import structlog
+from fastapi import FastAPI
+
+from agents.model_router import ModelRouter
+from agents.providers import aclose_http_clients
+from api.routes.cv_extraction import get_cv_store, get_text_cache
+from api.routes.extraction import get_extraction_agent, get_scraper_service
+from api.routes.generation import get_generation_agent
+
+__all__ = ["Readiness", "drain", "lifespan"]
+
+LOGGER = structlog.get_logger(__name__)
+
+
+class Readiness:
+    """What `/ready` reports: start-up progress plus live dependency checks.
+
+    Ready means every shared service was built, the warm-up has finished (or was skipped)
+    and every registered check passes right now, e.g. each LLM chain has a provider
+    whose circuit is not open.
+    """
+
+    def __init__(self) -> None:
+        self.started = False
+        self.warmed_up = False
+        self.errors: dict[str, str] = {}
+        self._checks: dict[str, Callable[[], bool]] = {}
+
+    def add_check(self, name: str, check: Callable[[], bool]) -> None:
+        self._checks[name] = check
+
+    def report(self) -> tuple[bool, dict[str, Any]]:
+        checks = {
+            "startup": self.started and not self.errors,
+            "warm_up": self.warmed_up,
+            **{name: check() for name, check in self._checks.items()},
+        }
+        ready = all(checks.values())
+        report: dict[str, Any] = {"status": "ready" if ready else "not_ready", "checks": checks}
+        if self.errors:
+            report["errors"] = dict(self.errors)
+        return ready, report
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build shared services before serving and warm the LLMs up in the background.
+
+    On shutdown the pooled clients, the document-parsing processes and the usage ledger
+    are closed. Requests have been drained by then: see `drain`.
+    """
+    settings = app.state.settings
+    admission = app.state.admission
+    readiness = app.state.readiness = Readiness()
+    admission.resume()
+    admission.lag_monitor.ensure_running()
+    services = _build_services(readiness)
+    routers: list[ModelRouter] = []
+    for name, service in services.items():
+        router = getattr(service, "router", None)
+        if router is not None:
+            routers.append(router)
+            readiness.add_check(f"llm_{name}", lambda router=router: all(map(router.available, router.chains)))
+    scraper = services.get("scraper")
+    if scraper is not None:
+        scraper.open()
+    if settings.document_parse_workers > 0:
+        # Spawned rather than forked: this process already runs threads (log writer, thread pool).
+        app.state.cpu_pool = ProcessPoolExecutor(
+            max_workers=settings.document_parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=importlib.import_module,
+            initargs=("services.document_processor",),
+        )
+        for _ in range(settings.document_parse_workers):
+            app.state.cpu_pool.submit(int)  # start and import now, not on the first upload
+    readiness.started = True
+    warm_up = asyncio.create_task(_warm_up(routers, readiness, enabled=settings.llm_warmup))
+    try:
+        yield
+    finally:
+        readiness.started = False
+        warm_up.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await warm_up
+        if scraper is not None:
+            await scraper.aclose()
+        if app.state.cpu_pool is not None:
+            await asyncio.to_thread(app.state.cpu_pool.shutdown, cancel_futures=True)
+            app.state.cpu_pool = None
+        await aclose_http_clients()
+        if app.state.usage_ledger is not None:
+            app.state.usage_ledger.close()
+        admission.lag_monitor.stop()
+        LOGGER.info("shutdown.complete")
+
+
+async def drain(app: FastAPI) -> int:
+    """Stop taking work and let admitted requests finish; return how many were still running.
+
+    `/ready` turns not-ready at once, new work is refused with 503 and admitted requests
+    get up to `shutdown_drain_seconds`. This only helps while the server still accepts
+    connections, so `app.launcher.DrainingServer` runs it as soon as the shutdown signal
+    arrives: uvicorn closes its listeners and waits for open requests before it sends the
+    lifespan shutdown.
+    """
+    settings = app.state.settings
+    admission = app.state.admission
+    app.state.readiness.started = False
+    LOGGER.info("shutdown.draining", **admission.snapshot())
+    try:
+        async with asyncio.timeout(settings.shutdown_drain_seconds):
+            await admission.drain()
+    except TimeoutError:
+        LOGGER.warning(
+            "shutdown.drain_timeout",
+            in_flight=admission.active,
+            budget_seconds=settings.shutdown_drain_seconds,
+        )
+    return admission.active
+
+
+def _build_services(readiness: Readiness) -> dict[str, Any]:
+    """Build the route singletons now so the first request does not pay for them.
+
+    A service that cannot be built (e.g. a missing API key) is reported by `/ready`
+    rather than preventing start-up, so `/health` and the LLM-free routes still serve.
+    """
+    builders = {
+        "scraper": get_scraper_service,
+        "extraction_agent": get_extraction_agent,
+        "generation_agent": get_generation_agent,
+        "cv_store": get_cv_store,
+        "text_cache": get_text_cache,
+    }
+    services: dict[str, Any] = {}
+    for name, build in builders.items():
+        try:
+            services[name] = build()
+        except Exception as exc:
+            readiness.errors[name] = str(exc)
+            LOGGER.error("startup.service_failed", service=name, error=str(exc))
+    return services
+
+
+async def _warm_up(routers: list[ModelRouter], readiness: Readiness, *, enabled: bool) -> None:
+    if enabled:
+        for router in routers:
+            outcomes = await router.warm_up()
+            LOGGER.info("startup.warm_up", models=outcomes)
+    readiness.warmed_up = True
@@ -2,49 +2,100 @@
 from __future__ import annotations
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 
+from agents.model_router import llm_calls_in_flight
 from api.routes import register_routes
+from app.lifecycle import Readiness, lifespan
+from app.middleware import (
+    AdmissionMiddleware,
+    CompressionMiddleware,
+    LlmUsageMiddleware,
+    RateLimitMiddleware,
+    RequestContextMiddleware,
+)
+from core.admission import AdmissionController, RouteAdmission
 from core.config import Settings, get_settings
+from core.metrics import metrics
 from core.logging import configure_logging
-from core.rate_limit import limiter
+from core.rate_limit import RateLimiter
+from services.usage_ledger import UsageLedger
 
 def create_app() -> FastAPI:
     """Instantiate the FastAPI application with shared metadata."""
     settings = get_settings()
-    configure_logging(level=settings.log_level)
+    configure_logging(
+        level=settings.log_level,
+        sample_rates=settings.log_sample_rates,
+        queue_size=settings.log_queue_size,
+    )
 
     application = FastAPI(
         title="CV Sob Medida API",
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
     
     # State
     application.state.settings = settings
-    application.state.limiter = limiter
+    application.state.limiter = RateLimiter()
+    application.state.readiness = Readiness()
+    application.state.cpu_pool = None  # process pool for document parsing, opened at start-up
+    application.state.usage_ledger = (
+        UsageLedger(settings.llm_usage_ledger_path) if settings.llm_usage_ledger_path else None
+    )
+    application.state.admission = AdmissionController(
+        routes={
+            route: RouteAdmission(max_in_flight=limit, llm_bound=route in settings.admission_llm_routes)
+            for route, limit in settings.admission_max_in_flight.items()
+        },
+        max_loop_lag=settings.admission_max_loop_lag_seconds,
+        max_llm_in_flight=settings.admission_max_llm_in_flight,
+        llm_in_flight=llm_calls_in_flight,
+        retry_after=settings.admission_retry_after_seconds,
+    )
+    metrics.register_collector("admission", application.state.admission.snapshot)
 
-    # Middleware
-    application.add_middleware(SlowAPIMiddleware)
+    # Middleware (all pure ASGI; the last one added runs first)
+    application.add_middleware(
+        LlmUsageMiddleware,
+        ledger=application.state.usage_ledger,
+        prices=settings.llm_token_prices,
+        expose_header=settings.llm_usage_header,
+    )
+    application.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        max_request_body=settings.max_request_body_bytes,
+    )
+    application.add_middleware(AdmissionMiddleware, controller=application.state.admission)
+    application.add_middleware(
+        RateLimitMiddleware,
+        limiter=application.state.limiter,
+        limits={
+            "POST /extract-job-details": settings.rate_limit_extraction,
+            "POST /generate-materials": settings.rate_limit_generation,
+            "POST /rank-jobs": settings.rate_limit_ranking,
+        },
+    )
     application.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Request-ID", "Retry-After", "Server-Timing", "X-LLM-Usage", "X-Degraded"],
     )
     application.add_middleware(
         TrustedHostMiddleware, 
         allowed_hosts=settings.allowed_hosts
     )
-
-    # Exception Handlers
-    application.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    application.add_middleware(RequestContextMiddleware)
 
     register_routes(application)
     return application
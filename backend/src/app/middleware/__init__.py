@@ -0,0 +1,15 @@
+"""Pure-ASGI middleware used by the application."""
+
+from .admission import AdmissionMiddleware
+from .compression import CompressionMiddleware
+from .rate_limit import RateLimitMiddleware
+from .request_context import RequestContextMiddleware
+from .usage import LlmUsageMiddleware
+
+__all__ = [
+    "AdmissionMiddleware",
+    "CompressionMiddleware",
+    "LlmUsageMiddleware",
+    "RateLimitMiddleware",
+    "RequestContextMiddleware",
+]
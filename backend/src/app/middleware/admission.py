@@ -0,0 +1,75 @@
+"""Pure-ASGI load shedding for expensive routes."""
+from __future__ import annotations
+
+import math
+
+import orjson
+import structlog
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.admission import AdmissionController
+from core.metrics import metrics
+
+__all__ = ["AdmissionMiddleware"]
+
+LOGGER = structlog.get_logger(__name__)
+
+# Probes, metrics and docs: never refused, not counted as work.
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_MESSAGES = {
+    "in_flight": "Too many requests of this kind are already being processed",
+    "loop_lag": "The server is overloaded",
+    "llm_queue": "Too many language model calls are already waiting",
+    "shutting_down": "The server is shutting down",
+}
+
+
+class AdmissionMiddleware:
+    """Answer 503 with `Retry-After` when the controller refuses a request.
+
+    The check happens before the body is read, so a shed request costs almost nothing.
+    Read-only requests (health, readiness, metrics) on unguarded routes always pass
+    straight through; other requests are counted in flight so shutdown can drain them.
+    """
+
+    def __init__(self, app: ASGIApp, *, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        self.controller.lag_monitor.ensure_running()
+        route = f"{scope['method']} {scope['path']}"
+        if scope["method"] in _SAFE_METHODS and not self.controller.guards(route):
+            await self.app(scope, receive, send)
+            return
+
+        reason = self.controller.try_admit(route)
+        if reason is not None:
+            metrics.increment(f"http.shed.{reason}")
+            LOGGER.warning("admission.shed", route=route, reason=reason)
+            await _service_unavailable(send, reason, self.controller.retry_after)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route)
+
+
+async def _service_unavailable(send: Send, reason: str, retry_after: float) -> None:
+    body = orjson.dumps({"error": "overloaded", "reason": reason, "message": _MESSAGES[reason]})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
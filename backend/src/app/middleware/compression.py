@@ -0,0 +1,217 @@
+"""Pure-ASGI response compression (brotli/gzip) and gzip request-body decoding."""
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # pragma: no cover - optional dependency wiring
+    import brotli  # type: ignore
+except Exception:  # pragma: no cover - brotli is optional
+    brotli = None  # type: ignore[assignment]
+
+__all__ = ["CompressionMiddleware"]
+
+_COMPRESSIBLE_PREFIXES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli (when installed) or gzip, and inflate gzip request bodies.
+
+    Responses smaller than `minimum_size`, already encoded, or of a non-text media type pass
+    through untouched. Single-message bodies are compressed in one call; streamed bodies are
+    compressed chunk by chunk. Request bodies sent with `Content-Encoding: gzip` are inflated
+    up to `max_request_body` bytes (413 beyond that, 400 when malformed or truncated); other
+    request encodings get a 415.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        max_request_body: int = 5 * 1024 * 1024,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.max_request_body = max_request_body
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        request_encoding = headers.get("content-encoding", "").strip().lower()
+        if request_encoding and request_encoding != "identity":
+            if request_encoding not in {"gzip", "x-gzip"}:
+                await _plain_response(send, 415, b"Unsupported request Content-Encoding")
+                return
+            body = await self._inflate_request(receive, send)
+            if body is None:
+                return
+            scope = dict(scope)
+            scope["headers"] = [
+                (key, value) for key, value in scope["headers"] if key not in (b"content-encoding", b"content-length")
+            ] + [(b"content-length", str(len(body)).encode("latin-1"))]
+            receive = _replay(body, receive)
+
+        encoding = _negotiate(headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingSend(send, encoding, self)
+        await self.app(scope, receive, responder)
+
+    async def _inflate_request(self, receive: Receive, send: Send) -> bytes | None:
+        """Inflate the gzip request body, or answer the error and return None.
+
+        Returns None without answering when the client disconnects mid-body.
+        """
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks: list[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None
+            more_body = message.get("more_body", False)
+            # Cap each step so a tiny compressed payload cannot inflate past the limit in one call.
+            try:
+                data = inflater.decompress(message.get("body", b""), self.max_request_body + 1 - size)
+            except zlib.error:
+                await _plain_response(send, 400, b"Malformed gzip request body")
+                return None
+            size += len(data)
+            chunks.append(data)
+            if size > self.max_request_body or inflater.unconsumed_tail:
+                await _plain_response(send, 413, b"Request body too large")
+                return None
+        if not inflater.eof:
+            await _plain_response(send, 400, b"Truncated gzip request body")
+            return None
+        return b"".join(chunks)
+
+    def _compressor(self, encoding: str) -> Any:
+        if encoding == "br":
+            return brotli.Compressor(quality=self.brotli_quality)
+        return zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class _CompressingSend:
+    """`send` wrapper that decides on the first body message whether to compress."""
+
+    def __init__(self, send: Send, encoding: str, middleware: CompressionMiddleware) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._middleware = middleware
+        self._start: Message | None = None
+        self._compressor: Any = None
+        self._passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message.get("headers", []))
+            media_type = headers.get("content-type", "")
+            self._passthrough = "content-encoding" in headers or not media_type.startswith(_COMPRESSIBLE_PREFIXES)
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self._start is not None:
+            start, self._start = self._start, None
+            if self._passthrough or (not more_body and len(body) < self._middleware.minimum_size):
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+            headers = MutableHeaders(raw=start.setdefault("headers", []))
+            headers["Content-Encoding"] = self._encoding
+            headers.add_vary_header("Accept-Encoding")
+            self._compressor = self._middleware._compressor(self._encoding)
+            if not more_body:
+                payload = _finish(self._compressor, self._encoding, body)
+                headers["Content-Length"] = str(len(payload))
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": payload})
+                return
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            await self._send(start)
+        elif self._passthrough:
+            await self._send(message)
+            return
+
+        if more_body:
+            chunk = _flush(self._compressor, self._encoding, body)
+            if chunk:
+                await self._send({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            await self._send({"type": "http.response.body", "body": _finish(self._compressor, self._encoding, body)})
+
+
+def _negotiate(accept_encoding: str) -> str | None:
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip()] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def _flush(compressor: Any, encoding: str, data: bytes) -> bytes:
+    if encoding == "br":
+        return compressor.process(data) + compressor.flush()
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def _finish(compressor: Any, encoding: str, data: bytes) -> bytes:
+    if encoding == "br":
+        return compressor.process(data) + compressor.finish()
+    return compressor.compress(data) + compressor.flush()
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """Deliver the inflated body once, then defer to the server (e.g. for disconnects)."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+async def _plain_response(send: Send, status_code: int, body: bytes) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", str(len(body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,57 @@
+"""Pure-ASGI per-route, per-client rate limiting."""
+from __future__ import annotations
+
+import math
+from typing import Mapping
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.metrics import metrics
+from core.rate_limit import RateLimit, RateLimiter
+
+__all__ = ["RateLimitMiddleware"]
+
+
+class RateLimitMiddleware:
+    """Reject requests over their route's limit with 429 before any routing or body parsing.
+
+    `limits` maps "METHOD /path" to a rate such as "10/minute"; other routes are not limited.
+    Clients are keyed by the peer address the server reports.
+    """
+
+    def __init__(self, app: ASGIApp, *, limits: Mapping[str, str | RateLimit], limiter: RateLimiter | None = None) -> None:
+        self.app = app
+        self.limiter = limiter or RateLimiter()
+        self._limits = {
+            route: limit if isinstance(limit, RateLimit) else RateLimit.parse(limit) for route, limit in limits.items()
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            route = f"{scope['method']} {scope['path']}"
+            limit = self._limits.get(route)
+            if limit is not None:
+                client = scope.get("client")
+                retry_after = self.limiter.hit(route, client[0] if client else "unknown", limit)
+                if retry_after > 0:
+                    metrics.increment("http.rate_limited")
+                    await _too_many_requests(send, limit, retry_after)
+                    return
+        await self.app(scope, receive, send)
+
+
+async def _too_many_requests(send: Send, limit: RateLimit, retry_after: float) -> None:
+    body = orjson.dumps({"error": "rate_limited", "message": f"Rate limit exceeded: {limit}"})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
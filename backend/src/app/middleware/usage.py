@@ -0,0 +1,76 @@
+"""Pure-ASGI per-request aggregation of LLM token usage."""
+from __future__ import annotations
+
+import asyncio
+
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.llm_usage import TokenPrices, UsageTracker, track_usage
+from services.usage_ledger import UsageLedger
+
+__all__ = ["LlmUsageMiddleware"]
+
+LOGGER = structlog.get_logger(__name__)
+
+
+class LlmUsageMiddleware:
+    """Track the LLM calls each request makes and report them once it finishes.
+
+    Requests that made at least one call are logged as `llm.usage` and, with a `ledger`,
+    appended to it from a worker thread after the response has been sent. With
+    `expose_header`, responses carry `X-LLM-Usage` with per-chain token counts.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        ledger: UsageLedger | None = None,
+        prices: TokenPrices | None = None,
+        expose_header: bool = False,
+    ) -> None:
+        self.app = app
+        self.ledger = ledger
+        self.prices = prices or {}
+        self.expose_header = expose_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_usage() as tracker:
+
+            async def send_with_usage(message: Message) -> None:
+                if self.expose_header and message["type"] == "http.response.start" and tracker.calls:
+                    MutableHeaders(scope=message)["X-LLM-Usage"] = tracker.header_value()
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_usage)
+            finally:
+                if tracker.calls:
+                    await self._report(scope, tracker)
+
+    async def _report(self, scope: Scope, tracker: UsageTracker) -> None:
+        endpoint = f"{scope['method']} {scope['path']}"
+        LOGGER.info(
+            "llm.usage",
+            endpoint=endpoint,
+            calls=tracker.calls,
+            input_tokens=tracker.input_tokens,
+            output_tokens=tracker.output_tokens,
+            cost_usd=tracker.cost_usd(self.prices),
+            chains=tracker.header_value(),
+        )
+        if self.ledger is None:
+            return
+        request_id = scope.get("state", {}).get("request_id")
+        try:
+            await asyncio.to_thread(
+                self.ledger.append, tracker, request_id=request_id, endpoint=endpoint, prices=self.prices
+            )
+        except Exception as exc:  # the ledger is diagnostics only; never fail the request over it
+            LOGGER.warning("llm.usage.ledger_failed", error=str(exc))
@@ -0,0 +1,159 @@
+"""Admission control: shed work up front when the process is overloaded, drain it on shutdown."""
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+from core.resilience import Clock
+
+__all__ = ["AdmissionController", "LoopLagMonitor", "RouteAdmission"]
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop runs a callback scheduled every `interval` seconds.
+
+    The callback is a plain timer handle rather than a task, so it needs no shutdown and
+    simply stops when its loop does. `lag` also counts a tick that is overdue right now,
+    so a loop stuck behind a long backlog is noticed before the tick finally runs.
+    """
+
+    def __init__(self, *, interval: float = 0.1, clock: Clock = time.monotonic) -> None:
+        self._interval = interval
+        self._clock = clock
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._due = 0.0
+        self._lag = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._handle is not None
+
+    @property
+    def lag(self) -> float:
+        """Seconds the loop is currently behind schedule (0 when not monitoring)."""
+        if self._handle is None:
+            return 0.0
+        return max(self._lag, self._clock() - self._due, 0.0)
+
+    def ensure_running(self) -> None:
+        """Start monitoring the running loop unless it is already being monitored."""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop and self._handle is not None:
+            return
+        self.stop()
+        self._loop = loop
+        self._schedule()
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._loop = self._handle = None
+        self._lag = 0.0
+
+    def _schedule(self) -> None:
+        if self._loop is None:  # stopped
+            return
+        self._due = self._clock() + self._interval
+        self._handle = self._loop.call_later(self._interval, self._tick)
+
+    def _tick(self) -> None:
+        self._lag = max(0.0, self._clock() - self._due)
+        self._schedule()
+
+
+@dataclass(slots=True, frozen=True)
+class RouteAdmission:
+    """How much concurrent work one route may have, and whether it waits on LLM calls."""
+
+    max_in_flight: int
+    llm_bound: bool = False
+
+
+class AdmissionController:
+    """Decides whether a request may start more work right now.
+
+    A guarded route is refused when it already has `max_in_flight` requests running, when
+    the event loop lags by more than `max_loop_lag` seconds, or, for LLM-bound routes, when
+    `max_llm_in_flight` model calls are already waiting. Refusing early costs the client a
+    retry; accepting would queue the request behind work it cannot overtake.
+
+    Every admitted request is counted until released, so shutdown can `drain`: refuse new
+    work and wait for the admitted requests to finish. Callers bound the wait themselves
+    (`asyncio.timeout`) and read `active` to see how many requests were left behind.
+    """
+
+    def __init__(
+        self,
+        *,
+        routes: Mapping[str, RouteAdmission],
+        max_loop_lag: float = 0.5,
+        max_llm_in_flight: int = 32,
+        llm_in_flight: Callable[[], int] = lambda: 0,
+        lag_monitor: LoopLagMonitor | None = None,
+        retry_after: float = 5.0,
+    ) -> None:
+        self._routes = dict(routes)
+        self._max_loop_lag = max_loop_lag
+        self._max_llm_in_flight = max_llm_in_flight
+        self._llm_in_flight = llm_in_flight
+        self.lag_monitor = lag_monitor or LoopLagMonitor()
+        self.retry_after = retry_after
+        self._in_flight = dict.fromkeys(self._routes, 0)
+        self._active = 0
+        self._idle: asyncio.Event | None = None
+        self.draining = False
+
+    @property
+    def active(self) -> int:
+        """Admitted requests that have not been released yet."""
+        return self._active
+
+    def guards(self, route: str) -> bool:
+        return route in self._routes
+
+    def try_admit(self, route: str) -> str | None:
+        """Admit `route` (counting it in flight) and return None, or return why it was refused."""
+        if self.draining:
+            return "shutting_down"
+        admission = self._routes.get(route)
+        if admission is not None:
+            if self._in_flight[route] >= admission.max_in_flight:
+                return "in_flight"
+            if self.lag_monitor.lag > self._max_loop_lag:
+                return "loop_lag"
+            if admission.llm_bound and self._llm_in_flight() >= self._max_llm_in_flight:
+                return "llm_queue"
+            self._in_flight[route] += 1
+        self._active += 1
+        return None
+
+    def release(self, route: str) -> None:
+        if route in self._in_flight:
+            self._in_flight[route] -= 1
+        self._active -= 1
+        if self._active == 0 and self._idle is not None:
+            self._idle.set()
+            self._idle = None
+
+    async def drain(self) -> None:
+        """Refuse new work and wait until every admitted request has been released."""
+        self.draining = True
+        if self._active:
+            self._idle = self._idle or asyncio.Event()
+            await self._idle.wait()
+
+    def resume(self) -> None:
+        """Accept work again (a new application start-up after a drain)."""
+        self.draining = False
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "draining": self.draining,
+            "active": self._active,
+            "in_flight": dict(self._in_flight),
+            "loop_lag_seconds": round(self.lag_monitor.lag, 4),
+            "llm_in_flight": self._llm_in_flight(),
+        }
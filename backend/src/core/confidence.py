@@ -0,0 +1,57 @@
+"""Confidence scoring for scraped jobs, used to decide whether LLM normalization is needed."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from services.scraper import ScrapedJob
+
+__all__ = ["ConfidenceReport", "score_scraped_job"]
+
+_PLACEHOLDER_VALUES = {"unknown position", "unknown company"}
+_BULLET_RE = re.compile(r"^\s*(?:[-*•·▪]|\d+[.)])\s+", re.MULTILINE)
+# How much each source can be trusted to have isolated the right fields.
+_SOURCE_TRUST = {"json_ld": 1.0, "embedded_json": 0.9, "fragment": 0.7, "html": 0.5}
+_WEIGHTS = {"fields": 0.25, "skills": 0.25, "description": 0.3, "source": 0.2}
+_TARGET_SKILLS = 5
+_TARGET_DESCRIPTION_WORDS = 150
+_MAX_SKILL_WORDS = 4
+
+
+@dataclass(slots=True)
+class ConfidenceReport:
+    """Overall score in [0, 1] plus the per-component scores that produced it."""
+
+    score: float
+    components: dict[str, float]
+
+
+def score_scraped_job(job: ScrapedJob) -> ConfidenceReport:
+    """Score how complete and clean a scrape is without asking an LLM.
+
+    Components: title/company present and not placeholders, number of short skill entries,
+    description length and structure (paragraphs or bullets), and the trust of the source
+    the fields came from (generic-board HTML earns none).
+    """
+    fields_score = sum(
+        1 for value in (job.title, job.company) if value.strip() and value.strip().lower() not in _PLACEHOLDER_VALUES
+    ) / 2
+
+    concise_skills = [skill for skill in job.skills if 0 < len(skill.split()) <= _MAX_SKILL_WORDS]
+    skills_score = min(len(concise_skills) / _TARGET_SKILLS, 1.0)
+
+    description = job.description.strip()
+    length_score = min(len(description.split()) / _TARGET_DESCRIPTION_WORDS, 1.0)
+    structured = description.count("\n") >= 2 or len(_BULLET_RE.findall(description)) >= 2
+    description_score = length_score * (1.0 if structured else 0.6)
+
+    source_score = 0.0 if job.board == "generic" and job.source == "html" else _SOURCE_TRUST.get(job.source, 0.5)
+
+    components = {
+        "fields": fields_score,
+        "skills": skills_score,
+        "description": description_score,
+        "source": source_score,
+    }
+    score = sum(_WEIGHTS[name] * value for name, value in components.items())
+    return ConfidenceReport(score=round(score, 4), components=components)
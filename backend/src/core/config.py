@@ -23,11 +23,118 @@ class Settings(BaseSettings):
     environment: str = "development"
     api_port: int = 8000
     log_level: str = "INFO"
+    # Logging: keep this fraction of each listed event (e.g. {"http.request": 0.1}); lines
+    # beyond the queue size are dropped rather than blocking requests
+    log_sample_rates: dict[str, float] = Field(default_factory=dict)
+    log_queue_size: int = 10_000
     cors_origins: list[str] = Field(default_factory=lambda: DEFAULT_CORS_ORIGINS.copy())
     
+    # HTTP: responses at least this large are compressed; gzip request bodies inflate up to the cap
+    compression_minimum_size: int = 1024
+    max_request_body_bytes: int = 5 * 1024 * 1024
+
+    # Production server (python -m app.launcher). Workers: 0 = one per available CPU. Keep-alive
+    # outlasts typical proxy idle timeouts (60s) so the proxy, not us, closes idle connections.
+    # Each worker refuses connections beyond `server_limit_concurrency` with 503 (0 = no cap).
+    # Loopback by default; containers and PaaS set SERVER_HOST=0.0.0.0 (see Dockerfile, DEPLOY.md).
+    server_host: str = "127.0.0.1"
+    server_workers: int = 1
+    server_backlog: int = 2048
+    server_keep_alive_seconds: int = 65
+    server_limit_concurrency: int = 0
+    server_forwarded_allow_ips: str = "127.0.0.1"
+
     # Rate Limits
     rate_limit_extraction: str = "10/minute"
     rate_limit_generation: str = "5/minute"
+    rate_limit_ranking: str = "30/minute"
+
+    # Admission control: guarded routes ("METHOD /path" -> max concurrent requests) answer 503
+    # with Retry-After instead of queueing while full, while the event loop lags past the
+    # limit, or (LLM routes only) while too many model calls are already waiting
+    admission_max_in_flight: dict[str, int] = Field(
+        default_factory=lambda: {"POST /generate-materials": 8, "POST /rank-jobs": 4}
+    )
+    admission_llm_routes: list[str] = Field(default_factory=lambda: ["POST /generate-materials"])
+    admission_max_loop_lag_seconds: float = 0.5
+    admission_max_llm_in_flight: int = 32
+    admission_retry_after_seconds: float = 5.0
+
+    # Scraper politeness (applied per remote host)
+    scraper_rate_per_second: float = 1.0
+    scraper_burst: int = 3
+    scraper_max_connections_per_host: int = 2
+    scraper_failure_threshold: int = 3
+    scraper_cooldown_seconds: float = 30.0
+    scraper_stale_cache_size: int = 64
+    scraper_retain_html: bool = True  # keep a compressed copy of each fetched page
+
+    # Uploaded CV texts kept server-side and referenced by cvId
+    cv_store_max_entries: int = 256
+    cv_store_ttl_seconds: float = 86_400.0
+
+    # Extracted text of uploaded documents, keyed by content hash (empty dir = system temp)
+    cv_text_cache_dir: str = ""
+    cv_text_cache_memory_entries: int = 128
+    cv_text_cache_disk_entries: int = 1024
+
+    # Processes per server worker that parse uploaded documents (0 = parse on the thread pool)
+    document_parse_workers: int = 2
+
+    # PDF text extraction: "auto" picks the fastest installed backend (pdfium, pdfminer, pypdf)
+    pdf_backend: str = "auto"
+    pdf_max_pages: int = 20
+    pdf_page_time_budget_seconds: float = 2.0
+
+    # LLM provider for model names without a "gemini:", "openai:" or "ollama:" prefix, and the
+    # self-hosted endpoints those prefixes point at (e.g. LLM_MODEL_EXTRACTION=ollama:qwen2.5:7b)
+    llm_provider: str = "gemini"
+    openai_base_url: str = "http://localhost:8080/v1"
+    openai_api_key: str | None = None
+    ollama_base_url: str = "http://localhost:11434"
+    local_llm_timeout_seconds: float = 60.0
+    local_llm_max_connections: int = 16
+
+    # LLM models per chain; a model whose recent p95 latency or error rate crosses the
+    # threshold is swapped for its fallback for the cool-down period
+    llm_model_cv: str = "gemini-2.5-flash"
+    llm_model_cover_letter: str = "gemini-2.5-flash"
+    llm_model_networking: str = "gemini-2.5-flash-lite"
+    llm_model_insights: str = "gemini-2.5-flash-lite"
+    llm_model_extraction: str = "gemini-2.5-flash"
+    llm_fallback_models: dict[str, str] = Field(
+        default_factory=lambda: {"gemini-2.5-flash": "gemini-2.5-flash-lite", "gemini-2.5-flash-lite": "gemini-2.5-flash"}
+    )
+    llm_fallback_p95_seconds: float = 30.0
+    llm_fallback_error_rate: float = 0.5
+    llm_health_window: int = 20
+    llm_health_min_samples: int = 5
+    llm_fallback_cooldown_seconds: float = 60.0
+    # Per-provider circuit breaker: after this many consecutive failures or timeouts the
+    # provider is skipped for the cool-down and endpoints answer in degraded mode
+    llm_call_timeout_seconds: float = 60.0
+    llm_circuit_failure_threshold: int = 3
+    llm_circuit_cooldown_seconds: float = 30.0
+
+    # Start-up: call each configured model once in the background before /ready reports ready
+    llm_warmup: bool = False
+    # Shutdown: refuse new work and give in-flight requests this long to finish (keep it
+    # below the orchestrator's kill grace period)
+    shutdown_drain_seconds: float = 25.0
+
+    # LLM usage accounting: optional X-LLM-Usage response header, SQLite ledger (empty path =
+    # disabled) and USD prices per million tokens by model
+    llm_usage_header: bool = False
+    llm_usage_ledger_path: str = ""
+    llm_token_prices: dict[str, dict[str, float]] = Field(
+        default_factory=lambda: {
+            "gemini-2.5-flash": {"input": 0.30, "output": 2.50},
+            "gemini-2.5-flash-lite": {"input": 0.10, "output": 0.40},
+        }
+    )
+
+    # Extraction: scrapes scoring at or above this confidence skip LLM normalization
+    extraction_confidence_threshold: float = 0.85
 
     # Security
     allowed_hosts: list[str] = ["localhost", "127.0.0.1", "*.onrender.com", "testserver"]
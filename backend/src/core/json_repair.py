@@ -0,0 +1,84 @@
+"""Local recovery of JSON documents emitted by LLMs (fenced, wrapped in prose or truncated)."""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+__all__ = ["JsonRepairError", "repair_json"]
+
+_FENCE_RE = re.compile(r"^```[a-zA-Z0-9_-]*\s*\n?(.*?)\n?```\s*$", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_DANGLING_MEMBER_RE = re.compile(r'(,|(?<=\{))\s*"(?:[^"\\]|\\.)*"\s*:?\s*$')
+_DECODER = json.JSONDecoder()
+
+
+class JsonRepairError(ValueError):
+    """Raised when the text cannot be turned into JSON even after repairs."""
+
+
+def repair_json(text: str) -> Any:
+    """Parse `text` as JSON, fixing the defects LLM output typically has.
+
+    Handles Markdown code fences, prose before/after the document, trailing commas and
+    output truncated mid-document (unterminated strings, dangling keys, unclosed brackets).
+    """
+    candidate = text.strip()
+    fenced = _FENCE_RE.match(candidate)
+    if fenced:
+        candidate = fenced.group(1).strip()
+    try:
+        return json.loads(candidate)
+    except ValueError:
+        pass
+
+    starts = [index for index in (candidate.find("{"), candidate.find("[")) if index >= 0]
+    if not starts:
+        raise JsonRepairError("No JSON object or array found in model output")
+    candidate = candidate[min(starts):]
+    try:
+        value, _ = _DECODER.raw_decode(candidate)
+        return value
+    except ValueError:
+        pass
+
+    repaired = _close_truncated(_TRAILING_COMMA_RE.sub(r"\1", candidate))
+    try:
+        value, _ = _DECODER.raw_decode(_TRAILING_COMMA_RE.sub(r"\1", repaired))
+        return value
+    except ValueError as exc:
+        raise JsonRepairError(f"Model output is not recoverable JSON: {exc}") from exc
+
+
+def _close_truncated(text: str) -> str:
+    closers: list[str] = []
+    in_string = False
+    escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char == "{":
+            closers.append("}")
+        elif char == "[":
+            closers.append("]")
+        elif char in "}]" and closers:
+            closers.pop()
+
+    if in_string:
+        text = (text[:-1] if escaped else text) + '"'
+    text = text.rstrip()
+    if closers and closers[-1] == "}":
+        # Inside an object a trailing string is a key whose value never arrived.
+        text = _DANGLING_MEMBER_RE.sub("", text)
+    text = text.rstrip().rstrip(",").rstrip()
+    if text.endswith(":"):
+        text += " null"
+    return text + "".join(reversed(closers))
@@ -0,0 +1,217 @@
+"""Token and latency accounting for LLM calls, aggregated per request and per chain."""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import RunnableConfig
+
+from core.metrics import metrics
+
+__all__ = [
+    "ChainUsage",
+    "TokenPrices",
+    "UsageCallback",
+    "UsageTracker",
+    "current_usage",
+    "track_usage",
+    "usage_config",
+]
+
+# USD per million tokens, keyed by model name: {"gemini-2.5-flash": {"input": 0.3, "output": 2.5}}
+TokenPrices = Mapping[str, Mapping[str, float]]
+
+_current: ContextVar[UsageTracker | None] = ContextVar("llm_usage", default=None)
+
+
+@dataclass(slots=True)
+class ChainUsage:
+    """Calls, tokens and time spent by one chain within a request."""
+
+    chain: str
+    model: str | None = None
+    calls: int = 0
+    errors: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency_ms: float = 0.0
+
+    def cost_usd(self, prices: TokenPrices) -> float | None:
+        # Gemini reports its models as "models/<name>".
+        model = (self.model or "").removeprefix("models/")
+        price = prices.get(model)
+        if price is None:
+            return None
+        return (self.input_tokens * price.get("input", 0.0) + self.output_tokens * price.get("output", 0.0)) / 1e6
+
+
+class UsageTracker:
+    """Accumulates the usage of every LLM call made while it is the current tracker."""
+
+    def __init__(self) -> None:
+        self.chains: dict[str, ChainUsage] = {}
+
+    def record(
+        self,
+        chain: str,
+        *,
+        model: str | None,
+        input_tokens: int,
+        output_tokens: int,
+        latency_ms: float,
+        error: bool = False,
+    ) -> None:
+        usage = self.chains.get(chain)
+        if usage is None:
+            usage = self.chains[chain] = ChainUsage(chain=chain)
+        usage.model = model or usage.model
+        usage.calls += 1
+        usage.errors += int(error)
+        usage.input_tokens += input_tokens
+        usage.output_tokens += output_tokens
+        usage.latency_ms += latency_ms
+
+    @property
+    def calls(self) -> int:
+        return sum(usage.calls for usage in self.chains.values())
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(usage.input_tokens for usage in self.chains.values())
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(usage.output_tokens for usage in self.chains.values())
+
+    def cost_usd(self, prices: TokenPrices) -> float | None:
+        """Total cost of the chains whose model has a price, or `None` when none has."""
+        costs = [cost for usage in self.chains.values() if (cost := usage.cost_usd(prices)) is not None]
+        return sum(costs) if costs else None
+
+    def header_value(self) -> str:
+        """Per-chain usage in a Server-Timing-like form: `cv;in=812;out=640;ms=2210, ...`."""
+        return ", ".join(
+            f"{usage.chain};in={usage.input_tokens};out={usage.output_tokens};ms={usage.latency_ms:.0f}"
+            for usage in self.chains.values()
+        )
+
+
+def current_usage() -> UsageTracker | None:
+    return _current.get()
+
+
+@contextmanager
+def track_usage() -> Iterator[UsageTracker]:
+    """Make a fresh tracker current for the enclosed block (and tasks it spawns)."""
+    tracker = UsageTracker()
+    token = _current.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current.reset(token)
+
+
+class UsageCallback(AsyncCallbackHandler):
+    """LangChain callback that reports each model call of `chain` to metrics and the tracker.
+
+    The tracker is captured when the callback is created, so calls finishing on other
+    tasks or threads are still attributed to the request that started them.
+    """
+
+    def __init__(self, chain: str) -> None:
+        self._chain = chain
+        self._tracker = current_usage()
+        self._started: dict[UUID, tuple[float, str | None]] = {}
+
+    async def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: Any,
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._started[run_id] = (time.perf_counter(), _model_name(serialized, metadata))
+
+    async def on_llm_start(
+        self,
+        serialized: dict[str, Any],
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._started[run_id] = (time.perf_counter(), _model_name(serialized, metadata))
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        input_tokens, output_tokens = _token_counts(response)
+        model = (response.llm_output or {}).get("model_name")
+        self._finish(run_id, model=model, input_tokens=input_tokens, output_tokens=output_tokens)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, error=True)
+
+    def _finish(
+        self,
+        run_id: UUID,
+        *,
+        model: str | None = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        error: bool = False,
+    ) -> None:
+        started, start_model = self._started.pop(run_id, (time.perf_counter(), None))
+        latency_ms = (time.perf_counter() - started) * 1000
+        metrics.increment(f"llm.calls.{self._chain}")
+        metrics.increment(f"llm.input_tokens.{self._chain}", input_tokens)
+        metrics.increment(f"llm.output_tokens.{self._chain}", output_tokens)
+        if error:
+            metrics.increment(f"llm.errors.{self._chain}")
+        if self._tracker is not None:
+            self._tracker.record(
+                self._chain,
+                model=model or start_model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                latency_ms=latency_ms,
+                error=error,
+            )
+
+
+def usage_config(chain: str) -> RunnableConfig:
+    """Invocation config that names the run and attaches a `UsageCallback` for `chain`."""
+    return {"callbacks": [UsageCallback(chain)], "run_name": chain}
+
+
+def _model_name(serialized: dict[str, Any] | None, metadata: dict[str, Any] | None) -> str | None:
+    if metadata and metadata.get("ls_model_name"):
+        return str(metadata["ls_model_name"])
+    kwargs = (serialized or {}).get("kwargs") or {}
+    model = kwargs.get("model") or kwargs.get("model_name")
+    return str(model) if model else None
+
+
+def _token_counts(response: LLMResult) -> tuple[int, int]:
+    """Read token counts from message usage metadata, falling back to provider `llm_output`."""
+    input_tokens = output_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                input_tokens += int(usage.get("input_tokens", 0))
+                output_tokens += int(usage.get("output_tokens", 0))
+    if input_tokens or output_tokens:
+        return input_tokens, output_tokens
+    usage = (response.llm_output or {}).get("token_usage") or (response.llm_output or {}).get("usage_metadata") or {}
+    return (
+        int(usage.get("prompt_tokens", usage.get("input_tokens", 0)) or 0),
+        int(usage.get("completion_tokens", usage.get("output_tokens", 0)) or 0),
+    )
@@ -1,26 +1,129 @@
 """Structured logging helpers."""
 from __future__ import annotations
 
+import atexit
 import logging
-from typing import Any
+import logging.handlers
+import queue
+import random
+import sys
+from typing import IO, Any, Callable, Mapping
 
+import orjson
 import structlog
 
+from core.metrics import metrics
 
-def configure_logging(*, level: str = "INFO") -> structlog.stdlib.BoundLogger:
-    """Configure structlog with JSON output and return a logger instance."""
-    logging.basicConfig(
-        format="%(message)s",
-        level=getattr(logging, level.upper(), logging.INFO),
-    )
+__all__ = ["EventSampler", "LazyField", "configure_logging", "lazy", "shutdown_logging"]
+
+# Levels that are always kept, whatever the sampling rate of their event.
+_UNSAMPLED_LEVELS = frozenset({"warning", "error", "critical", "exception"})
+
+_listener: logging.handlers.QueueListener | None = None
+_handler: logging.Handler | None = None
+
+
+class LazyField:
+    """A log field computed only if the event survives level filtering and sampling."""
+
+    __slots__ = ("_func", "_args", "_kwargs")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def resolve(self) -> Any:
+        return self._func(*self._args, **self._kwargs)
+
+
+def lazy(func: Callable[..., Any], *args: Any, **kwargs: Any) -> LazyField:
+    """Defer `func(*args, **kwargs)` until the log line is actually rendered."""
+    return LazyField(func, *args, **kwargs)
+
+
+def _resolve_lazy_fields(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    for key, value in event_dict.items():
+        if isinstance(value, LazyField):
+            event_dict[key] = value.resolve()
+    return event_dict
+
+
+class EventSampler:
+    """Keep only a fraction of high-volume events, by event name.
+
+    `rates` maps event names to the probability of keeping them (1.0 keeps all, 0 drops
+    all). Kept sampled events carry `sample_rate` so counts can be re-weighted downstream.
+    Warnings and errors are never sampled.
+    """
+
+    def __init__(self, rates: Mapping[str, float], *, rng: Callable[[], float] = random.random) -> None:
+        self._rates = {event: min(max(float(rate), 0.0), 1.0) for event, rate in rates.items()}
+        self._rng = rng
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+        rate = self._rates.get(event_dict.get("event"))  # type: ignore[arg-type]
+        if rate is None or rate >= 1.0 or method_name in _UNSAMPLED_LEVELS:
+            return event_dict
+        if rate <= 0.0 or self._rng() >= rate:
+            raise structlog.DropEvent
+        event_dict["sample_rate"] = rate
+        return event_dict
+
+
+def _orjson_dumps(event_dict: dict[str, Any], *, default: Callable[[Any], Any] = repr, **_: Any) -> str:
+    # The stdlib logger expects text, and orjson returns bytes.
+    return orjson.dumps(event_dict, default=default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the writer falls behind."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.increment("logging.dropped")
+
+
+def configure_logging(
+    *,
+    level: str = "INFO",
+    sample_rates: Mapping[str, float] | None = None,
+    queue_size: int = 10_000,
+    stream: IO[str] | None = None,
+) -> structlog.stdlib.BoundLogger:
+    """Configure structlog with JSON output and return a logger instance.
+
+    Records are rendered with orjson on the calling thread and written to `stream`
+    (stdout by default) by a background thread, so a slow sink never blocks the event
+    loop. When more than `queue_size` records are waiting, new ones are dropped and
+    counted in the `logging.dropped` metric.
+    """
+    global _handler, _listener
+
+    shutdown_logging()
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    writer = logging.StreamHandler(stream or sys.stdout)
+    writer.setFormatter(logging.Formatter("%(message)s"))
+    _listener = logging.handlers.QueueListener(log_queue, writer, respect_handler_level=False)
+    _handler = _DroppingQueueHandler(log_queue)
+    root = logging.getLogger()
+    root.addHandler(_handler)
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+    _listener.start()
 
     structlog.configure(
         processors=
         [
+            # Cheapest check first: below-level events stop here, before any other work.
+            structlog.stdlib.filter_by_level,
+            EventSampler(sample_rates or {}),
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso", key="timestamp"),
-            structlog.processors.JSONRenderer(),
+            _resolve_lazy_fields,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -28,3 +131,18 @@ def configure_logging(*, level: str = "INFO") -> structlog.stdlib.BoundLogger:
     )
 
     return structlog.get_logger()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread; safe to call more than once."""
+    global _handler, _listener
+
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()  # drains the queue before returning
+        _listener = None
+
+
+atexit.register(shutdown_logging)
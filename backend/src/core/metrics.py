@@ -0,0 +1,56 @@
+"""Lightweight in-process metrics registry."""
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable
+
+__all__ = ["MetricsRegistry", "metrics"]
+
+Collector = Callable[[], dict[str, Any]]
+
+
+class MetricsRegistry:
+    """Thread-safe counters plus pluggable collectors for component state snapshots."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = defaultdict(int)
+        self._collectors: dict[str, Collector] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increase the counter `name` by `value`."""
+        with self._lock:
+            self._counters[name] += value
+
+    def counter(self, name: str) -> int:
+        """Return the current value of a counter (zero when never incremented)."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        """Expose the state returned by `collector` under `name` in snapshots."""
+        with self._lock:
+            self._collectors[name] = collector
+
+    def unregister_collector(self, name: str) -> None:
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return counters and collector output as a JSON-serializable dict."""
+        with self._lock:
+            counters = dict(self._counters)
+            collectors = dict(self._collectors)
+        return {
+            "counters": counters,
+            **{name: collector() for name, collector in collectors.items()},
+        }
+
+    def reset(self) -> None:
+        """Clear counters (collectors stay registered); useful for tests."""
+        with self._lock:
+            self._counters.clear()
+
+
+metrics = MetricsRegistry()
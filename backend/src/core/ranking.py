@@ -0,0 +1,139 @@
+"""Vectorized ranking of many jobs against a single CV, without LLM calls."""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+from core.scoring import match_skills
+from core.skills import canonicalize_skills, get_skill_matcher
+
+__all__ = ["JobRanking", "RankableJob", "rank_jobs"]
+
+_TOKEN_RE = re.compile(r"[^\W_][\w+#.]*[\w+#]|[^\W_]", re.UNICODE)
+_STOPWORDS = frozenset(
+    """
+    a an and are as at be by for from has have in is it its of on or our that the this to we will with you your
+    o os as um uma uns umas de do da dos das e em no na nos nas por para com que se ao aos ou seu sua
+    """.split()
+)
+
+
+@dataclass(slots=True)
+class RankableJob:
+    """The parts of a job posting the ranker reads."""
+
+    title: str
+    description: str
+    skills: list[str] = field(default_factory=list)
+    company: str = ""
+
+
+@dataclass(slots=True)
+class JobRanking:
+    """Ranking outcome for one job; `index` points back into the input sequence."""
+
+    index: int
+    score: int
+    text_score: float
+    skill_score: float | None
+    matched_skills: list[str]
+    missing_skills: list[str]
+
+
+def rank_jobs(
+    cv_text: str,
+    jobs: Sequence[RankableJob],
+    *,
+    skill_weight: float = 0.6,
+    k1: float = 1.5,
+    b: float = 0.75,
+) -> list[JobRanking]:
+    """Rank `jobs` by fit with `cv_text`, best first.
+
+    The text score is the share of each job's BM25 term weight (IDF computed across the
+    submitted jobs) that the CV covers; the skill score is the share of the job's canonical
+    skills the CV mentions. Jobs without skills are ranked on text alone. The corpus is held
+    as flat (job, term, frequency) arrays, so the work is linear in the number of distinct
+    terms per job rather than jobs x vocabulary.
+    """
+    if not jobs:
+        return []
+
+    vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    freqs: list[int] = []
+    for row, job in enumerate(jobs):
+        counts = Counter(_tokenize(" ".join([job.title, job.description, *job.skills])))
+        for term, count in counts.items():
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+            freqs.append(count)
+
+    text_scores = np.zeros(len(jobs))
+    if vocabulary:
+        row_idx = np.asarray(rows, dtype=np.intp)
+        col_idx = np.asarray(cols, dtype=np.intp)
+        tf = np.asarray(freqs, dtype=np.float64)
+
+        doc_count = len(jobs)
+        df = np.bincount(col_idx, minlength=len(vocabulary))
+        idf = np.log1p((doc_count - df + 0.5) / (df + 0.5))
+        doc_length = np.bincount(row_idx, weights=tf, minlength=doc_count)
+        avg_length = doc_length.mean() or 1.0
+        norm = k1 * (1 - b + b * doc_length[row_idx] / avg_length)
+        weights = idf[col_idx] * tf * (k1 + 1) / (tf + norm)
+
+        in_cv = np.zeros(len(vocabulary), dtype=bool)
+        cv_terms = [vocabulary[term] for term in set(_tokenize(cv_text)) if term in vocabulary]
+        in_cv[cv_terms] = True
+
+        total = np.bincount(row_idx, weights=weights, minlength=doc_count)
+        covered = np.bincount(row_idx, weights=weights * in_cv[col_idx], minlength=doc_count)
+        text_scores = np.divide(covered, total, out=np.zeros(doc_count), where=total > 0)
+
+    # Resolve each distinct skill against the CV once, then split every job's list by lookup.
+    job_skills = [canonicalize_skills(job.skills) for job in jobs]
+    cv_matches, _ = match_skills(
+        {skill for skills in job_skills for skill in skills},
+        cv_text,
+        cv_skills=set(get_skill_matcher().extract(cv_text)),
+    )
+    in_cv_skills = set(cv_matches)
+    skill_splits = [
+        (
+            [skill for skill in skills if skill in in_cv_skills],
+            [skill for skill in skills if skill not in in_cv_skills],
+        )
+        for skills in job_skills
+    ]
+    skill_scores = np.array(
+        [len(matched) / (len(matched) + len(missing)) if matched or missing else np.nan for matched, missing in skill_splits]
+    )
+    has_skills = ~np.isnan(skill_scores)
+    combined = np.where(
+        has_skills,
+        skill_weight * np.nan_to_num(skill_scores) + (1 - skill_weight) * text_scores,
+        text_scores,
+    )
+
+    order = np.argsort(-combined, kind="stable")
+    return [
+        JobRanking(
+            index=int(index),
+            score=int(round(combined[index] * 100)),
+            text_score=round(float(text_scores[index]), 4),
+            skill_score=round(float(skill_scores[index]), 4) if has_skills[index] else None,
+            matched_skills=skill_splits[index][0],
+            missing_skills=skill_splits[index][1],
+        )
+        for index in order
+    ]
+
+
+def _tokenize(text: str) -> list[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
@@ -1,4 +1,62 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+"""Per-client request rate limiting for inbound API traffic."""
+from __future__ import annotations
 
-limiter = Limiter(key_func=get_remote_address)
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from core.resilience import Clock, TokenBucket
+
+__all__ = ["RateLimit", "RateLimiter"]
+
+_RATE_RE = re.compile(r"^\s*(\d+)\s*(?:/|per)\s*(\d+)?\s*(second|minute|hour|day)s?\s*$", re.IGNORECASE)
+_PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimit:
+    """`count` requests per `period` seconds, parsed from strings such as "10/minute"."""
+
+    count: int
+    period: float
+
+    @classmethod
+    def parse(cls, value: str) -> RateLimit:
+        match = _RATE_RE.match(value)
+        if match is None:
+            raise ValueError(f"Invalid rate limit {value!r}; expected e.g. '10/minute' or '100 per 5 minutes'")
+        count, multiplier, unit = match.groups()
+        return cls(count=int(count), period=int(multiplier or 1) * _PERIOD_SECONDS[unit.lower()])
+
+    def __str__(self) -> str:
+        return f"{self.count} per {self.period:g} seconds"
+
+
+class RateLimiter:
+    """Token buckets keyed by (scope, client): `count` tokens refilled evenly over `period`.
+
+    Idle buckets are evicted least-recently-used beyond `max_keys`, so memory stays bounded
+    however many clients are seen.
+    """
+
+    def __init__(self, *, max_keys: int = 10_000, clock: Clock = time.monotonic) -> None:
+        self._buckets: OrderedDict[tuple[str, str], TokenBucket] = OrderedDict()
+        self._max_keys = max_keys
+        self._clock = clock
+
+    def hit(self, scope: str, client: str, limit: RateLimit) -> float:
+        """Count one request; return 0 when allowed, otherwise seconds until it would be."""
+        key = (scope, client)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate=limit.count / limit.period, capacity=limit.count, clock=self._clock)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.try_take()
+
+    def reset(self) -> None:
+        self._buckets.clear()
@@ -0,0 +1,194 @@
+"""Rate pacing and circuit breaking primitives shared by outbound clients."""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Callable
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "OutcomeWindow", "TokenBucket"]
+
+Clock = Callable[[], float]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because its circuit is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit for '{name}' is open; retry in {retry_after:.1f}s")
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second with bursts of up to `capacity`.
+
+    Callers reserve a token immediately (the balance may go negative) and then sleep
+    until their reservation matures, so concurrent waiters are served in FIFO order
+    without polling.
+    """
+
+    def __init__(self, *, rate: float, capacity: int, clock: Clock = time.monotonic) -> None:
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive")
+        if capacity < 1:
+            raise ValueError("TokenBucket capacity must be at least 1")
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait for it."""
+        self._refill()
+        self._tokens -= 1.0
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self._rate
+
+    def try_take(self) -> float:
+        """Take a token if one is available and return 0, else return seconds until one is."""
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return 0.0
+        return (1.0 - self._tokens) / self._rate
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._updated_at = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+
+class CircuitBreaker:
+    """Closed → open after `failure_threshold` consecutive failures → half-open after `cooldown`.
+
+    While half-open a single probe call is admitted; its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self._cooldown:
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def probing(self) -> bool:
+        """Whether the half-open probe has been admitted and its outcome is not known yet."""
+        return self._probe_in_flight
+
+    def retry_after(self) -> float:
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self._cooldown - (self._clock() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed, admitting one probe once the cool-down elapsed."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = True
+            return True
+        self._rejected += 1
+        return False
+
+    def check(self) -> None:
+        """Like `allow` but raises `CircuitOpenError` when the call is rejected."""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_after() or self._cooldown)
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == self.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Forget an admitted probe whose outcome is unknown (e.g. the call was cancelled)."""
+        if self._probe_in_flight:
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "rejected": self._rejected,
+            "retry_after": round(self.retry_after(), 3),
+        }
+
+
+class OutcomeWindow:
+    """The latencies and success flags of the last `size` calls."""
+
+    def __init__(self, size: int = 20) -> None:
+        if size < 1:
+            raise ValueError("OutcomeWindow size must be at least 1")
+        self._samples: deque[tuple[float, bool]] = deque(maxlen=size)
+
+    def record(self, latency: float, *, ok: bool) -> None:
+        self._samples.append((latency, ok))
+
+    def percentile(self, quantile: float = 0.95) -> float:
+        """Nearest-rank latency percentile over the window (failed calls included)."""
+        if not self._samples:
+            return 0.0
+        latencies = sorted(latency for latency, _ in self._samples)
+        return latencies[max(0, math.ceil(quantile * len(latencies)) - 1)]
+
+    def error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    def __len__(self) -> int:
+        return len(self._samples)
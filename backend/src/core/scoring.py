@@ -2,31 +2,45 @@
 from __future__ import annotations
 
 import re
+from typing import Iterable
+
+from core.skills import canonicalize_skills, get_skill_matcher
 
 
 def calculate_heuristic_score(job_skills: list[str], cv_text: str) -> int:
     """
     Calculate a baseline compatibility score (0-100) based on skill presence in the CV.
 
-    This is a simple heuristic that checks for the existence of job skills in the CV text.
-    It is case-insensitive.
+    Job skills are canonicalized and the CV is scanned once for known skills, so aliases
+    ("JS", "Javascript") count as the same skill. Skills outside the taxonomy fall back to a
+    case-insensitive whole-word search.
     """
-    if not job_skills:
+    matched, missing = match_skills(job_skills, cv_text)
+    if not matched:
         return 0
 
-    cv_lower = cv_text.lower()
-    match_count = 0
+    # Calculate percentage
+    score = (len(matched) / (len(matched) + len(missing))) * 100
+    return min(int(score), 100)
 
-    for skill in job_skills:
-        # Simple substring match, could be improved with regex for word boundaries
-        # Escaping skill to avoid regex errors if it contains special chars
-        pattern = r"\b" + re.escape(skill.lower()) + r"\b"
-        if re.search(pattern, cv_lower):
-            match_count += 1
 
-    if match_count == 0:
-        return 0
+def match_skills(
+    job_skills: Iterable[str], cv_text: str, *, cv_skills: set[str] | None = None
+) -> tuple[list[str], list[str]]:
+    """Split canonicalized job skills into those the CV mentions and those it does not.
 
-    # Calculate percentage
-    score = (match_count / len(job_skills)) * 100
-    return min(int(score), 100)
+    `cv_skills` lets callers scoring many jobs against one CV extract its skills only once.
+    """
+    if cv_skills is None:
+        cv_skills = set(get_skill_matcher().extract(cv_text))
+    cv_lower = cv_text.lower()
+    matched: list[str] = []
+    missing: list[str] = []
+    for skill in canonicalize_skills(job_skills):
+        # Escaping skill to avoid regex errors if it contains special chars
+        pattern = r"\b" + re.escape(skill.lower()) + r"\b"
+        if skill in cv_skills or re.search(pattern, cv_lower):
+            matched.append(skill)
+        else:
+            missing.append(skill)
+    return matched, missing
@@ -0,0 +1,153 @@
+"""Canonical skill taxonomy and single-pass skill extraction from free text."""
+from __future__ import annotations
+
+import json
+import re
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator
+
+__all__ = ["SkillMatcher", "TAXONOMY_PATH", "canonicalize_skills", "get_skill_matcher"]
+
+TAXONOMY_PATH = Path(__file__).with_name("skill_taxonomy.json")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class _Automaton:
+    """Aho-Corasick automaton over lower-cased patterns; each pattern maps to a canonical name."""
+
+    def __init__(self, patterns: dict[str, str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[int, str]]] = [[]]
+        for pattern, canonical in patterns.items():
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(pattern), canonical))
+
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def matches(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """Yield `(start, end, canonical)` for every pattern occurrence, in one pass over `text`."""
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, canonical in self._output[state]:
+                yield index - length + 1, index + 1, canonical
+
+
+class SkillMatcher:
+    """Maps skill aliases to canonical names and finds known skills in descriptions and CVs.
+
+    Aliases listed as ambiguous ("go", "r", "spring", ...) still canonicalize explicit skill
+    entries but are not matched in free text, where they are usually ordinary words.
+    """
+
+    def __init__(self, taxonomy: dict[str, list[str]], *, ambiguous: Iterable[str] = ()) -> None:
+        self._canonical: dict[str, str] = {}
+        for name, aliases in taxonomy.items():
+            for alias in (name, *aliases):
+                self._canonical.setdefault(_key(alias), name)
+        skipped = {_key(alias) for alias in ambiguous}
+        self._automaton = _Automaton(
+            {alias: name for alias, name in self._canonical.items() if alias not in skipped}
+        )
+
+    @classmethod
+    def from_file(cls, path: Path = TAXONOMY_PATH) -> SkillMatcher:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        taxonomy = {entry["name"]: list(entry.get("aliases", [])) for entry in data["skills"]}
+        return cls(taxonomy, ambiguous=data.get("ambiguous", []))
+
+    def canonical(self, skill: str) -> str:
+        """Return the canonical name of `skill`, or the trimmed input when it is not in the taxonomy."""
+        cleaned = " ".join(skill.split())
+        return self._canonical.get(cleaned.lower(), cleaned)
+
+    def is_known(self, skill: str) -> bool:
+        return _key(skill) in self._canonical
+
+    def extract(self, text: str, *, limit: int | None = None) -> list[str]:
+        """Return the canonical skills mentioned in `text`, in order of first appearance.
+
+        Matches must sit on word boundaries; where matches overlap the longest one wins, so
+        "React Native" is not also reported as "React".
+        """
+        haystack = _key(text)
+        candidates = [
+            match for match in self._automaton.matches(haystack) if _on_boundary(haystack, match[0], match[1])
+        ]
+        candidates.sort(key=lambda match: (match[0], match[0] - match[1]))
+        found: list[str] = []
+        seen: set[str] = set()
+        covered_until = 0
+        for start, end, canonical in candidates:
+            if start < covered_until:
+                continue
+            covered_until = end
+            if canonical not in seen:
+                seen.add(canonical)
+                found.append(canonical)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """Return the process-wide matcher built from the bundled taxonomy."""
+    return SkillMatcher.from_file()
+
+
+def canonicalize_skills(values: Iterable[str]) -> list[str]:
+    """Canonicalize skill names and drop blanks and duplicates, keeping first-seen order."""
+    matcher = get_skill_matcher()
+    seen: set[str] = set()
+    unique: list[str] = []
+    for value in values:
+        canonical = matcher.canonical(value)
+        key = canonical.lower()
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        unique.append(canonical)
+    return unique
+
+
+def _key(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def _on_boundary(text: str, start: int, end: int) -> bool:
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    # Symbols inside a skill ("c++", "ci/cd") are part of the alias; only letters and digits
+    # glued to either end mean the match is a fragment of a longer word.
+    if text[start].isalnum() and (before.isalnum() or before in "_."):
+        return False
+    if text[end - 1].isalnum() and (after.isalnum() or after in "_+#"):
+        return False
+    if not text[end - 1].isalnum() and after.isalnum():
+        return False
+    return True
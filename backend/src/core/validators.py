@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Iterable, Sequence
 from urllib.parse import urlparse
 
+from core.skills import canonicalize_skills, get_skill_matcher
 from services.scraper import ScrapedJob
 
 __all__ = ["ValidationIssue", "ValidationError", "JobValidator"]
@@ -203,27 +204,23 @@ class JobValidator:
         cleaned_skills = self._dedupe(skill.strip() for skill in job.skills if isinstance(skill, str))
         cleaned_skills = [skill for skill in cleaned_skills if skill]
 
-        return ScrapedJob(
+        return replace(
+            job,
             url=job.url.strip(),
             board=job.board.lower(),
             title=clean_title,
             company=clean_company,
             description=clean_description,
             skills=cleaned_skills,
-            raw_html=job.raw_html,
         )
 
     @staticmethod
     def _dedupe(values: Iterable[str]) -> list[str]:
-        seen: set[str] = set()
-        result: list[str] = []
-        for value in values:
-            key = value.lower()
-            if not key or key in seen:
-                continue
-            seen.add(key)
-            result.append(value if value[:1].isupper() else value.capitalize())
-        return result
+        matcher = get_skill_matcher()
+        return [
+            value if matcher.is_known(value) or value[:1].isupper() else value.capitalize()
+            for value in canonicalize_skills(values)
+        ]
 
     @staticmethod
     def _issue(layer: str, field: str, message: str, code: str) -> ValidationIssue:
@@ -1,19 +1,31 @@
 """Service layer modules."""
 
+from .cv_store import CvStore, cv_fingerprint
+from .host_scheduler import HostPolicy, HostScheduler
 from .scraper import (
+	CompressedHtml,
 	FetchError,
+	HostUnavailableError,
 	ParseError,
 	ScrapedJob,
 	ScraperError,
 	UnsupportedJobBoardError,
 	WebScraperService,
 )
+from .usage_ledger import UsageLedger
 
 __all__ = [
+	"CompressedHtml",
+	"CvStore",
 	"FetchError",
+	"HostPolicy",
+	"HostScheduler",
+	"HostUnavailableError",
 	"ParseError",
 	"ScrapedJob",
 	"ScraperError",
 	"UnsupportedJobBoardError",
+	"UsageLedger",
 	"WebScraperService",
+	"cv_fingerprint",
 ]
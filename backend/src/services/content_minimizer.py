@@ -0,0 +1,106 @@
+"""Reduce job pages to their main readable text before they reach an LLM prompt."""
+from __future__ import annotations
+
+import re
+
+from bs4 import BeautifulSoup, Tag
+
+__all__ = ["estimate_tokens", "minimize_html", "novel_text"]
+
+_NOISE_TAGS = ["script", "style", "noscript", "template", "svg", "iframe", "form", "nav", "footer", "header", "aside"]
+_TEXT_BLOCK_TAGS = ["p", "li", "pre", "td", "dd", "blockquote", "h2", "h3", "h4"]
+_POSITIVE_HINTS = re.compile(r"article|body|content|description|details|job|main|post|posting|text", re.IGNORECASE)
+_NEGATIVE_HINTS = re.compile(
+    r"banner|comment|cookie|footer|menu|modal|nav|promo|related|share|sidebar|social|sponsor|widget",
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"[ \t\r\f\v ]+")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_MIN_BLOCK_CHARS = 25
+# Rough characters-per-token ratio for Latin-script text with Gemini/GPT-style tokenizers.
+_CHARS_PER_TOKEN = 4
+
+
+def minimize_html(html: str, *, limit: int = 2000) -> str:
+    """Return the compact text of the page's densest content region, capped at `limit` chars.
+
+    Candidates are scored readability-style: every text block adds points (length and commas)
+    to its parent and half to its grandparent, class/id hints nudge the score, and the result
+    is scaled down by the candidate's link density.
+    """
+    if not html:
+        return ""
+    soup = BeautifulSoup(html, "html.parser")
+    for node in soup(_NOISE_TAGS):
+        node.decompose()
+
+    scores: dict[int, float] = {}
+    nodes: dict[int, Tag] = {}
+    for block in soup.find_all(_TEXT_BLOCK_TAGS):
+        text = block.get_text(" ", strip=True)
+        if len(text) < _MIN_BLOCK_CHARS:
+            continue
+        points = 1 + text.count(",") + min(len(text) / 100, 3)
+        for ancestor, weight in ((block.parent, 1.0), (block.parent.parent if block.parent else None, 0.5)):
+            if not isinstance(ancestor, Tag):
+                continue
+            key = id(ancestor)
+            if key not in scores:
+                nodes[key] = ancestor
+                scores[key] = _hint_score(ancestor)
+            scores[key] += points * weight
+
+    root: Tag | None = soup.body or soup
+    if scores:
+        best_key = max(scores, key=lambda key: scores[key] * (1 - _link_density(nodes[key])))
+        root = nodes[best_key]
+    return _compact(root.get_text("\n", strip=True) if root else "", limit)
+
+
+def novel_text(excerpt: str, reference: str, *, max_overlap: float = 0.8) -> str:
+    """Return `excerpt` unless at least `max_overlap` of its words already appear in `reference`."""
+    words = _WORD_RE.findall(excerpt.lower())
+    if not words:
+        return ""
+    known = set(_WORD_RE.findall(reference.lower()))
+    overlap = sum(1 for word in words if word in known) / len(words)
+    return "" if overlap >= max_overlap else excerpt
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap, tokenizer-free estimate of how many prompt tokens `text` costs."""
+    return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _hint_score(node: Tag) -> float:
+    hints = " ".join([*node.get("class", []), str(node.get("id", ""))])
+    score = 0.0
+    if _POSITIVE_HINTS.search(hints):
+        score += 25
+    if _NEGATIVE_HINTS.search(hints):
+        score -= 25
+    if node.name in {"article", "main"}:
+        score += 10
+    return score
+
+
+def _link_density(node: Tag) -> float:
+    text_length = len(node.get_text(strip=True))
+    if not text_length:
+        return 1.0
+    link_length = sum(len(link.get_text(strip=True)) for link in node.find_all("a"))
+    return min(1.0, link_length / text_length)
+
+
+def _compact(text: str, limit: int) -> str:
+    lines: list[str] = []
+    for raw_line in text.splitlines():
+        line = _WHITESPACE_RE.sub(" ", raw_line).strip()
+        if line and (not lines or lines[-1] != line):
+            lines.append(line)
+    compact = "\n".join(lines)
+    if len(compact) <= limit:
+        return compact
+    room = limit - len(" …")
+    cut = compact.rfind(" ", 0, room + 1)
+    return compact[: cut if cut > 0 else room].rstrip() + " …"
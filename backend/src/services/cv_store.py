@@ -0,0 +1,65 @@
+"""Server-side storage of extracted CV text, referenced by a content fingerprint."""
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+from core.resilience import Clock
+
+__all__ = ["CvStore", "StoredCv", "cv_fingerprint"]
+
+
+def cv_fingerprint(text: str) -> str:
+    """Stable identifier for a CV's text; identical uploads map to the same ID."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass(slots=True, frozen=True)
+class StoredCv:
+    """A stored CV and when it was last written or read."""
+
+    cv_id: str
+    text: str
+    filename: str | None
+    touched_at: float
+
+
+class CvStore:
+    """Bounded LRU of extracted CV texts with a sliding expiry.
+
+    The store is per-process memory: with several workers a `cvId` is only valid on the
+    worker that issued it, so callers must be ready to re-upload when a lookup misses.
+    """
+
+    def __init__(self, *, max_entries: int = 256, ttl_seconds: float = 86_400.0, clock: Clock = time.monotonic) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, StoredCv] = OrderedDict()
+
+    def put(self, text: str, *, filename: str | None = None) -> str:
+        cv_id = cv_fingerprint(text)
+        self._entries[cv_id] = StoredCv(cv_id=cv_id, text=text, filename=filename, touched_at=self._clock())
+        self._entries.move_to_end(cv_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return cv_id
+
+    def get(self, cv_id: str) -> StoredCv | None:
+        """Return the stored CV and refresh its expiry, or `None` when unknown or expired."""
+        entry = self._entries.get(cv_id)
+        if entry is None:
+            return None
+        now = self._clock()
+        if now - entry.touched_at > self._ttl:
+            del self._entries[cv_id]
+            return None
+        entry = replace(entry, touched_at=now)
+        self._entries[cv_id] = entry
+        self._entries.move_to_end(cv_id)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,53 +1,133 @@
 """Service for extracting text from various document formats."""
+import asyncio
 import io
-from typing import BinaryIO
+from concurrent.futures import Executor
+from functools import partial
+from typing import BinaryIO, Callable
 
-import pypdf
-from docx import Document
 from fastapi import UploadFile, HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from services.docx_text import extract_docx_text
+from services.pdf_backends import PdfOptions, select_backend
+from services.text_cache import ExtractedTextCache, hash_stream
+
+
+# Bump when extraction output changes so cached texts from older parsers are not reused.
+PARSER_VERSION = "2"
+
+_DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+Parser = Callable[[BinaryIO], tuple[str, bool]]
+
+
+def _complete(parse: Callable[[BinaryIO], str], file_obj: BinaryIO) -> tuple[str, bool]:
+    return parse(file_obj), True
+
+
+def _parse_bytes(parse: Parser, data: bytes) -> tuple[str, bool]:
+    # Runs in a pool worker process: parsers and their options are pickled, the upload is sent as bytes.
+    return parse(io.BytesIO(data))
 
 
 class DocumentProcessor:
     """Handles text extraction from uploaded files."""
 
     @staticmethod
-    def extract_text(file: UploadFile) -> str:
-        """Extract text from an uploaded file based on its content type."""
-        content_type = file.content_type
-        filename = file.filename.lower() if file.filename else ""
+    def extract_text(
+        file: UploadFile,
+        *,
+        cache: ExtractedTextCache | None = None,
+        pdf_options: PdfOptions | None = None,
+    ) -> str:
+        """Extract text from an uploaded file based on its content type.
 
+        With a `cache`, the upload is hashed chunk by chunk first and a previously seen
+        document is answered from the cache without parsing. PDFs truncated by their time
+        budget are not cached.
+        """
+        kind, parse = DocumentProcessor._parser(file, pdf_options or PdfOptions())
         try:
-            if content_type == "application/pdf" or filename.endswith(".pdf"):
-                return DocumentProcessor._extract_from_pdf(file.file)
-            elif (
-                content_type
-                == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                or filename.endswith(".docx")
-            ):
-                return DocumentProcessor._extract_from_docx(file.file)
-            elif content_type == "text/plain" or filename.endswith(".txt"):
-                return DocumentProcessor._extract_from_txt(file.file)
+            key, cached = DocumentProcessor._lookup(file.file, cache, kind)
+            if cached is not None:
+                return cached
+            text, complete = parse(file.file)
+            if key is not None and complete:
+                cache.put(key, text)
+            return text
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error processing file: {str(e)}"
+            )
+
+    @staticmethod
+    async def extract_text_async(
+        file: UploadFile,
+        *,
+        cache: ExtractedTextCache | None = None,
+        pdf_options: PdfOptions | None = None,
+        executor: Executor | None = None,
+    ) -> str:
+        """`extract_text` without blocking the event loop.
+
+        Hashing and cache access run on the thread pool. Parsing runs on `executor` (a
+        process pool, so CPU-bound PDF parsing does not contend for this worker's GIL)
+        or, without one, on the thread pool too.
+        """
+        kind, parse = DocumentProcessor._parser(file, pdf_options or PdfOptions())
+        try:
+            key, cached = await run_in_threadpool(DocumentProcessor._lookup, file.file, cache, kind)
+            if cached is not None:
+                return cached
+            if executor is None:
+                text, complete = await run_in_threadpool(parse, file.file)
             else:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unsupported file type: {content_type}. Supported formats: PDF, DOCX, TXT",
-                )
+                data = await run_in_threadpool(file.file.read)
+                text, complete = await asyncio.get_running_loop().run_in_executor(executor, _parse_bytes, parse, data)
+            if key is not None and complete:
+                await run_in_threadpool(cache.put, key, text)
+            return text
         except Exception as e:
-            if isinstance(e, HTTPException):
-                raise e
             raise HTTPException(
                 status_code=500, detail=f"Error processing file: {str(e)}"
             )
 
     @staticmethod
-    def _extract_from_pdf(file_obj: BinaryIO) -> str:
-        """Extract text from a PDF file."""
+    def _parser(file: UploadFile, pdf_options: PdfOptions) -> tuple[str, Parser]:
+        """Pick the parser for the upload's type, with the cache kind its output is stored under."""
+        content_type = file.content_type
+        filename = file.filename.lower() if file.filename else ""
+        if content_type == "application/pdf" or filename.endswith(".pdf"):
+            # Backends and page limits produce different text, so both are part of the key.
+            kind = f"pdf-{select_backend(pdf_options.backend).name}-{pdf_options.max_pages}"
+            return kind, partial(DocumentProcessor._extract_from_pdf, options=pdf_options)
+        if content_type == _DOCX_CONTENT_TYPE or filename.endswith(".docx"):
+            return "docx", partial(_complete, DocumentProcessor._extract_from_docx)
+        if content_type == "text/plain" or filename.endswith(".txt"):
+            return "txt", partial(_complete, DocumentProcessor._extract_from_txt)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type: {content_type}. Supported formats: PDF, DOCX, TXT",
+        )
+
+    @staticmethod
+    def _lookup(file_obj: BinaryIO, cache: ExtractedTextCache | None, kind: str) -> tuple[str | None, str | None]:
+        """Return the upload's cache key and cached text (both None without a cache)."""
+        if cache is None:
+            return None, None
+        key = cache.key(hash_stream(file_obj), kind=kind, parser_version=PARSER_VERSION)
+        return key, cache.get(key)
+
+    @staticmethod
+    def _extract_from_pdf(file_obj: BinaryIO, options: PdfOptions | None = None) -> tuple[str, bool]:
+        """Extract text from a PDF file; the flag is False when the time budget cut it short."""
+        options = options or PdfOptions()
         try:
-            reader = pypdf.PdfReader(file_obj)
-            text = []
-            for page in reader.pages:
-                text.append(page.extract_text())
-            return "\n".join(text)
+            result = select_backend(options.backend).extract(
+                file_obj, max_pages=options.max_pages, page_time_budget=options.page_time_budget
+            )
+            return result.text, not result.truncated
         except Exception as e:
             raise ValueError(f"Failed to parse PDF: {str(e)}")
 
@@ -55,8 +135,7 @@ class DocumentProcessor:
     def _extract_from_docx(file_obj: BinaryIO) -> str:
         """Extract text from a DOCX file."""
         try:
-            doc = Document(file_obj)
-            return "\n".join([paragraph.text for paragraph in doc.paragraphs])
+            return extract_docx_text(file_obj)
         except Exception as e:
             raise ValueError(f"Failed to parse DOCX: {str(e)}")
 
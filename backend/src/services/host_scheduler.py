@@ -0,0 +1,120 @@
+"""Per-host politeness scheduling for outbound scraping requests."""
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+import structlog
+
+from core.resilience import CircuitBreaker, Clock, TokenBucket
+
+__all__ = ["HostPolicy", "HostScheduler"]
+
+LOGGER = structlog.get_logger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class HostPolicy:
+    """Pacing and failure tolerance applied to a single host."""
+
+    rate_per_second: float = 1.0
+    burst: int = 3
+    max_connections: int = 2
+    failure_threshold: int = 3
+    cooldown_seconds: float = 30.0
+
+
+@dataclass(slots=True)
+class _HostState:
+    bucket: TokenBucket
+    semaphore: asyncio.Semaphore
+    breaker: CircuitBreaker
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+
+
+class HostScheduler:
+    """Token-bucket pacing, connection caps and a circuit breaker per remote host.
+
+    Use `slot(host)` around each outbound request: it raises `CircuitOpenError` without
+    touching the network while the host's circuit is open, waits for a connection slot
+    and a pacing token otherwise, and records the outcome of the wrapped block.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: HostPolicy | None = None,
+        overrides: dict[str, HostPolicy] | None = None,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self._policy = policy or HostPolicy()
+        self._overrides = {host.lower(): value for host, value in (overrides or {}).items()}
+        self._clock = clock
+        self._hosts: dict[str, _HostState] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        state = self._state(host)
+        state.breaker.check()
+        outcome_recorded = False
+        try:
+            async with state.semaphore:
+                await state.bucket.acquire()
+                state.in_flight += 1
+                state.requests += 1
+                try:
+                    yield
+                finally:
+                    state.in_flight -= 1
+        except Exception:
+            state.failures += 1
+            state.breaker.record_failure()
+            outcome_recorded = True
+            if state.breaker.state != CircuitBreaker.CLOSED:
+                LOGGER.warning("host_scheduler.circuit_open", host=host, **state.breaker.snapshot())
+            raise
+        else:
+            state.breaker.record_success()
+            outcome_recorded = True
+        finally:
+            if not outcome_recorded:
+                state.breaker.release()
+
+    def policy_for(self, host: str) -> HostPolicy:
+        return self._overrides.get(host.lower(), self._policy)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return per-host pacing and breaker state for metrics."""
+        return {
+            host: {
+                **state.breaker.snapshot(),
+                "in_flight": state.in_flight,
+                "requests": state.requests,
+                "failures": state.failures,
+                "tokens": round(state.bucket.tokens, 3),
+            }
+            for host, state in self._hosts.items()
+        }
+
+    def _state(self, host: str) -> _HostState:
+        key = host.lower()
+        state = self._hosts.get(key)
+        if state is None:
+            policy = self.policy_for(key)
+            state = _HostState(
+                bucket=TokenBucket(rate=policy.rate_per_second, capacity=policy.burst, clock=self._clock),
+                semaphore=asyncio.Semaphore(policy.max_connections),
+                breaker=CircuitBreaker(
+                    name=key,
+                    failure_threshold=policy.failure_threshold,
+                    cooldown=policy.cooldown_seconds,
+                    clock=self._clock,
+                ),
+            )
+            self._hosts[key] = state
+        return state
@@ -0,0 +1,162 @@
+"""Interchangeable PDF text-extraction backends with availability-based selection."""
+from __future__ import annotations
+
+import io
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+import pypdf
+import structlog
+
+from core.metrics import metrics
+
+try:  # pragma: no cover - optional dependency wiring
+    import pypdfium2 as pdfium  # type: ignore
+except Exception:  # pragma: no cover - library is optional
+    pdfium = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency wiring
+    from pdfminer.high_level import extract_pages as pdfminer_extract_pages  # type: ignore
+    from pdfminer.layout import LTTextContainer  # type: ignore
+except Exception:  # pragma: no cover - library is optional
+    pdfminer_extract_pages = None  # type: ignore[assignment]
+    LTTextContainer = None  # type: ignore[assignment,misc]
+
+__all__ = [
+    "AUTO_BACKEND_ORDER",
+    "PageReader",
+    "PdfBackend",
+    "PdfExtraction",
+    "PdfOptions",
+    "available_backends",
+    "select_backend",
+]
+
+LOGGER = structlog.get_logger(__name__)
+
+# Fastest first: pdfium is a C++ engine, pdfminer.six and pypdf are pure Python.
+AUTO_BACKEND_ORDER = ("pdfium", "pdfminer", "pypdf")
+
+
+@dataclass(slots=True)
+class PdfExtraction:
+    """Extracted text plus how much of the document it covers.
+
+    `truncated` means the time budget stopped extraction early, so another attempt may
+    read more. A cut at `max_pages` is deterministic and shows as `page_limited`.
+    """
+
+    text: str
+    pages: int
+    total_pages: int | None
+    truncated: bool
+
+    @property
+    def page_limited(self) -> bool:
+        return self.total_pages is not None and self.pages < self.total_pages and not self.truncated
+
+
+@dataclass(slots=True, frozen=True)
+class PdfOptions:
+    """Backend choice and limits applied to uploaded PDFs."""
+
+    backend: str = "auto"
+    max_pages: int = 20
+    page_time_budget: float | None = 2.0
+
+
+# Opens a document and returns its page count (when cheap to know) and a lazy iterator over
+# the text of at most `max_pages` pages.
+PageReader = Callable[[BinaryIO, int], tuple[int | None, Iterator[str]]]
+
+
+@dataclass(slots=True, frozen=True)
+class PdfBackend:
+    """A named PDF text extractor built on one library."""
+
+    name: str
+    read_pages: PageReader
+
+    def extract(self, file_obj: BinaryIO, *, max_pages: int = 20, page_time_budget: float | None = None) -> PdfExtraction:
+        """Extract up to `max_pages` pages.
+
+        With `page_time_budget`, the document may spend `page_time_budget` seconds per page
+        read so far; once over, extraction stops at the next page boundary and the result is
+        marked truncated. Slow pages are not interrupted, only the pages after them skipped.
+        """
+        started = time.perf_counter()
+        total, pages = self.read_pages(file_obj, max_pages)
+        texts: list[str] = []
+        truncated = False
+        for text in pages:
+            texts.append(text)
+            if page_time_budget is not None and time.perf_counter() - started > page_time_budget * len(texts):
+                truncated = len(texts) < (min(total, max_pages) if total is not None else max_pages)
+                if truncated:
+                    metrics.increment("pdf.time_budget_exceeded")
+                    LOGGER.warning("pdf.time_budget_exceeded", backend=self.name, pages=len(texts))
+                break
+        close = getattr(pages, "close", None)
+        if close is not None:  # release the document when stopping early
+            close()
+        return PdfExtraction(text="\n".join(texts), pages=len(texts), total_pages=total, truncated=truncated)
+
+
+def _pypdf_pages(file_obj: BinaryIO, max_pages: int) -> tuple[int | None, Iterator[str]]:
+    reader = pypdf.PdfReader(file_obj)
+    return len(reader.pages), (page.extract_text() or "" for page in reader.pages[:max_pages])
+
+
+def _pdfium_pages(file_obj: BinaryIO, max_pages: int) -> tuple[int | None, Iterator[str]]:
+    document = pdfium.PdfDocument(file_obj.read())
+    total = len(document)
+
+    def texts() -> Iterator[str]:
+        try:
+            for index in range(min(total, max_pages)):
+                page = document[index]
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range().replace("\r\n", "\n")
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            document.close()
+
+    return total, texts()
+
+
+def _pdfminer_pages(file_obj: BinaryIO, max_pages: int) -> tuple[int | None, Iterator[str]]:
+    # pdfminer only learns the page count by walking the whole page tree, so it is not reported.
+    layouts = pdfminer_extract_pages(io.BytesIO(file_obj.read()), maxpages=max_pages)
+    return None, (
+        "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer)).strip()
+        for layout in layouts
+    )
+
+
+_BACKENDS: dict[str, PdfBackend] = {"pypdf": PdfBackend("pypdf", _pypdf_pages)}
+if pdfium is not None:  # pragma: no branch
+    _BACKENDS["pdfium"] = PdfBackend("pdfium", _pdfium_pages)
+if pdfminer_extract_pages is not None:  # pragma: no branch
+    _BACKENDS["pdfminer"] = PdfBackend("pdfminer", _pdfminer_pages)
+
+
+def available_backends() -> list[str]:
+    """Names of installed backends, fastest first."""
+    return [name for name in AUTO_BACKEND_ORDER if name in _BACKENDS]
+
+
+def select_backend(preferred: str = "auto", *, order: Iterable[str] = AUTO_BACKEND_ORDER) -> PdfBackend:
+    """Return the `preferred` backend, or the fastest installed one for "auto" or when it is missing."""
+    if preferred != "auto":
+        backend = _BACKENDS.get(preferred)
+        if backend is not None:
+            return backend
+        LOGGER.warning("pdf.backend_unavailable", requested=preferred, available=available_backends())
+    for name in order:
+        if name in _BACKENDS:
+            return _BACKENDS[name]
+    return _BACKENDS["pypdf"]
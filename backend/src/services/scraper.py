@@ -1,23 +1,84 @@
 """Web scraping utilities for supported job boards."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import html as html_lib
+import re
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from textwrap import shorten
 from typing import Callable, Iterable
 from urllib.parse import urlparse
 
 import httpx
+import structlog
 from bs4 import BeautifulSoup
 
+from core.metrics import metrics
+from core.resilience import CircuitOpenError
+from core.skills import canonicalize_skills, get_skill_matcher
+from services.host_scheduler import HostScheduler
+from services.structured_data import (
+    JobPostingData,
+    parse_gupy_next_data,
+    parse_indeed_initial_data,
+    parse_job_posting,
+)
+
 
 __all__ = [
+    "CompressedHtml",
     "ScrapedJob",
     "ScraperError",
     "FetchError",
+    "HostUnavailableError",
     "ParseError",
     "UnsupportedJobBoardError",
+    "PREVIEW_CHARS",
     "WebScraperService",
+    "content_preview",
 ]
 
+LOGGER = structlog.get_logger(__name__)
+
+_LINKEDIN_JOB_ID_RE = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)|[?&]currentJobId=(\d+)")
+_LINKEDIN_GUEST_FRAGMENT_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+PREVIEW_CHARS = 2000
+# Previews scan at most `limit * _PREVIEW_SCAN_FACTOR` leading characters of a document.
+_PREVIEW_SCAN_FACTOR = 4
+# Matches the validator's default skill cap.
+_MAX_EXTRACTED_SKILLS = 25
+# Browser-like User-Agent: some boards block default HTTP client agents.
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+_NON_CONTENT_RE = re.compile(r"<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def content_preview(html: str, limit: int = PREVIEW_CHARS) -> str:
+    """Markup-free, whitespace-collapsed preview computed over a bounded prefix of the document."""
+    if not html:
+        return ""
+    prefix = html[: limit * _PREVIEW_SCAN_FACTOR]
+    text = html_lib.unescape(_TAG_RE.sub(" ", _NON_CONTENT_RE.sub(" ", prefix)))
+    return shorten(text, width=limit, placeholder=" …")
+
+
+@dataclass(slots=True, frozen=True)
+class CompressedHtml:
+    """zlib-compressed copy of a fetched document, decompressed only when requested."""
+
+    data: bytes
+    size: int
+
+    @classmethod
+    def from_text(cls, html: str, *, level: int = 1) -> CompressedHtml:
+        return cls(data=zlib.compress(html.encode("utf-8"), level), size=len(html))
+
+    def text(self) -> str:
+        return zlib.decompress(self.data).decode("utf-8")
+
 
 @dataclass(slots=True)
 class ScrapedJob:
@@ -29,7 +90,16 @@ class ScrapedJob:
     company: str
     description: str
     skills: list[str]
-    raw_html: str
+    raw_html: str = ""
+    source: str = "html"
+    preview: str = ""
+    html_ref: CompressedHtml | None = field(default=None, repr=False, compare=False)
+
+    def html(self) -> str:
+        """Return the original document, decompressing the stored reference if needed."""
+        if self.raw_html:
+            return self.raw_html
+        return self.html_ref.text() if self.html_ref else ""
 
 
 class ScraperError(RuntimeError):
@@ -44,6 +114,15 @@ class FetchError(ScraperError):
     """Raised when the remote page cannot be retrieved successfully."""
 
 
+class HostUnavailableError(FetchError):
+    """Raised without a network round-trip while the host's circuit breaker is open."""
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"Host '{host}' is temporarily unavailable; retry in {retry_after:.0f}s")
+
+
 class ParseError(ScraperError):
     """Raised when the fetched page is missing required fields."""
 
@@ -51,23 +130,85 @@ class ParseError(ScraperError):
 class WebScraperService:
     """Scrape job postings from supported job boards using HTTPX + BeautifulSoup."""
 
-    def __init__(self, *, client: httpx.AsyncClient | None = None, timeout: float = 15.0) -> None:
+    def __init__(
+        self,
+        *,
+        client: httpx.AsyncClient | None = None,
+        timeout: float = 15.0,
+        scheduler: HostScheduler | None = None,
+        stale_cache_size: int = 64,
+        retain_html: bool = True,
+    ) -> None:
         self._client = client
+        self._owns_client = False
+        self._retain_html = retain_html
         self._timeout = timeout
+        self._scheduler = scheduler
+        self._stale_cache_size = stale_cache_size
+        self._stale_cache: OrderedDict[str, ScrapedJob] = OrderedDict()
         self._parsers: dict[str, Callable[[str, str, str], ScrapedJob]] = {
             "linkedin": self._parse_linkedin,
             "gupy": self._parse_gupy,
             "indeed": self._parse_indeed,
             "generic": self._parse_generic,
         }
+        # Smaller alternative documents that the board HTML parser understands.
+        self._fragment_urls: dict[str, Callable[[str], str | None]] = {
+            "linkedin": self._linkedin_fragment_url,
+        }
+        # JSON state embedded in the full page, decoded before any DOM parsing.
+        self._embedded_parsers: dict[str, Callable[[str], JobPostingData | None]] = {
+            "gupy": parse_gupy_next_data,
+            "indeed": parse_indeed_initial_data,
+        }
+
+    def open(self) -> None:
+        """Create a pooled client reused by every download, instead of one client per download."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(follow_redirects=True, headers=_BROWSER_HEADERS)
+            self._owns_client = True
+
+    async def aclose(self) -> None:
+        """Close the client created by `open`; injected clients are left to their owner."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._owns_client = False
 
     async def fetch_job(self, url: str) -> ScrapedJob:
-        """Download and parse the job posting for the given URL."""
+        """Download and parse the job posting for the given URL.
+
+        The smallest payload a board offers is tried first (a lightweight fragment or
+        embedded JSON); the full-page HTML parsers are the fallback.
+        """
 
         board = self._resolve_board(url)
-        html = await self._download(url)
-        parser = self._parsers[board]
-        return parser(url, html, board)
+        try:
+            job = await self._fetch_fragment(url, board)
+            if job is None:
+                html = await self._download(url)
+                job = self._parse_page(url, html, board)
+        except HostUnavailableError:
+            cached = self._stale_cache.get(url)
+            if cached is None:
+                raise
+            metrics.increment("scraper.stale_served")
+            LOGGER.warning("scraper.serving_stale", url=url)
+            return cached
+        self._remember(url, job)
+        return job
+
+    @property
+    def scheduler(self) -> HostScheduler | None:
+        return self._scheduler
+
+    def _remember(self, url: str, job: ScrapedJob) -> None:
+        if self._scheduler is None or self._stale_cache_size <= 0:
+            return
+        self._stale_cache[url] = job
+        self._stale_cache.move_to_end(url)
+        while len(self._stale_cache) > self._stale_cache_size:
+            self._stale_cache.popitem(last=False)
 
     def _resolve_board(self, url: str) -> str:
         netloc = urlparse(url).netloc.lower()
@@ -83,21 +224,113 @@ class WebScraperService:
         client = self._client
         owns_client = False
         if client is None:
-            # Use a browser-like User-Agent to avoid being blocked by some sites
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            client = httpx.AsyncClient(follow_redirects=True, headers=headers)
+            client = httpx.AsyncClient(follow_redirects=True, headers=_BROWSER_HEADERS)
             owns_client = True
         try:
-            response = await client.get(url, timeout=self._timeout)
-            response.raise_for_status()
-            return response.text
-        except httpx.HTTPError as exc:  # pragma: no cover - relies on HTTPX behavior
-            raise FetchError(f"Failed to fetch '{url}'") from exc
+            if self._scheduler is None:
+                response = await self._get(client, url)
+            else:
+                host = urlparse(url).netloc.lower()
+                try:
+                    async with self._scheduler.slot(host):
+                        response = await self._get(client, url)
+                except CircuitOpenError as exc:
+                    metrics.increment("scraper.circuit_rejected")
+                    raise HostUnavailableError(host, exc.retry_after) from exc
         finally:
             if owns_client:
                 await client.aclose()
+        if response.is_error:
+            # Checked outside the slot: a 4xx (e.g. a missing fragment) says nothing about the
+            # host's health, so it must not count against the host's circuit breaker.
+            raise FetchError(f"Failed to fetch '{url}': HTTP {response.status_code}")
+        return response.text
+
+    async def _fetch_fragment(self, url: str, board: str) -> ScrapedJob | None:
+        build_url = self._fragment_urls.get(board)
+        fragment_url = build_url(url) if build_url else None
+        if fragment_url is None:
+            return None
+        try:
+            fragment = await self._download(fragment_url)
+            job = self._parsers[board](url, fragment, board)
+        except HostUnavailableError:
+            raise
+        except (FetchError, ParseError) as exc:
+            metrics.increment("scraper.fragment_fallback")
+            LOGGER.debug("scraper.fragment_fallback", url=url, reason=str(exc))
+            return None
+        return replace(job, source="fragment")
+
+    def _parse_page(self, url: str, html: str, board: str) -> ScrapedJob:
+        embedded_parser = self._embedded_parsers.get(board)
+        posting = embedded_parser(html) if embedded_parser else None
+        if posting is not None:
+            return self._from_posting(url, board, posting, html, source="embedded_json")
+        posting = parse_job_posting(html)
+        if posting is not None:
+            return self._from_posting(url, board, posting, html, source="json_ld")
+        return self._parsers[board](url, html, board)
+
+    def _from_posting(self, url: str, board: str, posting: JobPostingData, html: str, *, source: str) -> ScrapedJob:
+        return self._assemble(
+            url,
+            board,
+            posting.title,
+            posting.company,
+            posting.description,
+            self._dedupe(posting.skills),
+            html,
+            source=source,
+        )
+
+    def _assemble(
+        self,
+        url: str,
+        board: str,
+        title: str,
+        company: str,
+        description: str,
+        skills: list[str],
+        html: str,
+        *,
+        source: str = "html",
+    ) -> ScrapedJob:
+        """Build the job with a bounded preview; the page itself is only kept compressed.
+
+        Pages that expose no skill list get the known skills mentioned in the description.
+        """
+        if not skills:
+            skills = get_skill_matcher().extract(description, limit=_MAX_EXTRACTED_SKILLS)
+        return ScrapedJob(
+            url=url,
+            board=board,
+            title=title,
+            company=company,
+            description=description,
+            skills=skills,
+            source=source,
+            preview=content_preview(html),
+            html_ref=CompressedHtml.from_text(html) if self._retain_html else None,
+        )
+
+    @staticmethod
+    def _linkedin_fragment_url(url: str) -> str | None:
+        """Map a job view URL to LinkedIn's guest job-posting fragment, a fraction of the page size."""
+        match = _LINKEDIN_JOB_ID_RE.search(url)
+        if match is None:
+            return None
+        return _LINKEDIN_GUEST_FRAGMENT_URL.format(job_id=match.group(1) or match.group(2))
+
+    async def _get(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """GET `url`, raising `FetchError` when the host is unreachable, failing or throttling us."""
+        try:
+            response = await client.get(url, timeout=self._timeout)
+        except httpx.HTTPError as exc:  # pragma: no cover - relies on HTTPX behavior
+            raise FetchError(f"Failed to fetch '{url}'") from exc
+        if response.is_server_error or response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            raise FetchError(f"Failed to fetch '{url}': HTTP {response.status_code}")
+        return response
 
     def _parse_linkedin(self, url: str, html: str, board: str) -> ScrapedJob:
         soup = BeautifulSoup(html, "html.parser")
@@ -190,15 +423,7 @@ class WebScraperService:
             raise ParseError("Company name not found in document")
         if not description:
             raise ParseError("Job description not found in document")
-        return ScrapedJob(
-            url=url,
-            board=board,
-            title=title,
-            company=company,
-            description=description,
-            skills=skills,
-            raw_html=raw_html,
-        )
+        return self._assemble(url, board, title, company, description, skills, raw_html)
 
     def _first_text(self, soup: BeautifulSoup, selectors: Iterable[str]) -> str | None:
         for selector in selectors:
@@ -239,15 +464,7 @@ class WebScraperService:
         return self._dedupe(values)
 
     def _dedupe(self, values: Iterable[str]) -> list[str]:
-        seen: set[str] = set()
-        unique: list[str] = []
-        for value in values:
-            key = value.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            unique.append(value)
-        return unique
+        return canonicalize_skills(values)
 
     def _parse_generic(self, url: str, html: str, board: str) -> ScrapedJob:
         """Fallback parser for unsupported domains."""
@@ -285,12 +502,4 @@ class WebScraperService:
                 tag.decompose()
             description = main_content.get_text("\n", strip=True)
 
-        return ScrapedJob(
-            url=url,
-            board=board,
-            title=title,
-            company=company,
-            description=description,
-            skills=[],
-            raw_html=html[:10000],  # Keep enough context
-        )
+        return self._assemble(url, board, title, company, description, [], html)
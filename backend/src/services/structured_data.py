@@ -0,0 +1,197 @@
+"""Extraction of embedded structured job data (JSON-LD, framework state blobs) from raw HTML."""
+from __future__ import annotations
+
+import html as html_lib
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from bs4 import BeautifulSoup
+
+__all__ = [
+    "JobPostingData",
+    "extract_embedded_json",
+    "iter_json_ld",
+    "parse_gupy_next_data",
+    "parse_indeed_initial_data",
+    "parse_job_posting",
+]
+
+_JSON_LD_RE = re.compile(
+    r"<script[^>]*type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+_LIST_SPLIT_RE = re.compile(r"[\n;,•]+")
+_NEXT_DATA_RE = re.compile(r"<script[^>]*id\s*=\s*[\"']__NEXT_DATA__[\"'][^>]*>", re.IGNORECASE)
+_INDEED_INITIAL_DATA_RE = re.compile(r"window\._initialData\s*=\s*")
+_LIST_ITEM_RE = re.compile(r"<li[^>]*>(.*?)</li>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_DECODER = json.JSONDecoder()
+
+
+@dataclass(slots=True)
+class JobPostingData:
+    """Fields recovered from a schema.org `JobPosting` object."""
+
+    title: str
+    company: str
+    description: str
+    skills: list[str]
+
+
+def iter_json_ld(html: str) -> Iterator[dict[str, Any]]:
+    """Yield every JSON-LD object embedded in `html`, flattening lists and `@graph` containers."""
+    for match in _JSON_LD_RE.finditer(html):
+        try:
+            data = json.loads(match.group(1).strip())
+        except ValueError:
+            continue
+        yield from _flatten(data)
+
+
+def parse_job_posting(html: str) -> JobPostingData | None:
+    """Return the first complete `JobPosting` found in `html`, or `None`."""
+    for node in iter_json_ld(html):
+        if not _is_job_posting(node):
+            continue
+        title = _text(node.get("title"))
+        company = _organization_name(node.get("hiringOrganization"))
+        description = _html_to_text(node.get("description"))
+        if not (title and company and description):
+            continue
+        qualifications = _html_to_text(node.get("qualifications"))
+        if qualifications and qualifications not in description:
+            description = f"{description}\n{qualifications}"
+        return JobPostingData(
+            title=title,
+            company=company,
+            description=description,
+            skills=_skill_list(node.get("skills")),
+        )
+    return None
+
+
+def extract_embedded_json(html: str, marker: re.Pattern[str]) -> Any | None:
+    """Decode the JSON value that starts at the first `{` after `marker`, without a DOM parse."""
+    match = marker.search(html)
+    if match is None:
+        return None
+    start = html.find("{", match.end())
+    if start < 0:
+        return None
+    try:
+        value, _ = _DECODER.raw_decode(html, start)
+    except ValueError:
+        return None
+    return value
+
+
+def parse_gupy_next_data(html: str) -> JobPostingData | None:
+    """Read the job embedded in a Gupy page's Next.js `__NEXT_DATA__` blob."""
+    page_props = _dig(extract_embedded_json(html, _NEXT_DATA_RE), "props", "pageProps")
+    job = _dig(page_props, "job")
+    if not isinstance(job, dict):
+        return None
+    title = _text(job.get("name")) or _text(job.get("title"))
+    company = (
+        _text(_dig(page_props, "careerPage", "name"))
+        or _text(_dig(job, "careerPage", "name"))
+        or _text(job.get("careerPageName"))
+    )
+    sections = [job.get(key) for key in ("description", "responsibilities", "prerequisites")]
+    description = "\n".join(text for text in (_html_to_text(section) for section in sections) if text)
+    if not (title and company and description):
+        return None
+    return JobPostingData(
+        title=title,
+        company=company,
+        description=description,
+        skills=_list_items(job.get("prerequisites")),
+    )
+
+
+def parse_indeed_initial_data(html: str) -> JobPostingData | None:
+    """Read the job from the `window._initialData` state object Indeed embeds in its pages."""
+    model = _dig(extract_embedded_json(html, _INDEED_INITIAL_DATA_RE), "jobInfoWrapperModel", "jobInfoModel")
+    header = _dig(model, "jobInfoHeaderModel")
+    if not isinstance(header, dict):
+        return None
+    title = _text(header.get("jobTitle"))
+    company = _text(header.get("companyName"))
+    description = _html_to_text(_dig(model, "sanitizedJobDescription"))
+    if not (title and company and description):
+        return None
+    qualifications = _dig(model, "jobDescriptionSectionModel", "qualificationsSectionModel", "content")
+    skills = [
+        _text(item.get("label")) for item in qualifications or [] if isinstance(item, dict)
+    ]
+    return JobPostingData(
+        title=title,
+        company=company,
+        description=description,
+        skills=[skill for skill in skills if skill],
+    )
+
+
+def _dig(data: Any, *keys: str) -> Any:
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _list_items(value: Any) -> list[str]:
+    text = _text(value)
+    items = (_TAG_RE.sub(" ", item) for item in _LIST_ITEM_RE.findall(text))
+    return [" ".join(html_lib.unescape(item).split()) for item in items if item.strip()]
+
+
+def _flatten(data: Any) -> Iterator[dict[str, Any]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _flatten(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _flatten(data["@graph"])
+
+
+def _is_job_posting(node: dict[str, Any]) -> bool:
+    node_type = node.get("@type")
+    types = node_type if isinstance(node_type, list) else [node_type]
+    return any(isinstance(value, str) and value.lower() == "jobposting" for value in types)
+
+
+def _organization_name(value: Any) -> str:
+    if isinstance(value, dict):
+        return _text(value.get("name"))
+    if isinstance(value, list) and value:
+        return _organization_name(value[0])
+    return _text(value)
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, str):
+        return html_lib.unescape(value).strip()
+    return ""
+
+
+def _html_to_text(value: Any) -> str:
+    if isinstance(value, list):
+        value = "\n".join(item for item in value if isinstance(item, str))
+    text = _text(value)
+    if "<" not in text:
+        return text
+    return BeautifulSoup(text, "html.parser").get_text("\n", strip=True)
+
+
+def _skill_list(value: Any) -> list[str]:
+    if isinstance(value, str):
+        candidates: list[Any] = _LIST_SPLIT_RE.split(_html_to_text(value))
+    elif isinstance(value, list):
+        candidates = [item.get("name") if isinstance(item, dict) else item for item in value]
+    else:
+        return []
+    return [text for text in (_text(candidate) for candidate in candidates) if text]
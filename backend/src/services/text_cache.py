@@ -0,0 +1,129 @@
+"""Two-tier (memory + disk) cache of text extracted from uploaded documents."""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO
+
+import structlog
+
+from core.metrics import metrics
+
+__all__ = ["ExtractedTextCache", "hash_stream"]
+
+LOGGER = structlog.get_logger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+
+
+def hash_stream(file_obj: BinaryIO, *, chunk_size: int = _CHUNK_SIZE) -> str:
+    """Return the SHA-256 of `file_obj` read in chunks, leaving the stream rewound."""
+    digest = hashlib.sha256()
+    file_obj.seek(0)
+    while chunk := file_obj.read(chunk_size):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
+
+
+class ExtractedTextCache:
+    """Bounded LRU in memory backed by a bounded directory of text files.
+
+    Keys combine the upload's content hash with the parser version, so changing a
+    parser invalidates earlier results without clearing the directory. Disk entries are
+    evicted least-recently-read first (reads refresh the file's mtime).
+
+    Safe to share between threads: uploads read and fill it from the thread pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str | os.PathLike[str] | None = None,
+        memory_entries: int = 128,
+        disk_entries: int = 1024,
+    ) -> None:
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._memory_entries = memory_entries
+        self._lock = threading.Lock()
+        self._disk_entries = disk_entries
+        self._directory = Path(directory) if directory else Path(tempfile.gettempdir()) / "cv-text-cache"
+        if self._disk_entries > 0:
+            self._directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(content_hash: str, *, kind: str, parser_version: str) -> str:
+        return f"{kind}-v{parser_version}-{content_hash}"
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+        if text is not None:
+            metrics.increment("cv_text_cache.hit_memory")
+            return text
+        text = self._read_disk(key)
+        if text is not None:
+            self._remember(key, text)
+            metrics.increment("cv_text_cache.hit_disk")
+            return text
+        metrics.increment("cv_text_cache.miss")
+        return None
+
+    def put(self, key: str, text: str) -> None:
+        self._remember(key, text)
+        if self._disk_entries <= 0:
+            return
+        path = self._path(key)
+        try:
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self._directory, delete=False) as handle:
+                handle.write(text)
+            os.replace(handle.name, path)
+            self._evict_disk()
+        except OSError as exc:
+            LOGGER.warning("cv_text_cache.write_failed", key=key, error=str(exc))
+
+    def _remember(self, key: str, text: str) -> None:
+        if self._memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_entries:
+                self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> str | None:
+        if self._disk_entries <= 0:
+            return None
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            return None
+        return text
+
+    def _evict_disk(self) -> None:
+        with self._lock:
+            entries = list(self._directory.glob("*.txt"))
+            if len(entries) <= self._disk_entries:
+                return
+            entries.sort(key=_mtime)
+            for entry in entries[: len(entries) - self._disk_entries]:
+                entry.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.txt"
+
+
+def _mtime(path: Path) -> float:
+    # Another process sharing the directory may have evicted the file since the glob.
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
@@ -0,0 +1,109 @@
+"""Append-only SQLite ledger of LLM token usage for offline cost and latency analysis."""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from core.llm_usage import TokenPrices, UsageTracker
+
+__all__ = ["UsageLedger"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_usage (
+    recorded_at REAL NOT NULL,
+    request_id TEXT,
+    endpoint TEXT,
+    chain TEXT NOT NULL,
+    model TEXT,
+    calls INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    latency_ms REAL NOT NULL,
+    cost_usd REAL
+);
+CREATE INDEX IF NOT EXISTS llm_usage_chain_time ON llm_usage (chain, recorded_at);
+"""
+
+
+class UsageLedger:
+    """One row per chain per request, written in a single transaction per request.
+
+    Writes are synchronous; callers on the event loop should run `append` in a thread.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def append(
+        self,
+        tracker: UsageTracker,
+        *,
+        request_id: str | None = None,
+        endpoint: str | None = None,
+        prices: TokenPrices | None = None,
+    ) -> None:
+        now = time.time()
+        rows = [
+            (
+                now,
+                request_id,
+                endpoint,
+                usage.chain,
+                usage.model,
+                usage.calls,
+                usage.errors,
+                usage.input_tokens,
+                usage.output_tokens,
+                usage.latency_ms,
+                usage.cost_usd(prices or {}),
+            )
+            for usage in tracker.chains.values()
+        ]
+        if not rows:
+            return
+        with self._lock:
+            # The connection autocommits (isolation_level=None), so the request's rows need an
+            # explicit transaction to land together and share a single WAL commit.
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany("INSERT INTO llm_usage VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def summary(self, *, since: float | None = None) -> list[dict[str, Any]]:
+        """Per-chain totals and averages per request, optionally since a Unix timestamp."""
+        query = """
+            SELECT chain, COUNT(*), SUM(calls), SUM(input_tokens), SUM(output_tokens),
+                   AVG(input_tokens), AVG(output_tokens), AVG(latency_ms), SUM(cost_usd)
+            FROM llm_usage WHERE recorded_at >= ? GROUP BY chain ORDER BY SUM(input_tokens) DESC
+        """
+        with self._lock:
+            rows = self._connection.execute(query, (since or 0.0,)).fetchall()
+        keys = (
+            "chain",
+            "requests",
+            "calls",
+            "input_tokens",
+            "output_tokens",
+            "avg_input_tokens",
+            "avg_output_tokens",
+            "avg_latency_ms",
+            "cost_usd",
+        )
+        return [dict(zip(keys, row, strict=True)) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
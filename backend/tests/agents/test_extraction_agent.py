@@ -1,6 +1,9 @@
 """Tests for the ExtractionAgent that wraps the LangChain pipeline."""
 from __future__ import annotations
 
+import threading
+from dataclasses import replace
+
 import pytest
 from langchain_core.runnables import RunnableLambda
 
@@ -72,3 +75,107 @@ async def test_extraction_agent_raises_when_parser_fails(scraped_job: ScrapedJob
 
     with pytest.raises(ExtractionAgentError):
         await agent.run(scraped_job)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_extraction_agent_skips_llm_for_validated_json_ld_job(scraped_job: ScrapedJob, anyio_backend: str) -> None:
+    def _fail(_: object) -> str:
+        raise AssertionError("LLM must not be called for trusted structured data")
+
+    structured_job = replace(scraped_job, description=" ".join([LONG_DESCRIPTION] * 3), source="json_ld")
+    agent = ExtractionAgent(llm=RunnableLambda(_fail))
+
+    result = await agent.run(structured_job)
+
+    assert result.llm_used is False
+    assert result.highlights == []
+    assert result.job.title == structured_job.title
+    assert result.job.source == "json_ld"
+
+
+def _page(repeat: int) -> str:
+    body = "Hands-on Kubernetes work. " * repeat
+    return f"<html><body><script>bundle()</script><div class='description'><p>{body}</p></div></body></html>"
+
+
+def test_extraction_agent_prompt_excludes_markup(scraped_job: ScrapedJob) -> None:
+    job = replace(scraped_job, raw_html=_page(40))
+    agent = ExtractionAgent(llm=RunnableLambda(lambda _: "{}"))
+
+    prompt_input = agent._prompt_input(job, agent._page_excerpt(job))
+
+    assert "raw_html" not in prompt_input["job_data"]
+    assert prompt_input["page_excerpt"].startswith("Hands-on Kubernetes work.")
+    assert "<" not in prompt_input["page_excerpt"]
+    assert "bundle()" not in prompt_input["page_excerpt"]
+    huge_page_tokens = agent.prompt_tokens(replace(scraped_job, raw_html=_page(4000)))
+    assert huge_page_tokens - agent.prompt_tokens(job) < 600, "prompt size must not track page size"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_extraction_agent_only_parses_the_page_off_loop_for_the_llm_path(
+    scraped_job: ScrapedJob, anyio_backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    parsed_on: list[int] = []
+
+    def _minimize(html: str, *, limit: int) -> str:
+        parsed_on.append(threading.get_ident())
+        return "Remote-first team, quarterly offsites."
+
+    monkeypatch.setattr("agents.extraction_agent.minimize_html", _minimize)
+    prompts: list[str] = []
+    agent = ExtractionAgent(llm=RunnableLambda(lambda prompt: prompts.append(prompt.to_string()) or "{}"))
+
+    await agent.run(scraped_job, llm_mode="never")
+    assert parsed_on == [], "skipping the LLM must not parse the page"
+
+    await agent.run(scraped_job, llm_mode="always")
+    assert len(parsed_on) == 1
+    assert parsed_on[0] != threading.get_ident()
+    assert "Remote-first team, quarterly offsites." in prompts[0]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_extraction_agent_repairs_fenced_truncated_output(scraped_job: ScrapedJob, anyio_backend: str) -> None:
+    truncated = '```json\n{"title": "Senior Backend Engineer", "company": "Example Corp", "skills": ["Python", "Fast'
+    agent = ExtractionAgent(llm=RunnableLambda(lambda _: truncated))
+
+    result = await agent.run(scraped_job)
+
+    assert result.job.title == "Senior Backend Engineer"
+    assert result.job.skills == ["Python", "Fast"]
+    assert result.job.description == scraped_job.description
+
+
+def test_extraction_agent_prompt_uses_compact_schema_hint(scraped_job: ScrapedJob) -> None:
+    agent = ExtractionAgent(llm=RunnableLambda(lambda _: "{}"))
+
+    prompt = agent._prompt.format(**agent._prompt_input(scraped_job, ""))
+
+    assert '"skills": [string]' in prompt
+    assert "properties" not in prompt
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_extraction_agent_confidence_tiers_and_overrides(scraped_job: ScrapedJob, anyio_backend: str) -> None:
+    calls: list[object] = []
+
+    def _llm(prompt: object) -> str:
+        calls.append(prompt)
+        return '{"title": "Senior Backend Engineer"}'
+
+    agent = ExtractionAgent(llm=RunnableLambda(_llm), confidence_threshold=0.5)
+
+    skipped = await agent.run(scraped_job)
+    forced = await agent.run(scraped_job, llm_mode="always")
+    strict_agent = ExtractionAgent(llm=RunnableLambda(_llm), confidence_threshold=1.0)
+    never = await strict_agent.run(scraped_job, llm_mode="never")
+
+    assert skipped.llm_used is False and skipped.confidence is not None and skipped.confidence >= 0.5
+    assert forced.llm_used is True and forced.job.title == "Senior Backend Engineer"
+    assert never.llm_used is False
+    assert len(calls) == 1
@@ -0,0 +1,257 @@
+"""Tests for per-chain model routing, provider circuit breaking and degraded modes."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from agents import ExtractionAgent, GenerationAgent, ModelRouter, ProviderCircuits, RoutingPolicy
+from core.resilience import CircuitOpenError
+from core.scoring import calculate_heuristic_score
+from services.scraper import ScrapedJob
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _stub_models(clock: _FakeClock, latencies: dict[str, float], failing: set[str] = frozenset()):
+    """Factory of stub LLMs that take `latencies[model]` seconds on the fake clock."""
+    built: list[str] = []
+
+    def factory(model: str) -> RunnableLambda:
+        built.append(model)
+
+        def call(_: object) -> str:
+            clock.now += latencies[model]
+            if model in failing:
+                raise RuntimeError(f"{model} unavailable")
+            return model
+
+        return RunnableLambda(call)
+
+    return factory, built
+
+
+def _router(clock: _FakeClock, factory, **policy: float) -> ModelRouter:
+    return ModelRouter(
+        chain_models={"cv": "pro", "insights": "lite"},
+        fallbacks={"pro": "lite"},
+        factory=factory,
+        policy=RoutingPolicy(**{"p95_threshold_seconds": 5.0, "min_samples": 3, "cooldown_seconds": 60.0, **policy}),
+        provider_of=lambda model: model,  # each stub stands for its own provider
+        clock=clock,
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_slow_primary_is_replaced_by_fallback_until_cooldown_ends(anyio_backend: str) -> None:
+    clock = _FakeClock()
+    factory, built = _stub_models(clock, {"pro": 8.0, "lite": 1.0})
+    router = _router(clock, factory)
+    cv = router.runnable("cv")
+
+    assert built == ["pro", "lite"], "configured models are built up front"
+    assert [await cv.ainvoke("x") for _ in range(5)] == ["pro", "pro", "pro", "lite", "lite"]
+    assert router.snapshot()["chains"] == {"cv": "lite", "insights": "lite"}
+
+    clock.now += 61.0
+    assert await cv.ainvoke("x") == "pro", "primary is probed again after the cool-down"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_failing_primary_falls_back_on_error_rate(anyio_backend: str) -> None:
+    clock = _FakeClock()
+    factory, _ = _stub_models(clock, {"pro": 0.1, "lite": 0.1}, failing={"pro"})
+    router = _router(clock, factory)
+    cv = router.runnable("cv")
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            await cv.ainvoke("x")
+
+    assert await cv.ainvoke("x") == "lite"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_fast_models_and_chains_without_fallback_stay_put(anyio_backend: str) -> None:
+    clock = _FakeClock()
+    factory, _ = _stub_models(clock, {"pro": 1.0, "lite": 9.0})
+    router = _router(clock, factory)
+
+    assert [await router.runnable("cv").ainvoke("x") for _ in range(5)] == ["pro"] * 5
+    assert [await router.runnable("insights").ainvoke("x") for _ in range(5)] == ["lite"] * 5
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_generation_agent_routes_each_chain_to_its_model(anyio_backend: str) -> None:
+    clock = _FakeClock()
+    factory, _ = _stub_models(clock, {"pro": 1.0, "lite": 1.0})
+    router = ModelRouter(
+        chain_models={"cv": "pro", "cover_letter": "pro", "networking": "lite", "insights": "lite"},
+        factory=factory,
+        clock=clock,
+    )
+    agent = GenerationAgent(router=router)
+
+    bundle = await agent.generate_all({"title": "Dev", "description": "", "skills": []}, "CV text", language="en")
+
+    assert (bundle.cv, bundle.cover_letter, bundle.networking, bundle.insights) == ("pro", "pro", "lite", "lite")
+
+
+def _open_circuits(clock: _FakeClock) -> ProviderCircuits:
+    circuits = ProviderCircuits(failure_threshold=2, cooldown=30.0, clock=clock)
+    for _ in range(2):
+        circuits.get("gemini").record_failure()
+    return circuits
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_provider_circuit_trips_on_failures_and_timeouts_then_fails_fast(anyio_backend: str) -> None:
+    calls: list[str] = []
+
+    async def hang(_: object) -> str:
+        calls.append("hang")
+        await asyncio.sleep(1)
+        return "late"
+
+    def fail(_: object) -> str:
+        calls.append("fail")
+        raise RuntimeError("503 from provider")
+
+    clock = _FakeClock()
+    stubs = {"slow": RunnableLambda(hang), "broken": RunnableLambda(fail)}
+    router = ModelRouter(
+        chain_models={"cv": "slow", "insights": "broken"},
+        factory=stubs.__getitem__,
+        circuits=ProviderCircuits(failure_threshold=2, cooldown=30.0, clock=clock),
+        provider_of=lambda model: "gemini",
+        call_timeout=0.01,
+        clock=clock,
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await router.runnable("cv").ainvoke("x")
+    with pytest.raises(RuntimeError):
+        await router.runnable("insights").ainvoke("x")
+
+    assert not router.available("cv")
+    with pytest.raises(CircuitOpenError):
+        await router.runnable("insights").ainvoke("x")
+    assert calls == ["hang", "fail"], "no call reaches the provider while its circuit is open"
+
+    clock.now = 31.0
+    assert router.available("insights"), "a probe is admitted after the cool-down"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_generation_degrades_to_heuristic_score_when_provider_is_down(anyio_backend: str) -> None:
+    clock = _FakeClock()
+    factory, _ = _stub_models(clock, {"gemini-2.5-flash": 1.0})
+    router = ModelRouter(
+        chain_models=dict.fromkeys(["cv", "cover_letter", "networking", "insights"], "gemini-2.5-flash"),
+        factory=factory,
+        circuits=_open_circuits(clock),
+        clock=clock,
+    )
+
+    bundle = await GenerationAgent(router=router).generate_all(
+        {"title": "Dev", "description": "", "skills": ["Python", "Rust"]}, "Python developer", language="en"
+    )
+
+    assert bundle.unavailable == ["cv", "cover_letter", "networking", "insights"]
+    assert (bundle.cv, bundle.insights) == ("", "")
+    assert bundle.match_score == calculate_heuristic_score(["Python", "Rust"], "Python developer")
+    assert clock.now == 0.0, "no model was called"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_calls_wait_for_the_half_open_probe_of_a_recovered_provider(anyio_backend: str) -> None:
+    clock = _FakeClock()
+    factory, _ = _stub_models(clock, {"gemini-2.5-flash": 0.0})
+    circuits = _open_circuits(clock)
+    router = ModelRouter(
+        chain_models=dict.fromkeys(["cv", "cover_letter", "networking", "insights"], "gemini-2.5-flash"),
+        factory=factory,
+        circuits=circuits,
+        clock=clock,
+    )
+    clock.now = 31.0
+
+    bundle = await GenerationAgent(router=router).generate_all(
+        {"title": "Dev", "description": "", "skills": []}, "CV text", language="en"
+    )
+
+    assert bundle.unavailable == []
+    assert bundle.cv == bundle.networking == "gemini-2.5-flash"
+    assert circuits.get("gemini").state == "closed"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_calls_waiting_for_a_failed_probe_fail_fast(anyio_backend: str) -> None:
+    clock = _FakeClock()
+    release = asyncio.Event()
+
+    async def probe(_: object) -> str:
+        await release.wait()
+        raise RuntimeError("still down")
+
+    circuits = _open_circuits(clock)
+    router = ModelRouter(
+        chain_models={"cv": "flash", "insights": "flash"},
+        factory=lambda model: RunnableLambda(probe),
+        circuits=circuits,
+        provider_of=lambda model: "gemini",
+        clock=clock,
+    )
+    clock.now = 31.0
+
+    probing = asyncio.ensure_future(router.runnable("cv").ainvoke("x"))
+    await asyncio.sleep(0.05)
+    waiting = asyncio.ensure_future(router.runnable("insights").ainvoke("x"))
+    await asyncio.sleep(0.05)
+    assert not waiting.done(), "the second call waits for the probe"
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        await probing
+    with pytest.raises(CircuitOpenError):
+        await waiting
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_extraction_serves_validated_scrape_when_provider_is_down(anyio_backend: str) -> None:
+    clock = _FakeClock()
+    factory, _ = _stub_models(clock, {"gemini-2.5-flash": 1.0})
+    router = ModelRouter(chain_models={"extraction": "gemini-2.5-flash"}, factory=factory, circuits=_open_circuits(clock))
+    job = ScrapedJob(
+        url="https://jobs.example.com/1",
+        board="generic",
+        title="Backend Developer",
+        company="Acme",
+        description=(
+            "Build and operate Python APIs, own data pipelines, and improve the reliability of distributed "
+            "services alongside a small product team."
+        ),
+        skills=["Python"],
+    )
+
+    result = await ExtractionAgent(router=router).run(job, llm_mode="always")
+
+    assert result.degraded
+    assert not result.llm_used
+    assert result.job.title == "Backend Developer"
@@ -0,0 +1,189 @@
+"""Tests for the LLM providers: self-hosted ones against a local stub server, Gemini on canned responses."""
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import google.ai.generativelanguage as glm
+import pytest
+from google.generativeai.types import GenerateContentResponse
+
+from agents import (
+    ExtractionAgent,
+    GenerationAgent,
+    HttpChatModel,
+    ModelRouter,
+    ModelSpec,
+    build_chat_model,
+)
+from agents.providers import aclose_http_clients
+from core.config import Settings
+from core.llm_usage import track_usage, usage_config
+from services.scraper import ScrapedJob
+
+
+class _StubServer:
+    """Answers OpenAI-compatible and Ollama chat requests and counts TCP connections."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, dict[str, Any]]] = []
+        self.connections = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so pooled clients reuse connections
+
+            def setup(self) -> None:
+                stub.connections += 1
+                super().setup()
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.requests.append((self.path, body))
+                reply = stub.reply_for(self.path, body)
+                payload = json.dumps(reply).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self.content = "stub reply"
+
+    def reply_for(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        if path == "/api/chat":
+            return {"message": {"role": "assistant", "content": self.content}, "prompt_eval_count": 11, "eval_count": 4}
+        return {
+            "choices": [{"message": {"role": "assistant", "content": self.content}}],
+            "usage": {"prompt_tokens": 21, "completion_tokens": 7},
+        }
+
+    def __enter__(self) -> _StubServer:
+        threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_server() -> Iterator[_StubServer]:
+    with _StubServer() as server:
+        yield server
+
+
+def _settings(server: _StubServer, **overrides: Any) -> Settings:
+    return Settings(openai_base_url=f"{server.url}/v1", ollama_base_url=server.url, **overrides)
+
+
+def test_model_spec_prefixes_select_the_provider() -> None:
+    assert ModelSpec.parse("ollama:qwen2.5:7b") == ModelSpec("ollama", "qwen2.5:7b")
+    assert ModelSpec.parse("openai:llama-3.1-8b") == ModelSpec("openai", "llama-3.1-8b")
+    assert ModelSpec.parse("gemini-2.5-flash") == ModelSpec("gemini", "gemini-2.5-flash")
+    assert ModelSpec.parse("qwen2.5:7b", default_provider="ollama") == ModelSpec("ollama", "qwen2.5:7b")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_openai_compatible_calls_reuse_one_pooled_connection(stub_server: _StubServer, anyio_backend: str) -> None:
+    llm = build_chat_model("openai:local-model", settings=_settings(stub_server), temperature=0.1)
+
+    with track_usage() as tracker:
+        replies = [await llm.ainvoke("hello", config=usage_config("networking")) for _ in range(3)]
+    await aclose_http_clients()
+
+    assert isinstance(llm, HttpChatModel)
+    assert [reply.content for reply in replies] == ["stub reply"] * 3
+    assert stub_server.connections == 1
+    path, body = stub_server.requests[0]
+    assert path == "/v1/chat/completions"
+    assert body["model"] == "local-model"
+    assert body["messages"] == [{"role": "user", "content": "hello"}]
+    usage = tracker.chains["networking"]
+    assert (usage.model, usage.input_tokens, usage.output_tokens) == ("local-model", 63, 21)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_extraction_agent_runs_on_ollama_with_json_schema(stub_server: _StubServer, anyio_backend: str) -> None:
+    description = (
+        "Build and operate Python APIs, own data pipelines, and improve the reliability of distributed "
+        "services alongside a small product team."
+    )
+    stub_server.content = json.dumps(
+        {"title": "Backend Engineer", "company": "Acme", "description": description, "skills": ["Python"]}
+    )
+    settings = _settings(stub_server, llm_model_extraction="ollama:qwen2.5:7b")
+    router = ModelRouter.from_settings(
+        settings,
+        chains=["extraction"],
+        factory=lambda model: build_chat_model(model, settings=settings, temperature=0.0, json_schema={"type": "object"}),
+    )
+    agent = ExtractionAgent(router=router)
+    job = ScrapedJob(
+        url="https://jobs.example.com/1",
+        board="generic",
+        title="Backend Dev",
+        company="Acme",
+        description=description,
+        skills=["Python"],
+    )
+
+    result = await agent.run(job, llm_mode="always")
+    await aclose_http_clients()
+
+    assert result.llm_used
+    assert result.job.title == "Backend Engineer"
+    path, body = stub_server.requests[0]
+    assert path == "/api/chat"
+    assert body["model"] == "qwen2.5:7b"
+    assert body["format"] == {"type": "object"}
+    assert body["stream"] is False
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_generation_agent_mixes_providers_per_chain(stub_server: _StubServer, anyio_backend: str) -> None:
+    settings = _settings(stub_server, llm_provider="ollama")
+    router = ModelRouter(
+        chain_models={"cv": "openai:big", "cover_letter": "openai:big", "networking": "small", "insights": "small"},
+        factory=lambda model: build_chat_model(model, settings=settings, temperature=0.4),
+    )
+
+    await GenerationAgent(router=router).generate_all({"title": "Dev", "description": "", "skills": []}, "CV", language="en")
+    await aclose_http_clients()
+
+    assert sorted(path for path, _ in stub_server.requests) == ["/api/chat"] * 2 + ["/v1/chat/completions"] * 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_gemini_calls_report_the_response_token_counts(monkeypatch: pytest.MonkeyPatch, anyio_backend: str) -> None:
+    response = GenerateContentResponse.from_response(
+        glm.GenerateContentResponse(
+            candidates=[{"content": {"parts": [{"text": "Gemini reply"}], "role": "model"}, "finish_reason": 1}],
+            usage_metadata={"prompt_token_count": 412, "candidates_token_count": 96, "total_token_count": 508},
+        )
+    )
+
+    async def send(**_: Any) -> GenerateContentResponse:
+        return response
+
+    monkeypatch.setattr("agents.providers._achat_with_retry", send)
+    llm = build_chat_model("gemini-2.5-flash", settings=Settings(google_api_key="test-key"), temperature=0.2)
+
+    with track_usage() as tracker:
+        reply = await llm.ainvoke("hello", config=usage_config("cv"))
+
+    assert reply.content == "Gemini reply"
+    usage = tracker.chains["cv"]
+    assert (usage.input_tokens, usage.output_tokens) == (412, 96)
+    assert usage.cost_usd({"gemini-2.5-flash": {"input": 1.0, "output": 10.0}}) == pytest.approx(0.001372)
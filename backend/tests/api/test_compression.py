@@ -0,0 +1,121 @@
+"""Tests for response compression and gzip request bodies."""
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.types import Message, Receive, Scope, Send
+
+from app.middleware import CompressionMiddleware
+
+
+def _client(**options: int) -> TestClient:
+    application = FastAPI(default_response_class=ORJSONResponse)
+    application.add_middleware(CompressionMiddleware, minimum_size=500, **options)
+
+    @application.get("/large")
+    async def large() -> dict[str, str]:
+        return {"cv": "# Tailored CV\n" + "- Built payment services in Python\n" * 200}
+
+    @application.get("/small")
+    async def small() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @application.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for index in range(50):
+                yield f"line {index} of a streamed markdown document\n"
+
+        return StreamingResponse(chunks(), media_type="text/markdown")
+
+    @application.post("/echo")
+    async def echo(request: Request) -> dict[str, int]:
+        payload = await request.json()
+        return {"length": len(payload["cvText"])}
+
+    return TestClient(application)
+
+
+def test_large_json_is_gzipped_and_small_responses_pass_through() -> None:
+    client = _client()
+
+    large = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert large.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in large.headers["vary"]
+    assert int(large.headers["content-length"]) < 1000
+    assert large.json()["cv"].startswith("# Tailored CV")
+    assert "content-encoding" not in small.headers
+
+
+def test_streamed_responses_are_compressed_incrementally() -> None:
+    response = _client().get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.splitlines()[-1] == "line 49 of a streamed markdown document"
+
+
+def test_gzip_request_bodies_are_inflated() -> None:
+    body = gzip.compress(json.dumps({"cvText": "x" * 50_000}).encode())
+
+    response = _client().post(
+        "/echo", content=body, headers={"Content-Encoding": "gzip", "Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"length": 50_000}
+
+
+def test_oversized_or_unsupported_request_encodings_are_rejected() -> None:
+    bomb = gzip.compress(b"0" * 200_000)
+    client = _client(max_request_body=100_000)
+
+    too_large = client.post("/echo", content=bomb, headers={"Content-Encoding": "gzip"})
+    unsupported = client.post("/echo", content=b"...", headers={"Content-Encoding": "br"})
+
+    assert too_large.status_code == 413
+    assert unsupported.status_code == 415
+
+
+def test_truncated_or_malformed_gzip_request_bodies_are_rejected() -> None:
+    client = _client()
+    body = gzip.compress(json.dumps({"cvText": "x" * 5_000}).encode())
+
+    truncated = client.post("/echo", content=body[: len(body) // 2], headers={"Content-Encoding": "gzip"})
+    malformed = client.post("/echo", content=b"not gzip at all", headers={"Content-Encoding": "gzip"})
+
+    assert truncated.status_code == 400
+    assert malformed.status_code == 400
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_client_disconnect_mid_body_never_reaches_the_app(anyio_backend: str) -> None:
+    body = gzip.compress(b"x" * 5_000)
+    messages = iter(
+        [
+            {"type": "http.request", "body": body[:20], "more_body": True},
+            {"type": "http.disconnect"},
+        ]
+    )
+    sent: list[Message] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        raise AssertionError("the app must not see a partial body")
+
+    async def receive() -> Message:
+        return next(messages)
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/echo", "headers": [(b"content-encoding", b"gzip")]}
+    await CompressionMiddleware(app)(scope, receive, send)
+
+    assert sent == []
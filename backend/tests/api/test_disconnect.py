@@ -0,0 +1,71 @@
+"""Tests for cancelling request work when the client disconnects."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import Request
+from langchain_core.runnables import RunnableLambda
+
+from agents import GenerationAgent, ModelRouter
+from agents.model_router import llm_calls_in_flight
+from api.disconnect import ClientDisconnected, cancel_on_disconnect
+
+
+def _request(disconnected: asyncio.Event) -> Request:
+    async def receive() -> dict[str, str]:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    return Request({"type": "http", "method": "POST", "path": "/work", "headers": [], "query_string": b""}, receive)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_work_finishes_normally_while_client_stays(anyio_backend: str) -> None:
+    async def work() -> str:
+        await asyncio.sleep(0)
+        return "done"
+
+    assert await cancel_on_disconnect(_request(asyncio.Event()), work()) == "done"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_disconnect_cancels_every_generation_chain_without_retrying(anyio_backend: str) -> None:
+    calls: list[str] = []
+    cancelled: list[str] = []
+    all_started = asyncio.Event()
+
+    def factory(model: str) -> RunnableLambda:
+        async def call(_: object) -> str:
+            calls.append(model)
+            if len(calls) == 4:
+                all_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(model)
+                raise
+            return model
+
+        return RunnableLambda(call)
+
+    router = ModelRouter(
+        chain_models={"cv": "pro", "cover_letter": "pro", "networking": "lite", "insights": "lite"},
+        factory=factory,
+    )
+    agent = GenerationAgent(router=router)
+    disconnected = asyncio.Event()
+    generation = agent.generate_all({"title": "Dev", "description": "", "skills": []}, "CV text", language="en")
+
+    pending = asyncio.ensure_future(cancel_on_disconnect(_request(disconnected), generation))
+    await asyncio.wait_for(all_started.wait(), timeout=5)
+    assert llm_calls_in_flight() == 4
+    disconnected.set()
+
+    with pytest.raises(ClientDisconnected):
+        await pending
+    await asyncio.sleep(0)
+    assert sorted(cancelled) == sorted(calls) and len(calls) == 4, "no chain was retried after cancellation"
+    assert llm_calls_in_flight() == 0
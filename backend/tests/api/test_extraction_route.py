@@ -11,6 +11,7 @@ from agents import ExtractionAgentError
 from api.routes import extraction as extraction_route
 from core.validators import ValidationIssue, ValidationError as JobValidationError
 from services.scraper import (
+    HostUnavailableError,
     ParseError,
     ScrapedJob,
     ScraperError,
@@ -52,18 +53,20 @@ class _StubScraper:
 
 
 class _StubAgent:
-    def __init__(self, *, job: ScrapedJob | None = None, fail_with_validation: bool = False) -> None:
+    def __init__(self, *, job: ScrapedJob | None = None, fail_with_validation: bool = False, degraded: bool = False) -> None:
         self._job = job
         self._fail_with_validation = fail_with_validation
+        self._degraded = degraded
 
-    async def run(self, scraped_job: ScrapedJob) -> SimpleNamespace:
+    async def run(self, scraped_job: ScrapedJob, *, llm_mode: str = "auto") -> SimpleNamespace:
+        self.llm_mode = llm_mode
         if self._fail_with_validation:
             issues = [
                 ValidationIssue(layer="syntax", field="title", message="Title missing", code="missing_title"),
             ]
             validation_error = JobValidationError(issues)
             raise ExtractionAgentError("Validation failed for scraped job") from validation_error
-        return SimpleNamespace(job=self._job or scraped_job)
+        return SimpleNamespace(job=self._job or scraped_job, degraded=self._degraded)
 
 
 def test_extract_job_details_returns_normalized_payload(fastapi_app) -> None:
@@ -129,3 +132,43 @@ def test_extract_job_details_handles_generic_scraper_error(fastapi_app) -> None:
     payload = response.json()
     assert payload["error"] == "scrape_failed"
     assert "network failure" in payload["message"]
+
+
+def test_extract_job_details_returns_503_when_host_circuit_is_open(fastapi_app) -> None:
+    fastapi_app.dependency_overrides[extraction_route.get_scraper_service] = lambda: _StubScraper(
+        error=HostUnavailableError("www.linkedin.com", retry_after=12.4)
+    )
+    fastapi_app.dependency_overrides[extraction_route.get_extraction_agent] = lambda: _StubAgent()
+
+    client = TestClient(fastapi_app)
+    response = client.post("/extract-job-details", json={"url": "https://www.linkedin.com/jobs/view/123"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "12"
+    assert response.json()["error"] == "host_unavailable"
+
+
+def test_extract_job_details_forwards_llm_mode_override(fastapi_app) -> None:
+    job = _job_payload()
+    agent = _StubAgent(job=job)
+    fastapi_app.dependency_overrides[extraction_route.get_scraper_service] = lambda: _StubScraper(job=job)
+    fastapi_app.dependency_overrides[extraction_route.get_extraction_agent] = lambda: agent
+
+    client = TestClient(fastapi_app)
+    response = client.post("/extract-job-details", json={"url": job.url, "llmMode": "always"})
+
+    assert response.status_code == 200
+    assert agent.llm_mode == "always"
+
+
+def test_extract_job_details_flags_degraded_llm_normalization(fastapi_app) -> None:
+    job = _job_payload()
+    fastapi_app.dependency_overrides[extraction_route.get_scraper_service] = lambda: _StubScraper(job=job)
+    fastapi_app.dependency_overrides[extraction_route.get_extraction_agent] = lambda: _StubAgent(job=job, degraded=True)
+
+    client = TestClient(fastapi_app)
+    response = client.post("/extract-job-details", json={"url": job.url})
+
+    assert response.status_code == 200
+    assert response.headers["X-Degraded"] == "llm_unavailable"
+    assert response.json()["title"] == job.title
@@ -54,3 +54,75 @@ def test_generate_materials_success(fastapi_app) -> None:
     assert data["cv"] == "# Tailored CV"
     assert data["matchScore"] == 85
     assert data["jobId"] == "123"
+
+
+def test_generate_materials_accepts_stored_cv_id(fastapi_app) -> None:
+    from api.routes import cv_extraction as cv_route
+    from services.cv_store import CvStore
+
+    mock_agent = AsyncMock()
+    mock_agent.generate_all.return_value = GeneratedBundle(
+        cv="# Tailored CV",
+        cover_letter="Dear Hiring Manager...",
+        networking="",
+        insights="{}",
+        match_score=70,
+        generated_at=datetime.now(timezone.utc),
+    )
+    store = CvStore()
+    fastapi_app.dependency_overrides[generation_route.get_generation_agent] = lambda: mock_agent
+    fastapi_app.dependency_overrides[cv_route.get_cv_store] = lambda: store
+    client = TestClient(fastapi_app)
+
+    upload = client.post(
+        "/extract-cv-text?store=true",
+        files={"file": ("cv.txt", b"Jane Doe - Python developer", "text/plain")},
+    )
+    cv_id = upload.json()["cvId"]
+    job = {"title": "Dev", "company": "Corp", "description": "Code stuff", "skills": ["Python"]}
+
+    response = client.post("/generate-materials", json={"job": job, "profile": {"cvId": cv_id}})
+
+    assert response.status_code == 200
+    assert mock_agent.generate_all.await_args.kwargs["cv_text"] == "Jane Doe - Python developer"
+
+    missing = client.post("/generate-materials", json={"job": job, "profile": {"cvId": "unknown"}})
+    assert missing.status_code == 404
+    assert missing.json()["error"] == "cv_not_found"
+
+    neither = client.post("/generate-materials", json={"job": job, "profile": {}})
+    assert neither.status_code == 422
+
+
+def test_generate_materials_reports_unavailable_artifacts(fastapi_app) -> None:
+    mock_agent = AsyncMock()
+    mock_agent.generate_all.return_value = GeneratedBundle(
+        cv="",
+        cover_letter="",
+        networking="Ask about scaling...",
+        insights="",
+        match_score=40,
+        generated_at=datetime.now(timezone.utc),
+        unavailable=["cv", "cover_letter", "insights"],
+    )
+    fastapi_app.dependency_overrides[generation_route.get_generation_agent] = lambda: mock_agent
+
+    client = TestClient(fastapi_app)
+    response = client.post(
+        "/generate-materials",
+        json={
+            "job": {"title": "Dev", "company": "Corp", "description": "Code stuff", "skills": ["Python"]},
+            "profile": {"cvText": "My CV content"},
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["degraded"] is True
+    assert data["matchScore"] == 40
+    assert data["artifactStatus"] == {
+        "cv": "unavailable",
+        "coverLetter": "unavailable",
+        "networking": "ok",
+        "insights": "unavailable",
+    }
@@ -1,7 +1,14 @@
 """Ensure foundational API routes are registered."""
 from __future__ import annotations
 
+import time
+
+import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
+from langchain_core.runnables import RunnableLambda
+
+from agents import ModelRouter, ProviderCircuits
 
 
 def test_health_route_returns_status_ok() -> None:
@@ -13,3 +20,122 @@ def test_health_route_returns_status_ok() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_metrics_route_exposes_counters() -> None:
+    from app.main import app
+
+    client = TestClient(app)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "counters" in response.json()
+
+
+@pytest.fixture(autouse=True)
+def no_parse_processes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lifespan tests here do not parse documents; skip spawning the parsing processes."""
+    from app.main import app
+
+    monkeypatch.setattr(app.state.settings, "document_parse_workers", 0)
+
+
+class _StubAgent:
+    def __init__(self, router: ModelRouter) -> None:
+        self.router = router
+
+
+def _stub_router(calls: list[str], failing: frozenset[str] = frozenset()) -> ModelRouter:
+    def factory(model: str) -> RunnableLambda:
+        def call(_: object) -> str:
+            calls.append(model)
+            if model in failing:
+                raise RuntimeError(f"{model} unreachable")
+            return "OK"
+
+        return RunnableLambda(call)
+
+    return ModelRouter(
+        chain_models={"cv": "pro", "insights": "lite"},
+        factory=factory,
+        circuits=ProviderCircuits(failure_threshold=1),
+        provider_of=lambda model: model,
+    )
+
+
+def _wait_for_ready(client: TestClient) -> Response:
+    for _ in range(50):
+        response = client.get("/ready")
+        if response.json()["checks"]["warm_up"]:
+            return response
+        time.sleep(0.01)
+    raise AssertionError("warm-up never finished")
+
+
+def test_ready_reports_not_ready_until_started() -> None:
+    from app.main import app
+
+    response = TestClient(app).get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
+
+
+def test_ready_after_eager_start_up_and_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app import lifecycle
+    from app.main import app
+
+    calls: list[str] = []
+    monkeypatch.setattr(lifecycle, "get_generation_agent", lambda: _StubAgent(_stub_router(calls)))
+    monkeypatch.setattr(lifecycle, "get_extraction_agent", lambda: _StubAgent(_stub_router(calls)))
+    monkeypatch.setattr(app.state.settings, "llm_warmup", True)
+
+    with TestClient(app) as client:
+        response = _wait_for_ready(client)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert sorted(calls) == ["lite", "lite", "pro", "pro"], "each agent's models were called once"
+
+
+def test_ready_fails_while_a_service_is_broken_or_a_provider_unreachable(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app import lifecycle
+    from app.main import app
+
+    def missing_key() -> None:
+        raise RuntimeError("GOOGLE_API_KEY is not set")
+
+    monkeypatch.setattr(lifecycle, "get_generation_agent", missing_key)
+    monkeypatch.setattr(
+        lifecycle, "get_extraction_agent", lambda: _StubAgent(_stub_router([], failing=frozenset({"pro"})))
+    )
+    monkeypatch.setattr(app.state.settings, "llm_warmup", True)
+
+    with TestClient(app) as client:
+        response = _wait_for_ready(client)
+        health = client.get("/health")
+
+    report = response.json()
+    assert response.status_code == 503
+    assert report["checks"]["startup"] is False
+    assert report["checks"]["llm_extraction_agent"] is False
+    assert report["errors"] == {"generation_agent": "GOOGLE_API_KEY is not set"}
+    assert health.status_code == 200
+
+
+def test_shutdown_turns_not_ready_and_closes_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app import lifecycle
+    from app.main import app
+
+    monkeypatch.setattr(lifecycle, "get_generation_agent", lambda: _StubAgent(_stub_router([])))
+    monkeypatch.setattr(lifecycle, "get_extraction_agent", lambda: _StubAgent(_stub_router([])))
+
+    with TestClient(app) as client:
+        assert _wait_for_ready(client).status_code == 200
+        scraper = lifecycle.get_scraper_service()
+        assert scraper._client is not None, "start-up opened the pooled scraper client"
+
+    ready, _ = app.state.readiness.report()
+    assert not ready
+    assert scraper._client is None
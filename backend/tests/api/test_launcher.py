@@ -0,0 +1,130 @@
+"""Tests for the production launcher: server options and draining shutdown."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import signal
+import socket
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+import uvicorn
+from structlog.testing import capture_logs
+
+from agents import GeneratedBundle
+from app import launcher
+from core.config import Settings
+
+
+def test_server_options_follow_settings() -> None:
+    options = launcher.server_options(
+        Settings(
+            server_workers=3,
+            server_backlog=512,
+            server_keep_alive_seconds=75,
+            server_limit_concurrency=200,
+            shutdown_drain_seconds=12.5,
+        )
+    )
+
+    assert options["host"] == "127.0.0.1", "only containers opt in to listening on every interface"
+    assert options["workers"] == 3
+    assert (options["backlog"], options["timeout_keep_alive"]) == (512, 75)
+    assert options["limit_concurrency"] == 200
+    assert options["timeout_graceful_shutdown"] == 13
+    assert options["lifespan"] == "on" and options["access_log"] is False
+
+
+def test_server_options_fall_back_when_fast_loop_is_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(launcher, "_installed", lambda module: False)
+    monkeypatch.setattr(launcher, "_available_cpus", lambda: 6)
+
+    options = launcher.server_options(Settings(server_workers=0, server_limit_concurrency=0))
+
+    assert (options["loop"], options["http"]) == ("asyncio", "h11")
+    assert options["workers"] == 6
+    assert options["limit_concurrency"] is None
+
+
+def test_main_warns_that_stored_cvs_are_not_shared_between_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    runs: list[int] = []
+
+    class _Supervisor:
+        def __init__(self, config: uvicorn.Config, **_: object) -> None:
+            self._workers = config.workers
+
+        def run(self) -> None:
+            runs.append(self._workers)
+
+    monkeypatch.setattr(launcher, "get_settings", lambda: Settings(server_workers=2))
+    monkeypatch.setattr(launcher, "Multiprocess", _Supervisor)
+    monkeypatch.setattr(uvicorn.Config, "bind_socket", lambda self: None)
+    importlib.import_module("app.main")  # main() imports it; importing configures logging
+
+    with capture_logs() as logs:
+        launcher.main()
+
+    assert runs == [2]
+    assert [entry["workers"] for entry in logs if entry["event"] == "launcher.cv_store_not_shared"] == [2]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_shutdown_signal_drains_while_the_server_still_listens(
+    anyio_backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from api.routes import generation as generation_route
+    from app import lifecycle
+    from app.main import app
+
+    entered, release = asyncio.Event(), asyncio.Event()
+
+    class _SlowAgent:
+        router = None
+
+        async def generate_all(self, **_: object) -> GeneratedBundle:
+            entered.set()
+            await release.wait()
+            return GeneratedBundle(
+                cv="# CV", cover_letter="", networking="", insights="{}", match_score=50,
+                generated_at=datetime.now(UTC),
+            )
+
+    monkeypatch.setattr(lifecycle, "get_generation_agent", _SlowAgent)
+    monkeypatch.setattr(lifecycle, "get_extraction_agent", _SlowAgent)
+    monkeypatch.setattr(app.state.settings, "document_parse_workers", 0)
+    monkeypatch.setattr(app.state.settings, "shutdown_drain_seconds", 5.0)
+    monkeypatch.setitem(app.dependency_overrides, generation_route.get_generation_agent, _SlowAgent)
+    job = {"id": "1", "title": "Dev", "company": "Corp", "description": "Code", "skills": ["Python"]}
+    payload = {"job": job, "profile": {"cvText": "CV"}}
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = launcher.DrainingServer(uvicorn.Config(app, log_config=None, timeout_graceful_shutdown=5))
+    monkeypatch.setattr(server, "install_signal_handlers", lambda: None)  # signals are sent by hand
+    serving = asyncio.create_task(server.serve(sockets=[sock]))
+    for _ in range(500):
+        if server.started:
+            break
+        await asyncio.sleep(0.01)
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{sock.getsockname()[1]}") as client:
+        assert (await client.get("/ready")).status_code == 200
+        admitted = asyncio.create_task(client.post("/generate-materials", json=payload))
+        await asyncio.wait_for(entered.wait(), timeout=5)
+
+        server.handle_exit(signal.SIGTERM, None)
+        await asyncio.sleep(0)
+        ready = await client.get("/ready")
+        refused = await client.post("/generate-materials", json=payload)
+        assert not server.should_exit, "uvicorn keeps listening while the admitted request runs"
+
+        release.set()
+        finished = await admitted
+
+    await asyncio.wait_for(serving, timeout=5)
+    assert ready.status_code == 503
+    assert (refused.status_code, refused.json()["reason"]) == (503, "shutting_down")
+    assert finished.status_code == 200
+    assert server.should_exit and not server.force_exit
@@ -0,0 +1,141 @@
+"""Tests for the pure-ASGI middleware stack."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware import (
+    AdmissionMiddleware,
+    LlmUsageMiddleware,
+    RateLimitMiddleware,
+    RequestContextMiddleware,
+)
+from core.admission import AdmissionController, RouteAdmission
+from core.llm_usage import current_usage
+from services.usage_ledger import UsageLedger
+
+
+def _client() -> TestClient:
+    application = FastAPI()
+    application.add_middleware(RateLimitMiddleware, limits={"POST /work": "2/minute"})
+    application.add_middleware(RequestContextMiddleware)
+
+    @application.post("/work")
+    async def work() -> dict[str, bool]:
+        return {"done": True}
+
+    @application.get("/free")
+    async def free() -> dict[str, bool]:
+        return {"done": True}
+
+    return TestClient(application)
+
+
+def test_rate_limited_route_returns_429_with_retry_after() -> None:
+    client = _client()
+
+    statuses = [client.post("/work").status_code for _ in range(3)]
+    rejected = client.post("/work")
+
+    assert statuses == [200, 200, 429]
+    assert rejected.json()["error"] == "rate_limited"
+    assert int(rejected.headers["retry-after"]) >= 1
+    assert all(client.get("/free").status_code == 200 for _ in range(5))
+
+
+def test_request_id_is_generated_or_propagated() -> None:
+    client = _client()
+
+    generated = client.get("/free")
+    propagated = client.get("/free", headers={"X-Request-ID": "trace-123"})
+    malformed = client.get("/free", headers={"X-Request-ID": "bad id with spaces"})
+
+    assert len(generated.headers["x-request-id"]) == 32
+    assert propagated.headers["x-request-id"] == "trace-123"
+    assert malformed.headers["x-request-id"] != "bad id with spaces"
+    assert generated.headers["server-timing"].startswith("app;dur=")
+
+
+def test_llm_usage_is_exposed_in_header_and_written_to_ledger(tmp_path: Path) -> None:
+    ledger = UsageLedger(tmp_path / "usage.sqlite3")
+    application = FastAPI()
+    application.add_middleware(LlmUsageMiddleware, ledger=ledger, expose_header=True)
+    application.add_middleware(RequestContextMiddleware)
+
+    @application.post("/generate")
+    async def generate() -> dict[str, bool]:
+        current_usage().record("cv", model="m", input_tokens=120, output_tokens=30, latency_ms=12.4)
+        return {"done": True}
+
+    @application.get("/plain")
+    async def plain() -> dict[str, bool]:
+        return {"done": True}
+
+    client = TestClient(application)
+    response = client.post("/generate")
+
+    assert response.headers["x-llm-usage"] == "cv;in=120;out=30;ms=12"
+    assert "x-llm-usage" not in client.get("/plain").headers
+    (row,) = ledger.summary()
+    assert (row["chain"], row["input_tokens"], row["requests"]) == ("cv", 120, 1)
+    ledger.close()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_admission_sheds_guarded_route_with_503_while_full(anyio_backend: str) -> None:
+    controller = AdmissionController(routes={"POST /slow": RouteAdmission(max_in_flight=1)}, retry_after=7)
+    application = FastAPI()
+    application.add_middleware(AdmissionMiddleware, controller=controller)
+    started, finish = asyncio.Event(), asyncio.Event()
+
+    @application.post("/slow")
+    async def slow() -> dict[str, bool]:
+        started.set()
+        await finish.wait()
+        return {"done": True}
+
+    @application.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.post("/slow"))
+        await started.wait()
+        shed = await client.post("/slow")
+        health_response = await client.get("/health")
+        finish.set()
+        admitted = await first
+
+    assert (admitted.status_code, shed.status_code, health_response.status_code) == (200, 503, 200)
+    assert shed.headers["retry-after"] == "7"
+    assert shed.json()["reason"] == "in_flight"
+    assert controller.snapshot()["in_flight"] == {"POST /slow": 0}
+
+
+def test_draining_admission_refuses_work_but_serves_probes() -> None:
+    controller = AdmissionController(routes={})
+    controller.draining = True
+    application = FastAPI()
+    application.add_middleware(AdmissionMiddleware, controller=controller)
+
+    @application.post("/work")
+    async def work() -> dict[str, bool]:
+        return {"done": True}
+
+    @application.get("/ready")
+    async def ready() -> dict[str, str]:
+        return {"status": "ready"}
+
+    client = TestClient(application)
+    refused = client.post("/work")
+
+    assert refused.status_code == 503
+    assert refused.json()["reason"] == "shutting_down"
+    assert client.get("/ready").status_code == 200
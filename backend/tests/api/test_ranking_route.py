@@ -0,0 +1,35 @@
+"""Tests for the /rank-jobs endpoint."""
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_rank_jobs_returns_best_match_first() -> None:
+    from app.main import app
+
+    client = TestClient(app)
+    payload = {
+        "cvText": "Python developer with FastAPI and Docker experience.",
+        "jobs": [
+            {"id": "a", "title": "Illustrator", "company": "Studio", "description": "Draw things.", "skills": ["Figma"]},
+            {"id": "b", "title": "API Developer", "company": "Corp", "description": "Python APIs.", "skills": ["Python", "FastAPI"]},
+        ],
+        "limit": 1,
+    }
+
+    response = client.post("/rank-jobs", json=payload)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["jobId"] for item in body["rankings"]] == ["b"]
+    assert body["rankings"][0]["matchedSkills"] == ["Python", "FastAPI"]
+    assert body["rankings"][0]["index"] == 1
+    assert body["elapsedMs"] >= 0
+
+
+def test_rank_jobs_rejects_empty_job_list() -> None:
+    from app.main import app
+
+    response = TestClient(app).post("/rank-jobs", json={"cvText": "x", "jobs": []})
+
+    assert response.status_code == 422
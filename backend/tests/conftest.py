@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -24,6 +25,16 @@ def load_env() -> None:
     _load_env_file()
 
 
+@pytest.fixture(autouse=True)
+def reset_app_state() -> None:
+    """Route tests share the module-level app; give each test fresh rate-limit buckets and
+    an admission controller that is not left draining by an earlier shutdown test."""
+    main = sys.modules.get("app.main")
+    if main is not None:
+        main.app.state.limiter.reset()
+        main.app.state.admission.resume()
+
+
 @pytest.fixture(scope="session")
 def require_gemini_key() -> None:
     """Skip integration tests when GOOGLE_API_KEY is missing."""
@@ -0,0 +1,107 @@
+"""Tests for admission control and event-loop lag measurement."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from core.admission import AdmissionController, LoopLagMonitor, RouteAdmission
+
+
+class _FixedLag(LoopLagMonitor):
+    def __init__(self, lag: float = 0.0) -> None:
+        super().__init__()
+        self.value = lag
+
+    @property
+    def lag(self) -> float:
+        return self.value
+
+
+def test_controller_caps_in_flight_requests_per_route() -> None:
+    controller = AdmissionController(routes={"POST /work": RouteAdmission(max_in_flight=2)}, lag_monitor=_FixedLag())
+
+    assert controller.try_admit("POST /work") is None
+    assert controller.try_admit("POST /work") is None
+    assert controller.try_admit("POST /work") == "in_flight"
+
+    controller.release("POST /work")
+    assert controller.try_admit("POST /work") is None
+    assert controller.snapshot()["in_flight"] == {"POST /work": 2}
+    assert not controller.guards("GET /health")
+
+
+def test_controller_sheds_on_loop_lag_and_llm_backlog() -> None:
+    lag = _FixedLag()
+    llm_calls = 0
+    controller = AdmissionController(
+        routes={"POST /llm": RouteAdmission(max_in_flight=10, llm_bound=True), "POST /cpu": RouteAdmission(10)},
+        max_loop_lag=0.2,
+        max_llm_in_flight=4,
+        llm_in_flight=lambda: llm_calls,
+        lag_monitor=lag,
+    )
+
+    lag.value = 0.5
+    assert controller.try_admit("POST /llm") == "loop_lag"
+    assert controller.try_admit("POST /cpu") == "loop_lag"
+
+    lag.value = 0.0
+    llm_calls = 4
+    assert controller.try_admit("POST /llm") == "llm_queue"
+    assert controller.try_admit("POST /cpu") is None
+    assert controller.snapshot()["in_flight"] == {"POST /llm": 0, "POST /cpu": 1}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_lag_monitor_reports_a_blocked_loop(anyio_backend: str) -> None:
+    now = [0.0]
+    monitor = LoopLagMonitor(interval=0.01, clock=lambda: now[0])
+    assert monitor.lag == 0.0
+
+    monitor.ensure_running()
+    await asyncio.sleep(0.05)
+    assert monitor.lag < 0.1
+
+    now[0] += 0.2  # the loop is blocked: the next tick is overdue before it can run
+    assert monitor.lag >= 0.15
+    await asyncio.sleep(0.05)
+    assert monitor.lag < 0.1
+
+    monitor.stop()
+    assert not monitor.running and monitor.lag == 0.0
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_drain_refuses_new_work_and_waits_for_admitted_requests(anyio_backend: str) -> None:
+    controller = AdmissionController(routes={"POST /work": RouteAdmission(max_in_flight=5)}, lag_monitor=_FixedLag())
+    assert controller.try_admit("POST /work") is None
+    assert controller.try_admit("POST /other") is None
+
+    draining = asyncio.ensure_future(controller.drain())
+    await asyncio.sleep(0)
+    assert controller.try_admit("POST /other") == "shutting_down"
+    controller.release("POST /work")
+    await asyncio.sleep(0)
+    assert not draining.done()
+    controller.release("POST /other")
+
+    await draining
+    assert controller.active == 0
+    controller.resume()
+    assert controller.try_admit("POST /work") is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_drain_gives_up_after_its_budget(anyio_backend: str) -> None:
+    controller = AdmissionController(routes={}, lag_monitor=_FixedLag())
+    controller.try_admit("POST /stuck")
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            await controller.drain()
+    assert controller.active == 1
+    assert controller.snapshot()["draining"] is True
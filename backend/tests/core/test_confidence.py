@@ -0,0 +1,51 @@
+"""Tests for the scraped-job confidence scorer."""
+from __future__ import annotations
+
+from core.confidence import score_scraped_job
+from services.scraper import ScrapedJob
+
+_RICH_DESCRIPTION = "\n".join(
+    [
+        "About the role: you will design and operate the payment platform used by millions of customers. " * 5,
+        "- Build event-driven services in Python and Go with strong observability practices.",
+        "- Own PostgreSQL schemas, Kafka topics and the CI/CD pipelines that ship them safely.",
+        "- Mentor engineers, lead design reviews and partner with product on the roadmap.",
+    ]
+)
+
+
+def _job(**overrides: object) -> ScrapedJob:
+    base: dict[str, object] = {
+        "url": "https://portal.gupy.io/job/1",
+        "board": "gupy",
+        "title": "Senior Backend Engineer",
+        "company": "Pay Corp",
+        "description": _RICH_DESCRIPTION,
+        "skills": ["Python", "Go", "PostgreSQL", "Kafka", "CI/CD"],
+        "source": "embedded_json",
+    }
+    base.update(overrides)
+    return ScrapedJob(**base)
+
+
+def test_complete_structured_scrape_scores_high() -> None:
+    report = score_scraped_job(_job())
+
+    assert report.score >= 0.9
+    assert report.components["skills"] == 1.0
+
+
+def test_generic_page_with_placeholders_and_no_skills_scores_low() -> None:
+    report = score_scraped_job(
+        _job(board="generic", source="html", title="Unknown Position", company="Unknown Company", skills=[])
+    )
+
+    assert report.score < 0.4
+    assert report.components["fields"] == 0.0
+    assert report.components["source"] == 0.0
+
+
+def test_sentence_like_skills_do_not_count() -> None:
+    report = score_scraped_job(_job(skills=["Experience building distributed systems at scale"] * 5))
+
+    assert report.components["skills"] == 0.0
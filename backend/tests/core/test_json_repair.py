@@ -0,0 +1,26 @@
+"""Tests for local repair of LLM-produced JSON."""
+from __future__ import annotations
+
+import pytest
+
+from core.json_repair import JsonRepairError, repair_json
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('```json\n{"title": "Dev"}\n```', {"title": "Dev"}),
+        ('Sure! Here it is: {"skills": ["Go", "SQL",]} Let me know.', {"skills": ["Go", "SQL"]}),
+        ('{"title": "Dev", "skills": ["Python", "Fast', {"title": "Dev", "skills": ["Python", "Fast"]}),
+        ('{"title": "Dev", "company": "Acme", "desc', {"title": "Dev", "company": "Acme"}),
+        ('{"title": "Dev", "company":', {"title": "Dev"}),
+        ('{"meta": {"count": 2,', {"meta": {"count": 2}}),
+    ],
+)
+def test_repair_json_recovers_common_defects(raw: str, expected: object) -> None:
+    assert repair_json(raw) == expected
+
+
+def test_repair_json_rejects_text_without_json() -> None:
+    with pytest.raises(JsonRepairError):
+        repair_json("not-json")
@@ -0,0 +1,71 @@
+"""Tests for LLM token usage accounting."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+
+from core.llm_usage import UsageTracker, current_usage, track_usage, usage_config
+from core.metrics import metrics
+
+
+def _chain(*replies: AIMessage):
+    llm = GenericFakeChatModel(messages=iter(replies))
+    return ChatPromptTemplate.from_messages([("human", "{question}")]) | llm | StrOutputParser()
+
+
+def _reply(text: str, input_tokens: int, output_tokens: int) -> AIMessage:
+    return AIMessage(
+        content=text,
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        },
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_usage_is_aggregated_per_chain_across_concurrent_calls(anyio_backend: str) -> None:
+    before = metrics.counter("llm.input_tokens.cv")
+    with track_usage() as tracker:
+        await asyncio.gather(
+            _chain(_reply("cv", 100, 40)).ainvoke({"question": "a"}, config=usage_config("cv")),
+            _chain(_reply("cv again", 50, 10)).ainvoke({"question": "b"}, config=usage_config("cv")),
+            _chain(_reply("letter", 80, 60)).ainvoke({"question": "c"}, config=usage_config("cover_letter")),
+        )
+
+    assert current_usage() is None
+    assert tracker.calls == 3
+    assert (tracker.chains["cv"].input_tokens, tracker.chains["cv"].output_tokens) == (150, 50)
+    assert tracker.chains["cover_letter"].calls == 1
+    assert (tracker.input_tokens, tracker.output_tokens) == (230, 110)
+    assert tracker.header_value().startswith("cv;in=150;out=50;ms=")
+    assert metrics.counter("llm.input_tokens.cv") - before == 150
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_calls_outside_a_tracked_request_only_update_metrics(anyio_backend: str) -> None:
+    before = metrics.counter("llm.calls.extraction")
+
+    await _chain(_reply("{}", 10, 2)).ainvoke({"question": "q"}, config=usage_config("extraction"))
+
+    assert metrics.counter("llm.calls.extraction") - before == 1
+
+
+def test_cost_uses_prices_per_million_tokens() -> None:
+    tracker = UsageTracker()
+    tracker.record("cv", model="models/gemini-2.5-flash", input_tokens=2_000_000, output_tokens=1_000_000, latency_ms=5)
+    tracker.record("other", model="unpriced", input_tokens=10, output_tokens=10, latency_ms=1)
+    prices = {"gemini-2.5-flash": {"input": 0.30, "output": 2.50}}
+
+    assert tracker.chains["cv"].cost_usd(prices) == pytest.approx(3.1)
+    assert tracker.chains["other"].cost_usd(prices) is None
+    assert tracker.cost_usd(prices) == pytest.approx(3.1)
+    assert UsageTracker().cost_usd(prices) is None
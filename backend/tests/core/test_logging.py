@@ -1,8 +1,12 @@
 """Tests for structlog configuration."""
 from __future__ import annotations
 
+import io
+import json
 import logging
+import queue
 
+import structlog
 from structlog.testing import capture_logs
 
 
@@ -18,3 +22,78 @@ def test_configure_logging_returns_logger() -> None:
 
     assert captured[0]["event"] == "hello"
     assert captured[0]["key"] == "value"
+
+
+def _configure_to_buffer(**kwargs: object) -> io.StringIO:
+    from core.logging import configure_logging
+
+    buffer = io.StringIO()
+    configure_logging(stream=buffer, **kwargs)  # type: ignore[arg-type]
+    return buffer
+
+
+def _flushed_lines(buffer: io.StringIO) -> list[dict[str, object]]:
+    from core.logging import shutdown_logging
+
+    shutdown_logging()
+    return [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+
+def test_records_are_written_as_json_by_the_background_writer() -> None:
+    buffer = _configure_to_buffer(level="INFO")
+
+    structlog.get_logger("test.writer").info("written", count=3)
+
+    (record,) = [line for line in _flushed_lines(buffer) if line["event"] == "written"]
+    assert record["count"] == 3
+    assert record["level"] == "info"
+    assert "timestamp" in record
+
+
+def test_lazy_fields_are_only_evaluated_for_emitted_events() -> None:
+    from core.logging import lazy
+
+    calls: list[str] = []
+
+    def expensive(label: str) -> str:
+        calls.append(label)
+        return label.upper()
+
+    buffer = _configure_to_buffer(level="INFO")
+    logger = structlog.get_logger("test.lazy")
+    logger.debug("skipped", value=lazy(expensive, "debug"))
+    logger.info("kept", value=lazy(expensive, "info"))
+
+    records = _flushed_lines(buffer)
+    assert calls == ["info"]
+    assert [record["value"] for record in records if record["event"] == "kept"] == ["INFO"]
+
+
+def test_event_sampler_keeps_the_configured_fraction() -> None:
+    from core.logging import EventSampler
+
+    draws = iter([0.05, 0.5, 0.05])
+    sampler = EventSampler({"noisy": 0.1}, rng=lambda: next(draws))
+
+    kept = []
+    for _ in range(3):
+        try:
+            kept.append(sampler(None, "info", {"event": "noisy"}))
+        except structlog.DropEvent:
+            pass
+
+    assert kept == [{"event": "noisy", "sample_rate": 0.1}] * 2
+    assert sampler(None, "info", {"event": "other"}) == {"event": "other"}
+    assert sampler(None, "error", {"event": "noisy"}) == {"event": "noisy"}
+
+
+def test_full_queue_drops_records_instead_of_blocking() -> None:
+    from core.logging import _DroppingQueueHandler
+    from core.metrics import metrics
+
+    handler = _DroppingQueueHandler(queue.Queue(maxsize=1))
+    before = metrics.counter("logging.dropped")
+    for _ in range(3):
+        handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None))
+
+    assert metrics.counter("logging.dropped") - before == 2
@@ -0,0 +1,57 @@
+"""Tests for the vectorized CV-to-jobs ranker."""
+from __future__ import annotations
+
+from core.ranking import RankableJob, rank_jobs
+
+_CV = """
+Backend engineer with six years building Python services: FastAPI, PostgreSQL, Docker and AWS.
+Designed event-driven payment pipelines and mentored junior engineers.
+"""
+
+
+def test_rank_jobs_orders_by_fit_and_reports_skill_gaps() -> None:
+    jobs = [
+        RankableJob(
+            title="Product Designer",
+            description="Own the design system in Figma and run user research sessions.",
+            skills=["Figma", "UX Research"],
+        ),
+        RankableJob(
+            title="Backend Engineer",
+            description="Build payment services in Python with FastAPI on AWS, backed by Postgres.",
+            skills=["Python", "FastAPI", "PostgreSQL", "Kafka"],
+        ),
+        RankableJob(
+            title="Data Engineer",
+            description="Maintain Airflow pipelines and Python jobs feeding the warehouse.",
+            skills=["Python", "Airflow"],
+        ),
+    ]
+
+    rankings = rank_jobs(_CV, jobs)
+
+    assert [ranking.index for ranking in rankings] == [1, 2, 0]
+    best = rankings[0]
+    assert best.matched_skills == ["Python", "FastAPI", "PostgreSQL"]
+    assert best.missing_skills == ["Kafka"]
+    assert best.skill_score == 0.75
+    assert 0 < best.text_score <= 1
+    assert rankings[-1].score < best.score
+
+
+def test_rank_jobs_without_skills_uses_text_only() -> None:
+    jobs = [
+        RankableJob(title="Chef", description="Prepare seasonal menus in a busy kitchen."),
+        RankableJob(title="Engineer", description="Python services and payment pipelines."),
+    ]
+
+    rankings = rank_jobs(_CV, jobs)
+
+    assert rankings[0].index == 1
+    assert rankings[0].skill_score is None
+    assert rankings[1].score == 0
+
+
+def test_rank_jobs_handles_empty_input() -> None:
+    assert rank_jobs(_CV, []) == []
+    assert rank_jobs(_CV, [RankableJob(title="", description="")])[0].score == 0
@@ -0,0 +1,46 @@
+"""Tests for the inbound rate limiter."""
+from __future__ import annotations
+
+import pytest
+
+from core.rate_limit import RateLimit, RateLimiter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_parse_accepts_common_rate_formats() -> None:
+    assert RateLimit.parse("10/minute") == RateLimit(count=10, period=60)
+    assert RateLimit.parse("100 per 5 minutes") == RateLimit(count=100, period=300)
+    assert RateLimit.parse("2/second") == RateLimit(count=2, period=1)
+    with pytest.raises(ValueError):
+        RateLimit.parse("often")
+
+
+def test_limiter_is_per_client_and_refills_over_the_period() -> None:
+    clock = _Clock()
+    limiter = RateLimiter(clock=clock)
+    limit = RateLimit(count=2, period=60)
+
+    assert limiter.hit("POST /x", "1.1.1.1", limit) == 0
+    assert limiter.hit("POST /x", "1.1.1.1", limit) == 0
+    assert limiter.hit("POST /x", "1.1.1.1", limit) == pytest.approx(30)
+    assert limiter.hit("POST /x", "2.2.2.2", limit) == 0
+
+    clock.now = 30
+    assert limiter.hit("POST /x", "1.1.1.1", limit) == 0
+
+
+def test_limiter_bounds_the_number_of_tracked_clients() -> None:
+    limiter = RateLimiter(max_keys=2)
+    limit = RateLimit(count=1, period=60)
+    for client in ("a", "b", "c"):
+        limiter.hit("GET /", client, limit)
+
+    # "a" was evicted, so it starts with a fresh bucket.
+    assert limiter.hit("GET /", "a", limit) == 0
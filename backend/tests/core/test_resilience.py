@@ -0,0 +1,75 @@
+"""Tests for the token bucket and circuit breaker primitives."""
+from __future__ import annotations
+
+import pytest
+
+from core.resilience import CircuitBreaker, CircuitOpenError, OutcomeWindow, TokenBucket
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_paces() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_circuit_breaker_opens_after_threshold_and_probes_after_cooldown() -> None:
+    clock = _FakeClock()
+    breaker = CircuitBreaker(name="example.com", failure_threshold=2, cooldown=30.0, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.check()
+    assert excinfo.value.retry_after == pytest.approx(30.0)
+
+    clock.now = 31.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow(), "only one probe may run while half-open"
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_circuit_breaker_failed_probe_reopens() -> None:
+    clock = _FakeClock()
+    breaker = CircuitBreaker(name="example.com", failure_threshold=1, cooldown=5.0, clock=clock)
+
+    breaker.record_failure()
+    clock.now = 6.0
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.retry_after() == pytest.approx(5.0)
+
+
+def test_outcome_window_reports_p95_and_error_rate_of_recent_calls() -> None:
+    window = OutcomeWindow(size=20)
+    for latency in range(1, 21):
+        window.record(float(latency), ok=latency % 5 != 0)
+
+    assert window.percentile(0.95) == 19.0
+    assert window.error_rate() == pytest.approx(0.2)
+
+    window.record(100.0, ok=True)  # evicts the oldest sample
+    assert len(window) == 20
+    assert window.percentile(0.95) == 20.0
@@ -0,0 +1,47 @@
+"""Tests for the skill taxonomy matcher and the heuristic score built on it."""
+from __future__ import annotations
+
+from core.scoring import calculate_heuristic_score
+from core.skills import SkillMatcher, canonicalize_skills, get_skill_matcher
+
+
+def test_extract_canonicalizes_aliases_in_order_of_appearance() -> None:
+    text = "Stack: Python3, JS and TypeScript on Node.js, deployed to k8s via CI/CD. Postgres a plus."
+
+    skills = get_skill_matcher().extract(text)
+
+    assert skills == ["Python", "JavaScript", "TypeScript", "Node.js", "Kubernetes", "CI/CD", "PostgreSQL"]
+
+
+def test_extract_prefers_longest_match_and_respects_word_boundaries() -> None:
+    matcher = get_skill_matcher()
+
+    assert matcher.extract("Mobile apps in React Native") == ["React Native"]
+    assert matcher.extract("We use postgresql and nosql stores") == ["PostgreSQL"]
+    assert matcher.extract("C++ and C# experience") == ["C++", "C#"]
+
+
+def test_ambiguous_aliases_only_canonicalize_explicit_entries() -> None:
+    matcher = get_skill_matcher()
+
+    assert matcher.extract("Ready to go the extra mile in spring") == []
+    assert matcher.canonical("go") == "Go"
+    assert matcher.canonical("  Docker &  Kubernetes ") == "Docker & Kubernetes"
+
+
+def test_canonicalize_skills_merges_aliases() -> None:
+    assert canonicalize_skills(["JS", "Javascript", "javascript", " ", "Airflow"]) == ["JavaScript", "Airflow"]
+
+
+def test_matcher_accepts_custom_taxonomy() -> None:
+    matcher = SkillMatcher({"Vector Search": ["ann search", "vector db"]})
+
+    assert matcher.extract("Experience with ANN search and a vector DB") == ["Vector Search"]
+
+
+def test_heuristic_score_treats_aliases_as_the_same_skill() -> None:
+    cv_text = "Frontend developer: JS, React and some Rust."
+
+    assert calculate_heuristic_score(["JavaScript", "Javascript", "JS"], cv_text) == 100
+    assert calculate_heuristic_score(["JavaScript", "Kotlin"], cv_text) == 50
+    assert calculate_heuristic_score(["Custom DSL"], "Wrote a custom DSL") == 100
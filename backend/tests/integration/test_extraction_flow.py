@@ -18,6 +18,9 @@ from services.scraper import WebScraperService
 
 def _mock_async_client(expected_url: str, html: str) -> httpx.AsyncClient:
     def _handler(request: httpx.Request) -> httpx.Response:
+        if "/jobs-guest/" in request.url.path:
+            # Lightweight guest fragment is attempted first; decline it to exercise the page fallback.
+            return httpx.Response(status_code=404)
         assert str(request.url) == expected_url
         return httpx.Response(status_code=200, text=html)
 
@@ -0,0 +1,105 @@
+"""Tests for the board-specific lightweight data sources, using recorded page fixtures."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from services.host_scheduler import HostPolicy, HostScheduler
+from services.scraper import WebScraperService
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "scraper"
+
+
+class _FixtureServer:
+    """Stub HTTP server that answers known URLs with recorded fixtures and 404s otherwise."""
+
+    def __init__(self, routes: dict[str, str]) -> None:
+        self._routes = routes
+        self.requested: list[str] = []
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        self.requested.append(url)
+        fixture = self._routes.get(url)
+        if fixture is None:
+            return httpx.Response(404, text="not found")
+        return httpx.Response(200, text=(FIXTURES / fixture).read_text(encoding="utf-8"))
+
+
+@pytest.mark.anyio
+async def test_linkedin_uses_guest_fragment_instead_of_full_page() -> None:
+    server = _FixtureServer(
+        {"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/3901234567": "linkedin_guest_fragment.html"}
+    )
+    async with server.client() as client:
+        job = await WebScraperService(client=client).fetch_job(
+            "https://www.linkedin.com/jobs/view/staff-data-engineer-at-nimbus-3901234567/?trk=feed"
+        )
+
+    assert server.requested == ["https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/3901234567"]
+    assert job.source == "fragment"
+    assert job.url.endswith("?trk=feed")
+    assert job.title == "Staff Data Engineer"
+    assert job.company == "Nimbus Analytics"
+    assert "lakehouse platform" in job.description
+
+
+@pytest.mark.anyio
+async def test_gupy_reads_next_data_json() -> None:
+    url = "https://aurora.gupy.io/jobs/5512"
+    server = _FixtureServer({url: "gupy_job.html"})
+    async with server.client() as client:
+        job = await WebScraperService(client=client).fetch_job(url)
+
+    assert job.source == "embedded_json"
+    assert job.title == "Pessoa Desenvolvedora Python"
+    assert job.company == "Aurora Pagamentos"
+    assert "Desenhar APIs resilientes" in job.description
+    assert job.skills == ["Python", "PostgreSQL", "Docker & Kubernetes"]
+
+
+@pytest.mark.anyio
+async def test_indeed_reads_initial_data_json() -> None:
+    url = "https://br.indeed.com/viewjob?jk=abc123"
+    server = _FixtureServer({url: "indeed_job.html"})
+    async with server.client() as client:
+        job = await WebScraperService(client=client).fetch_job(url)
+
+    assert job.source == "embedded_json"
+    assert job.title == "Site Reliability Engineer"
+    assert job.company == "Orbit Labs"
+    assert job.skills == ["Go", "Terraform", "Kubernetes"]
+
+
+@pytest.mark.anyio
+async def test_linkedin_falls_back_to_full_page_when_fragment_is_unavailable() -> None:
+    url = "https://www.linkedin.com/jobs/view/3901234567"
+    server = _FixtureServer({url: "linkedin_guest_fragment.html"})
+    async with server.client() as client:
+        job = await WebScraperService(client=client).fetch_job(url)
+
+    assert server.requested == ["https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/3901234567", url]
+    assert job.source == "html"
+    assert job.company == "Nimbus Analytics"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_linkedin_fragment_misses_do_not_open_the_host_circuit(anyio_backend: str) -> None:
+    pages = [f"https://www.linkedin.com/jobs/view/39012345{n}" for n in range(60, 64)]
+    server = _FixtureServer({page: "linkedin_guest_fragment.html" for page in pages})
+    scheduler = HostScheduler(policy=HostPolicy(rate_per_second=100.0, failure_threshold=2, cooldown_seconds=60.0))
+    async with server.client() as client:
+        service = WebScraperService(client=client, scheduler=scheduler)
+        jobs = [await service.fetch_job(page) for page in pages]
+
+    assert [job.company for job in jobs] == ["Nimbus Analytics"] * len(pages)
+    assert len(server.requested) == 2 * len(pages)
+    snapshot = scheduler.snapshot()["www.linkedin.com"]
+    assert snapshot["state"] == "closed"
+    assert snapshot["failures"] == 0
@@ -0,0 +1,53 @@
+"""Tests for the HTML-to-text content minimizer."""
+from __future__ import annotations
+
+from services.content_minimizer import estimate_tokens, minimize_html, novel_text
+
+_PAGE = """
+<html>
+  <head><style>.x { color: red }</style><script>trackPageView();</script></head>
+  <body>
+    <header><a href="/">Home</a> <a href="/jobs">Jobs</a></header>
+    <div class="sidebar related-jobs">
+      <p><a href="/j/1">Another job, apply now, great benefits</a></p>
+      <p><a href="/j/2">Yet another job, apply today, remote friendly</a></p>
+    </div>
+    <div class="job-description">
+      <p>We are hiring a backend engineer to build payment APIs, queues, and ledgers.</p>
+      <p>You will own services end to end, from design reviews to on-call rotations.</p>
+      <ul><li>Five years with Python, PostgreSQL, and event-driven architectures.</li></ul>
+    </div>
+    <footer>© 2025 Example Inc. All rights reserved, privacy, terms.</footer>
+  </body>
+</html>
+"""
+
+
+def test_minimize_html_keeps_main_region_and_drops_boilerplate() -> None:
+    text = minimize_html(_PAGE)
+
+    assert text.splitlines()[0].startswith("We are hiring a backend engineer")
+    assert "Python, PostgreSQL" in text
+    assert "trackPageView" not in text
+    assert "Another job" not in text
+    assert "All rights reserved" not in text
+    assert "<" not in text
+
+
+def test_minimize_html_respects_limit() -> None:
+    text = minimize_html(_PAGE, limit=60)
+
+    assert len(text) <= 62
+    assert text.endswith("…")
+
+
+def test_novel_text_drops_excerpt_already_covered_by_reference() -> None:
+    description = "We are hiring a backend engineer to build payment APIs, queues, and ledgers."
+
+    assert novel_text("We are hiring a backend engineer to build payment APIs", description) == ""
+    assert novel_text("Benefits include equity and a learning budget", description) != ""
+
+
+def test_estimate_tokens_scales_with_length() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 100) == 100
@@ -0,0 +1,39 @@
+"""Tests for the server-side CV store."""
+from __future__ import annotations
+
+from services.cv_store import CvStore, cv_fingerprint
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_put_is_keyed_by_content_hash() -> None:
+    store = CvStore()
+
+    first = store.put("Jane Doe\nPython developer", filename="cv.pdf")
+    second = store.put("Jane Doe\nPython developer", filename="cv-copy.pdf")
+
+    assert first == second == cv_fingerprint("Jane Doe\nPython developer")
+    assert len(store) == 1
+    assert store.get(first).filename == "cv-copy.pdf"
+
+
+def test_entries_expire_after_idle_ttl_and_lru_is_bounded() -> None:
+    clock = _Clock()
+    store = CvStore(max_entries=2, ttl_seconds=10, clock=clock)
+    old = store.put("old cv")
+    clock.now = 8
+    assert store.get(old) is not None  # refreshes the expiry
+    clock.now = 16
+    assert store.get(old) is not None
+    clock.now = 30
+    assert store.get(old) is None
+
+    a, b, c = store.put("a"), store.put("b"), store.put("c")
+    assert store.get(a) is None
+    assert store.get(b) is not None and store.get(c) is not None
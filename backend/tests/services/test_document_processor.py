@@ -1,8 +1,13 @@
 """Tests for DocumentProcessor service."""
 import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from fastapi import UploadFile, HTTPException
 from services.document_processor import DocumentProcessor
+from services.text_cache import ExtractedTextCache
 
 def test_extract_from_txt():
     content = b"Hello world"
@@ -20,5 +25,87 @@ def test_extract_unsupported_format():
     assert exc.value.status_code == 400
     assert "Unsupported file type" in exc.value.detail
 
+def test_extract_text_reuses_cached_result_for_identical_upload(tmp_path, monkeypatch):
+    cache = ExtractedTextCache(directory=tmp_path, memory_entries=4, disk_entries=4)
+    calls = []
+    original = DocumentProcessor._extract_from_txt
+
+    def counting(file_obj):
+        calls.append(1)
+        return original(file_obj)
+
+    monkeypatch.setattr(DocumentProcessor, "_extract_from_txt", staticmethod(counting))
+
+    def upload():
+        return UploadFile(filename="cv.txt", file=io.BytesIO(b"Jane Doe"), headers={"content-type": "text/plain"})
+
+    assert DocumentProcessor.extract_text(upload(), cache=cache) == "Jane Doe"
+    assert DocumentProcessor.extract_text(upload(), cache=cache) == "Jane Doe"
+    assert len(calls) == 1
+
+    # A fresh process only has the disk tier.
+    restarted = ExtractedTextCache(directory=tmp_path, memory_entries=4, disk_entries=4)
+    assert DocumentProcessor.extract_text(upload(), cache=restarted) == "Jane Doe"
+    assert len(calls) == 1
+
+
+def test_text_cache_is_bounded_and_versioned(tmp_path):
+    cache = ExtractedTextCache(directory=tmp_path, memory_entries=1, disk_entries=2)
+    for index in range(3):
+        cache.put(cache.key(f"hash{index}", kind="pdf", parser_version="1"), f"text {index}")
+
+    assert len(list(tmp_path.glob("*.txt"))) == 2
+    assert cache.get(cache.key("hash2", kind="pdf", parser_version="1")) == "text 2"
+    assert cache.get(cache.key("hash2", kind="pdf", parser_version="2")) is None
+
+
+def test_text_cache_lookup_is_not_broken_by_a_concurrent_eviction(tmp_path):
+    cache = ExtractedTextCache(directory=tmp_path, memory_entries=1, disk_entries=0)
+    first, second = (cache.key(f"hash{index}", kind="txt", parser_version="1") for index in range(2))
+    cache.put(first, "first")
+
+    class _EvictDuringLookup(OrderedDict):
+        def get(self, key, default=None):
+            value = super().get(key, default)
+            # Another upload evicts `key` right after it was found (unless the cache is locked).
+            evicting = threading.Thread(target=cache.put, args=(second, "second"))
+            evicting.start()
+            evicting.join(timeout=0.2)
+            return value
+
+    cache._memory = _EvictDuringLookup(cache._memory)
+
+    assert cache.get(first) == "first"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_extract_text_async_parses_in_a_process_pool_and_caches(tmp_path, anyio_backend):
+    cache = ExtractedTextCache(directory=tmp_path, memory_entries=4, disk_entries=4)
+
+    def upload():
+        return UploadFile(filename="cv.txt", file=io.BytesIO("Jos\u00e9".encode("latin-1")), headers={"content-type": "text/plain"})
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        text = await DocumentProcessor.extract_text_async(upload(), cache=cache, executor=pool)
+    cached = await DocumentProcessor.extract_text_async(upload(), cache=cache)
+
+    assert text == cached == "Jos\u00e9"
+    assert len(list(tmp_path.glob("*.txt"))) == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_extract_text_async_reports_unsupported_and_broken_files(anyio_backend):
+    unsupported = UploadFile(filename="cv.exe", file=io.BytesIO(b"MZ"), headers={"content-type": "application/x-msdownload"})
+    broken = UploadFile(filename="cv.pdf", file=io.BytesIO(b"not a pdf"), headers={"content-type": "application/pdf"})
+
+    with pytest.raises(HTTPException) as exc:
+        await DocumentProcessor.extract_text_async(unsupported)
+    assert exc.value.status_code == 400
+    with pytest.raises(HTTPException) as exc:
+        await DocumentProcessor.extract_text_async(broken)
+    assert exc.value.status_code == 500
+
 # Note: Testing PDF/DOCX requires actual files or mocking pypdf/docx
 # For this quick test, we verify the logic flow and TXT support.
@@ -0,0 +1,109 @@
+"""Tests for the streaming DOCX text extractor."""
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+
+from services.document_processor import DocumentProcessor
+from services.docx_text import extract_docx_text
+
+_NS = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+)
+
+
+def _p(text: str) -> str:
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def _docx(body: str, *, header: str | None = None) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", f"<w:document {_NS}><w:body>{body}</w:body></w:document>")
+        if header is not None:
+            archive.writestr("word/header1.xml", f"<w:hdr {_NS}>{header}</w:hdr>")
+    buffer.seek(0)
+    return buffer
+
+
+def test_extracts_headers_paragraphs_and_tables_in_reading_order() -> None:
+    body = (
+        _p("Experience")
+        + "<w:tbl><w:tr>"
+        + f"<w:tc>{_p('2020-2024')}</w:tc><w:tc>{_p('Backend Engineer')}{_p('Pay Corp')}</w:tc>"
+        + "</w:tr><w:tr>"
+        + f"<w:tc>{_p('2018-2020')}</w:tc><w:tc>{_p('Developer')}</w:tc>"
+        + "</w:tr></w:tbl>"
+        + "<w:p><w:r><w:t xml:space=\"preserve\">Skills: </w:t></w:r><w:r><w:t>Python</w:t><w:tab/><w:t>SQL</w:t></w:r></w:p>"
+    )
+
+    text = extract_docx_text(_docx(body, header=_p("Jane Doe - jane@example.com")))
+
+    assert text.splitlines() == [
+        "Jane Doe - jane@example.com",
+        "Experience",
+        "2020-2024 | Backend Engineer Pay Corp",
+        "2018-2020 | Developer",
+        "Skills: Python\tSQL",
+    ]
+
+
+def test_text_boxes_are_read_once_and_deleted_text_is_ignored() -> None:
+    body = (
+        "<w:p><w:r><mc:AlternateContent>"
+        f"<mc:Choice><w:drawing><w:txbxContent>{_p('Certifications: AWS')}</w:txbxContent></w:drawing></mc:Choice>"
+        f"<mc:Fallback><w:pict><w:txbxContent>{_p('Certifications: AWS')}</w:txbxContent></w:pict></mc:Fallback>"
+        "</mc:AlternateContent></w:r></w:p>"
+        "<w:p><w:del><w:r><w:delText>old</w:delText></w:r></w:del><w:r><w:t>Summary</w:t></w:r></w:p>"
+    )
+
+    assert extract_docx_text(_docx(body)).splitlines() == ["Certifications: AWS", "Summary"]
+
+
+def test_rejects_archives_without_a_document_part() -> None:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("readme.txt", "hello")
+    buffer.seek(0)
+
+    with pytest.raises(ValueError):
+        extract_docx_text(buffer)
+
+
+def test_rejects_parts_that_inflate_past_the_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("services.docx_text._MAX_PART_BYTES", 512)
+
+    assert extract_docx_text(_docx(_p("short"))) == "short"
+    with pytest.raises(ValueError, match="too large"):
+        extract_docx_text(_docx(_p("x" * 1024)))
+
+
+def test_external_entities_are_not_resolved(tmp_path: Path) -> None:
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top secret", encoding="utf-8")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<!DOCTYPE w:document [<!ENTITY leak SYSTEM "{secret.as_uri()}">]>'
+            f"<w:document {_NS}><w:body>{_p('Name &leak;')}</w:body></w:document>",
+        )
+    buffer.seek(0)
+
+    assert extract_docx_text(buffer) == "Name"
+
+
+def test_document_processor_reads_docx_uploads() -> None:
+    upload = UploadFile(
+        filename="cv.docx",
+        file=_docx(_p("Jane Doe")),
+        headers={"content-type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"},
+    )
+
+    assert DocumentProcessor.extract_text(upload) == "Jane Doe"
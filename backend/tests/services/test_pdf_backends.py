@@ -0,0 +1,65 @@
+"""Tests for the PDF text backends."""
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+from fastapi import UploadFile
+
+from services.document_processor import DocumentProcessor
+from services.pdf_backends import PdfOptions, available_backends, select_backend
+from services.text_cache import ExtractedTextCache
+
+_SAMPLE_PDF = Path(__file__).resolve().parents[1] / "fixtures" / "documents" / "sample_cv.pdf"
+
+
+def _pdf() -> io.BytesIO:
+    return io.BytesIO(_SAMPLE_PDF.read_bytes())
+
+
+def test_pypdf_backend_extracts_all_pages() -> None:
+    result = select_backend("pypdf").extract(_pdf())
+
+    assert result.pages == result.total_pages == 2
+    assert not result.truncated and not result.page_limited
+    assert "Senior Backend Engineer" in result.text
+    assert "Portuguese (native)" in result.text
+
+
+def test_max_pages_and_time_budget_truncate_extraction() -> None:
+    backend = select_backend("pypdf")
+
+    limited = backend.extract(_pdf(), max_pages=1)
+    assert limited.pages == 1 and limited.page_limited
+    assert not limited.truncated, "a page-limit cut is deterministic"
+    assert "Portuguese" not in limited.text
+
+    over_budget = backend.extract(_pdf(), page_time_budget=0.0)
+    assert over_budget.pages == 1 and over_budget.truncated
+    assert not over_budget.page_limited
+
+
+def test_unknown_backend_falls_back_to_fastest_available() -> None:
+    assert "pypdf" in available_backends()
+    assert select_backend("no-such-library").name == available_backends()[0]
+
+
+def test_document_processor_uses_configured_backend() -> None:
+    upload = UploadFile(filename="cv.pdf", file=_pdf(), headers={"content-type": "application/pdf"})
+
+    text = DocumentProcessor.extract_text(upload, pdf_options=PdfOptions(backend="pypdf", max_pages=5))
+
+    assert text.startswith("Jane Doe")
+
+
+def test_document_processor_caches_page_limited_pdfs_but_not_time_budget_cuts(tmp_path) -> None:
+    cache = ExtractedTextCache(directory=tmp_path, memory_entries=4, disk_entries=4)
+
+    def upload() -> UploadFile:
+        return UploadFile(filename="cv.pdf", file=_pdf(), headers={"content-type": "application/pdf"})
+
+    DocumentProcessor.extract_text(upload(), cache=cache, pdf_options=PdfOptions(backend="pypdf", max_pages=1))
+    DocumentProcessor.extract_text(upload(), cache=cache, pdf_options=PdfOptions(backend="pypdf", page_time_budget=0.0))
+
+    (cached,) = tmp_path.glob("*.txt")
+    assert cached.name.startswith("pdf-pypdf-1-"), "only the page-limited extraction was cached"
@@ -4,8 +4,10 @@ from __future__ import annotations
 import httpx
 import pytest
 
+from services.host_scheduler import HostPolicy, HostScheduler
 from services.scraper import (
     FetchError,
+    HostUnavailableError,
     ParseError,
     UnsupportedJobBoardError,
     WebScraperService,
@@ -122,6 +124,70 @@ async def test_fetch_job_unsupported_domain_uses_generic_parser() -> None:
         assert job.url == "https://example.com/jobs/1"
 
 
+@pytest.mark.anyio
+async def test_generic_parser_extracts_known_skills_from_description() -> None:
+    html = """
+    <html><body><main>
+        <h1>Platform Engineer</h1>
+        <p>You will run our golang services on k8s with Terraform and Postgres.</p>
+    </main></body></html>
+    """
+    async with _mock_client(html) as client:
+        service = WebScraperService(client=client)
+        job = await service.fetch_job("https://example.com/jobs/2")
+
+    assert job.skills == ["Go", "Kubernetes", "Terraform", "PostgreSQL"]
+
+
+@pytest.mark.anyio
+async def test_fetch_job_prefers_embedded_json_ld_job_posting() -> None:
+    html = """
+    <html>
+        <head>
+            <title>Careers</title>
+            <script type="application/ld+json">
+            {"@context": "https://schema.org", "@type": "JobPosting", "title": "Backend Engineer",
+             "hiringOrganization": {"@type": "Organization", "name": "TechCorp"},
+             "description": "<p>Design and operate APIs.</p>", "skills": ["Python", "python", "Kafka"]}
+            </script>
+        </head>
+        <body><div>Navigation noise</div></body>
+    </html>
+    """
+    async with _mock_client(html) as client:
+        service = WebScraperService(client=client)
+        job = await service.fetch_job("https://example.com/jobs/2")
+
+    assert job.source == "json_ld"
+    assert job.title == "Backend Engineer"
+    assert job.company == "TechCorp"
+    assert job.description == "Design and operate APIs."
+    assert job.skills == ["Python", "Kafka"]
+
+
+@pytest.mark.anyio
+async def test_fetch_job_keeps_bounded_preview_and_compressed_page() -> None:
+    filler = "<p>" + "Lorem ipsum dolor sit amet. " * 4000 + "</p>"
+    html = f"""
+    <html>
+      <body>
+        <h1 class="top-card-layout__title">Senior Backend Engineer</h1>
+        <a class="topcard__org-name-link">Tech Corp</a>
+        <div class="description__text">{filler}</div>
+      </body>
+    </html>
+    """
+    async with _mock_client(html) as client:
+        service = WebScraperService(client=client)
+        job = await service.fetch_job("https://www.linkedin.com/jobs/view/123")
+
+    assert job.raw_html == ""
+    assert 0 < len(job.preview) <= 2000
+    assert job.html_ref is not None
+    assert len(job.html_ref.data) < len(html) // 10
+    assert job.html() == html
+
+
 @pytest.mark.anyio
 async def test_fetch_job_wraps_http_errors() -> None:
     async with _mock_client("boom", status=500) as client:
@@ -144,3 +210,51 @@ async def test_fetch_job_raises_for_missing_required_fields() -> None:
         service = WebScraperService(client=client)
         with pytest.raises(ParseError):
             await service.fetch_job("https://www.linkedin.com/jobs/view/111")
+
+
+_GENERIC_MINIMAL = """
+<html>
+  <head><title>Platform Engineer</title></head>
+  <body><main>Run the platform.</main></body>
+</html>
+"""
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_fetch_job_fast_fails_once_host_circuit_opens(anyio_backend: str) -> None:
+    calls = 0
+
+    def _handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(status_code=429, text="slow down")
+
+    scheduler = HostScheduler(policy=HostPolicy(rate_per_second=100.0, failure_threshold=2, cooldown_seconds=60.0))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        service = WebScraperService(client=client, scheduler=scheduler)
+        for _ in range(2):
+            with pytest.raises(FetchError):
+                await service.fetch_job("https://careers.example.com/jobs/1")
+        with pytest.raises(HostUnavailableError) as excinfo:
+            await service.fetch_job("https://careers.example.com/jobs/2")
+
+    assert calls == 2
+    assert excinfo.value.retry_after > 0
+    assert scheduler.snapshot()["careers.example.com"]["state"] == "open"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_fetch_job_serves_cached_job_while_circuit_is_open(anyio_backend: str) -> None:
+    responses = iter([httpx.Response(200, text=_GENERIC_MINIMAL), httpx.Response(503, text="down")])
+    scheduler = HostScheduler(policy=HostPolicy(rate_per_second=100.0, failure_threshold=1))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(lambda _: next(responses))) as client:
+        service = WebScraperService(client=client, scheduler=scheduler)
+        url = "https://careers.example.com/jobs/42"
+        fresh = await service.fetch_job(url)
+        with pytest.raises(FetchError):
+            await service.fetch_job(url)
+        cached = await service.fetch_job(url)
+
+    assert cached == fresh
@@ -0,0 +1,49 @@
+"""Tests for schema.org JSON-LD job posting extraction."""
+from __future__ import annotations
+
+import json
+
+from services.structured_data import parse_job_posting
+
+
+def _page(*blocks: object) -> str:
+    scripts = "".join(
+        f'<script type="application/ld+json">{json.dumps(block)}</script>' for block in blocks
+    )
+    return f"<html><head>{scripts}</head><body><h1>ignored</h1></body></html>"
+
+
+def test_parse_job_posting_reads_graph_and_html_description() -> None:
+    html = _page(
+        {"@type": "Organization", "name": "Not the posting"},
+        {
+            "@context": "https://schema.org",
+            "@graph": [
+                {
+                    "@type": "JobPosting",
+                    "title": "Data Engineer",
+                    "hiringOrganization": {"@type": "Organization", "name": "Acme &amp; Co"},
+                    "description": "&lt;p&gt;Build pipelines.&lt;/p&gt;&lt;ul&gt;&lt;li&gt;Own ETL&lt;/li&gt;&lt;/ul&gt;",
+                    "skills": "Python, SQL; Airflow",
+                    "qualifications": "3+ years with Spark",
+                }
+            ],
+        },
+    )
+
+    posting = parse_job_posting(html)
+
+    assert posting is not None
+    assert posting.title == "Data Engineer"
+    assert posting.company == "Acme & Co"
+    assert posting.description.splitlines() == ["Build pipelines.", "Own ETL", "3+ years with Spark"]
+    assert posting.skills == ["Python", "SQL", "Airflow"]
+
+
+def test_parse_job_posting_ignores_invalid_or_incomplete_blocks() -> None:
+    html = (
+        '<script type="application/ld+json">{not json</script>'
+        + _page({"@type": "JobPosting", "title": "No company", "description": "Text"})
+    )
+
+    assert parse_job_posting(html) is None
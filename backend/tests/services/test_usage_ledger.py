@@ -0,0 +1,57 @@
+"""Tests for the SQLite LLM usage ledger."""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from core.llm_usage import UsageTracker
+from services.usage_ledger import UsageLedger
+
+
+def _tracker(cv_input: int) -> UsageTracker:
+    tracker = UsageTracker()
+    tracker.record("cv", model="gemini-2.5-flash", input_tokens=cv_input, output_tokens=100, latency_ms=900)
+    tracker.record("insights", model="gemini-2.5-flash", input_tokens=50, output_tokens=20, latency_ms=300)
+    return tracker
+
+
+def test_appended_requests_are_summarized_per_chain(tmp_path: Path) -> None:
+    ledger = UsageLedger(tmp_path / "usage.sqlite3")
+    prices = {"gemini-2.5-flash": {"input": 1.0, "output": 1.0}}
+
+    ledger.append(_tracker(1000), request_id="a", endpoint="POST /generate-materials", prices=prices)
+    ledger.append(_tracker(3000), request_id="b", endpoint="POST /generate-materials", prices=prices)
+    ledger.append(UsageTracker(), request_id="c")
+    summary = {row["chain"]: row for row in ledger.summary()}
+    ledger.close()
+
+    assert list(summary) == ["cv", "insights"]
+    assert summary["cv"]["requests"] == 2
+    assert summary["cv"]["input_tokens"] == 4000
+    assert summary["cv"]["avg_input_tokens"] == 2000
+    assert summary["cv"]["avg_latency_ms"] == 900
+    assert summary["cv"]["cost_usd"] == (4000 + 200) / 1e6
+
+
+def test_ledger_persists_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "usage.sqlite3"
+    UsageLedger(path).append(_tracker(10))
+
+    reopened = UsageLedger(path)
+    assert reopened.summary()[0]["requests"] == 1
+    reopened.close()
+
+
+def test_a_request_s_rows_are_written_atomically(tmp_path: Path) -> None:
+    ledger = UsageLedger(tmp_path / "usage.sqlite3")
+    tracker = _tracker(10)
+    tracker.chains["insights"].chain = None  # type: ignore[assignment] - violates NOT NULL on the second row
+
+    with pytest.raises(sqlite3.IntegrityError):
+        ledger.append(tracker)
+    ledger.append(_tracker(20))
+
+    assert {row["chain"]: row["input_tokens"] for row in ledger.summary()} == {"cv": 20, "insights": 50}
+    ledger.close()